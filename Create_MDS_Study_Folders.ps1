@@ -1,1927 +0,0 @@
-# PowerShell Script to create MDS folder structure with progress output
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Programming_Fundamentals\Week_16\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Web_Development\Week_16\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Database_Design\Week_16\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\UX_UI_Design\Week_16\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Project_Management\Week_16\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Networking_Security\Week_16\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Quick_Reference"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Quick_Reference"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Portfolio_Projects"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Portfolio_Projects"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Cybersecurity_Principles_CBS131_PC4774\Week_16\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Introduction_to_Cloud_Computing_CLD101_PCXXXX\Week_16\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Data_and_Networking_MIS102_PC4774\Week_16\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_01\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_02\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_03\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_04\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_05\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_06\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_07\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_08\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_09\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_10\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_11\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_12\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_13\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_14\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_15\Cheat_Sheets"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Lessons"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Lessons"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Assignments"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Assignments"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Code_Examples"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Code_Examples"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Resources"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Resources"
-Write-Output "Creating: C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Cheat_Sheets"
-New-Item -ItemType Directory -Force -Path "C:\Users\maiaw\OneDrive\문서\MDS\Algorithms_and_Data_Structures_ADS103_PC4133\Week_16\Cheat_Sheets"
\ No newline at end of file
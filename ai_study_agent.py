@@ -1,71 +1,543 @@
+import argparse
 import asyncio
+import codecs
+import hashlib
+import html
+import io
+import json
+import os
 import platform
 import re
-from collections import defaultdict
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
 import random
 
+import telemetry
+from document_export import CourseBundles, atomic_write
+from quiz_generator import (CourseTermIndex, build_term_index, cloze_quiz, course_term_index, install_term_index,
+                            term_counts)
+from search_index import SearchIndex
+from study_store import MemoryStore, open_store, store_report
+from summarizer import build_vocabulary, document_terms, install_vocabulary, rank_sentences
+
+# Batch ingestion defaults
+DEFAULT_CHUNKSIZE = 32
+# Sentences considered per quiz question; the best blanks among them are asked
+QUIZ_CANDIDATES_PER_QUESTION = 4
+LECTURE_EXTENSIONS = (".txt", ".md")
+
+# Sentence boundaries, compiled once for every lecture
+SENTENCE_END = re.compile(r'[.!?]+')
+# Read size when streaming a transcript from disk
+READ_CHUNK_SIZE = 64 * 1024
+# Longest run of text kept as one sentence when no end mark arrives
+MAX_SENTENCE_LENGTH = 4096
+
+def _split_long(text, final):
+    """Yield stripped pieces of `text` of at most MAX_SENTENCE_LENGTH, cut at spaces where possible.
+
+    Returns the unfinished rest (short enough to keep), or "" when `final`.
+    """
+    position = 0
+    while len(text) - position > MAX_SENTENCE_LENGTH:
+        cut = text.rfind(" ", position + 1, position + MAX_SENTENCE_LENGTH)
+        if cut == -1:
+            cut = position + MAX_SENTENCE_LENGTH
+        piece = text[position:cut].strip()
+        if piece:
+            yield piece
+        position = cut
+    rest = text[position:]
+    if not final:
+        return rest
+    rest = rest.strip()
+    if rest:
+        yield rest
+    return ""
+
+def iter_sentences(source):
+    """Lazily yield stripped, non-empty sentences.
+
+    `source` is a string or an iterable of text chunks (e.g. an open file), so
+    very large transcripts never have to be held as one string. Sentences
+    split across chunk boundaries are reassembled; each chunk is scanned once.
+    Sentences longer than MAX_SENTENCE_LENGTH characters (e.g. unpunctuated
+    captions) are split at spaces, the same way however the text is chunked.
+    """
+    chunks = (source,) if isinstance(source, str) else source
+    # Pieces of the unfinished sentence; they never contain an end mark, so they are not scanned again
+    tail = []
+    tail_length = 0
+    for chunk in chunks:
+        start = 0
+        for match in SENTENCE_END.finditer(chunk):
+            sentence = chunk[start:match.start()]
+            if tail:
+                tail.append(sentence)
+                sentence = "".join(tail)
+                tail = []
+                tail_length = 0
+            if len(sentence) > MAX_SENTENCE_LENGTH:
+                yield from _split_long(sentence, final=True)
+            else:
+                sentence = sentence.strip()
+                if sentence:
+                    yield sentence
+            start = match.end()
+        if start < len(chunk):
+            tail.append(chunk[start:] if start else chunk)
+            tail_length += len(chunk) - start
+        if tail_length > MAX_SENTENCE_LENGTH:
+            rest = yield from _split_long("".join(tail), final=False)
+            tail = [rest]
+            tail_length = len(rest)
+    yield from _split_long("".join(tail), final=True)
+
+class SentenceStream:
+    """Sentences of one lecture, segmented on demand and shared by several consumers.
+
+    Each sentence is split once however many consumers read it. take(n) only
+    splits as far as it needs to; all() reads the rest of the lecture.
+    """
+
+    def __init__(self, source):
+        self._sentences = iter_sentences(source)
+        self._seen = []
+
+    def take(self, n):
+        """Return the first `n` sentences (fewer if the lecture is shorter)."""
+        while len(self._seen) < n:
+            sentence = next(self._sentences, None)
+            if sentence is None:
+                break
+            self._seen.append(sentence)
+        return self._seen[:n]
+
+    def all(self):
+        """Return every sentence of the lecture."""
+        self._seen.extend(self._sentences)
+        return self._seen
+
+def _as_sentence_stream(text):
+    return text if isinstance(text, SentenceStream) else SentenceStream(text)
+
+def course_for(lecture_id):
+    """Course part of a <Course>_<Week_NN>_<name> lecture id, or None for other ids."""
+    course, sep, _ = str(lecture_id).partition("_Week_")
+    return course if sep else None
+
 # Mock NLP functions (replace with actual NLP library like spaCy or transformers if available)
-def summarize_text(text, max_sentences=5):
-    """Summarize text into concise bullet points."""
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
-    key_points = sentences[:min(max_sentences, len(sentences))]
+def summarize_text(text, max_sentences=5, course=None, lecture=None):
+    """Summarize text into concise bullet points.
+
+    Picks the most central sentences (TF-IDF + TextRank, see summarizer.py),
+    kept in lecture order. Passing `course` reuses that course's vocabulary;
+    passing `lecture` too records the text as that lecture of the course.
+    """
+    key_points = rank_sentences(_as_sentence_stream(text).all(), max_sentences, course, lecture)
+    return [f"- {point}" for point in key_points]
+
+def lead_summary(text, max_sentences=5):
+    """Summarize text as its first sentences (cheap; only reads what it returns)."""
+    key_points = _as_sentence_stream(text).take(max_sentences)
     return [f"- {point}" for point in key_points]
 
-def generate_quiz(text, num_questions=3):
-    """Generate simple multiple-choice quizzes from text."""
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
-    quiz = []
-    for i in range(min(num_questions, len(sentences))):
-        question = sentences[i]
-        correct_answer = "True"
-        wrong_answer = "False"
-        quiz.append({
-            "question": f"Is this statement true? {question}",
-            "options": [correct_answer, wrong_answer],
-            "correct": correct_answer
-        })
-    return quiz
+def generate_quiz(text, num_questions=3, course=None, lecture=None):
+    """Generate fill-in-the-blank multiple-choice quizzes from text.
+
+    Distractors come from a term index of the whole lecture, or of the whole
+    course when `course` is given (see quiz_generator.py). Passing `lecture`
+    too records the text's terms as that lecture of the course.
+    """
+    sentences = _as_sentence_stream(text)
+    candidates = sentences.take(num_questions * QUIZ_CANDIDATES_PER_QUESTION)
+    if course is None:
+        index = CourseTermIndex()
+        index.add_sentences(sentences.all())
+    else:
+        index = course_term_index(course)
+        if lecture is not None:
+            index.set_lecture(lecture, term_counts(sentences.all()))
+    return cloze_quiz(candidates, num_questions, index)
+
+def generate_course_quizzes(lectures, num_questions=3):
+    """Quiz every lecture of one course against a single term index built in one pass.
+
+    `lectures` is an iterable of (lecture_id, content) pairs. Each lecture is
+    segmented once; only its candidate sentences are kept for the second
+    pass. Returns {lecture_id: quiz}.
+    """
+    index = CourseTermIndex()
+    candidates = {}
+    for lecture_id, content in lectures:
+        sentences = SentenceStream(content)
+        candidates[lecture_id] = sentences.take(num_questions * QUIZ_CANDIDATES_PER_QUESTION)
+        index.add_sentences(sentences.all())
+    return {lecture_id: cloze_quiz(kept, num_questions, index) for lecture_id, kept in candidates.items()}
+
+def notes_and_quiz(lecture_id, sentences):
+    """Summary notes and quiz of one lecture's SentenceStream, each timed as a telemetry stage."""
+    course = course_for(lecture_id)
+    # Segmentation is lazy, so most of it is timed under the summary
+    with telemetry.span("lecture.summarize", lecture_id=lecture_id):
+        summary = summarize_text(sentences, course=course, lecture=lecture_id)
+    with telemetry.span("lecture.quiz", lecture_id=lecture_id) as span:
+        quiz = generate_quiz(sentences, course=course, lecture=lecture_id)
+        span.set(questions=len(quiz))
+    return summary, quiz
+
+@contextmanager
+def _lecture_sentences(path):
+    """SentenceStream of a transcript file, read in chunks rather than as one string."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        yield SentenceStream(iter(lambda: f.read(READ_CHUNK_SIZE), ""))
+
+def _process_chunk(chunk):
+    """Worker entry point: summarize and quiz a chunk of (lecture_id, path) pairs."""
+    results = []
+    for lecture_id, path in chunk:
+        with telemetry.span("lecture.process", lecture_id=lecture_id, batch=True):
+            with _lecture_sentences(path) as sentences:
+                results.append((lecture_id, *notes_and_quiz(lecture_id, sentences)))
+    return results
+
+def _read_transcript(path, digest):
+    """Yield a transcript's text in chunks, decoded as open() would, while feeding its bytes to `digest`."""
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+            digest.update(block)
+            yield decoder.decode(block)
+    yield decoder.decode(b"", final=True)
+
+def _survey_chunk(chunk):
+    """Worker entry point of the first pass: (lecture_id, fingerprint, statistics) for each lecture.
+
+    `chunk` holds (lecture_id, path, known signature, want statistics). A
+    file whose size and mtime equal the known signature is not read
+    (fingerprint and statistics None); any other is read once, for its hash
+    and, if wanted, its terms and term counts.
+    """
+    results = []
+    for lecture_id, path, known, want in chunk:
+        signature = stat_signature(path)
+        if known is not None and known == signature:
+            results.append((lecture_id, None, None))
+            continue
+        with telemetry.span("lecture.survey", lecture_id=lecture_id):
+            digest = hashlib.sha256()
+            text = _read_transcript(path, digest)
+            statistics = None
+            if want:
+                found = SentenceStream(text).all()
+                statistics = (document_terms(found), term_counts(found))
+            else:
+                deque(text, maxlen=0)
+        results.append((lecture_id, (digest.hexdigest(), signature), statistics))
+    return results
+
+def _run_chunks(fn, chunks, workers, initializer=None, initargs=()):
+    """Yield `fn(chunk)` for each chunk in order, on `workers` processes with at most two chunks each in flight."""
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(fn, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(fn, chunk))
+            if len(in_flight) >= workers * 2:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+def course_statistics(statistics):
+    """Per-course (vocabulary, term index) from (lecture_id, terms, term counts) triples, built in the order given."""
+    by_course = defaultdict(list)
+    for lecture_id, terms, counts in statistics:
+        by_course[course_for(lecture_id)].append((lecture_id, terms, counts))
+    return {
+        course: (build_vocabulary((lecture_id, terms) for lecture_id, terms, _ in lectures),
+                 build_term_index((lecture_id, counts) for lecture_id, _, counts in lectures))
+        for course, lectures in by_course.items()
+    }
+
+def course_hashes(fingerprints):
+    """course -> hash of its lectures' ids and contents, from (lecture_id, fingerprint) pairs.
+
+    A course's statistics depend on nothing else, so an unchanged hash means unchanged statistics.
+    """
+    by_course = defaultdict(list)
+    for lecture_id, fingerprint in fingerprints:
+        course = course_for(lecture_id)
+        if course is not None:
+            by_course[course].append(f"{lecture_id}\0{fingerprint[0]}\n")
+    return {course: hashlib.sha256("".join(sorted(entries)).encode("utf-8")).hexdigest()
+            for course, entries in by_course.items()}
+
+def _install_course_statistics(statistics):
+    """Make every course's statistics the ones this process summarizes with (also a pool initializer)."""
+    for course, (vocabulary, term_index) in statistics.items():
+        install_vocabulary(course, vocabulary)
+        install_term_index(course, term_index)
+
+def is_lecture_file(path):
+    """True for transcripts that live in a <Course>/Week_NN/Lessons folder."""
+    path = Path(path)
+    return (path.suffix.lower() in LECTURE_EXTENSIONS and path.parent.name == "Lessons"
+            and path.parent.parent.name.startswith("Week_"))
+
+def lecture_id_for(path):
+    """Lecture id for a transcript path: <Course>_<Week_NN>_<file stem>."""
+    path = Path(path)
+    course, week = path.parts[-4], path.parts[-3]
+    return f"{course}_{week}_{path.stem}"
+
+def iter_lecture_files(root):
+    """Yield (lecture_id, path) for every lecture transcript under a course/week/Lessons tree."""
+    root = Path(root)
+    for path in sorted(root.glob("*/Week_*/Lessons/*")):
+        if is_lecture_file(path) and path.is_file():
+            yield lecture_id_for(path), path
+
+def stat_signature(content):
+    """Cheap change check for files (size and mtime); None for in-memory text."""
+    if isinstance(content, os.PathLike):
+        st = os.stat(content)
+        return f"{st.st_size}:{st.st_mtime_ns}"
+    return None
+
+def hash_content(content):
+    """SHA-256 of a lecture's text, or of a transcript file's bytes read in chunks."""
+    digest = hashlib.sha256()
+    if isinstance(content, os.PathLike):
+        with open(content, "rb") as f:
+            for block in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                digest.update(block)
+    else:
+        digest.update(content.encode("utf-8"))
+    return digest.hexdigest()
 
 # Main AI Agent Workflow
 class StudyAgent:
-    def __init__(self):
-        self.notes = defaultdict(list)
-        self.quizzes = defaultdict(list)
+    def __init__(self, store=None, index=None):
+        # Any study_store backend: MemoryStore (default) or SQLiteStore for persistence
+        self.store = store if store is not None else MemoryStore()
+        # Optional search_index.SearchIndex kept up to date with every processed lecture
+        self.index = index
 
     def process_lecture(self, lecture_id, content):
-        """Process a lecture to generate notes and quiz."""
-        # Generate summary notes
-        summary = summarize_text(content)
-        self.notes[lecture_id] = summary
+        """Process a lecture to generate notes and quiz.
+
+        `content` may be a string or an iterable of text chunks such as an open file.
+        A string identical to the one already processed for `lecture_id` is not
+        recomputed. Returns True if the lecture was (re)processed.
+        """
+        with telemetry.span("lecture.process", lecture_id=lecture_id) as span:
+            fingerprint = None
+            if isinstance(content, str):
+                if span:
+                    span.set(bytes=len(content.encode("utf-8")))
+                fingerprint = (hash_content(content), None)
+                if self.store.get_fingerprint(lecture_id) == fingerprint and lecture_id in self.store:
+                    span.set(unchanged=True)
+                    return False
+
+            # Segment once; the summary and the quiz share the same sentences
+            sentences = SentenceStream(content)
+            summary, quiz = notes_and_quiz(lecture_id, sentences)
+            with telemetry.span("lecture.store", lecture_id=lecture_id):
+                self.store.put(lecture_id, summary, quiz)
+            if self.index is not None:
+                with telemetry.span("lecture.index", lecture_id=lecture_id):
+                    self.index.add_lectures([(lecture_id, summary, quiz)])
+            if fingerprint is not None:
+                self.store.set_fingerprints([(lecture_id, *fingerprint)])
+            return True
+
+    def plan_batch(self, lectures, workers=1, chunksize=DEFAULT_CHUNKSIZE, dry_run=False):
+        """Classify a batch of (lecture_id, path) pairs against the store's manifest.
+
+        Returns (plan, course hashes, statistics). `plan` lists (lecture_id,
+        path, status, fingerprint) in input order, with status "new",
+        "changed", "unchanged" or "stale": unchanged, but of a course whose
+        contents changed, so its notes and quiz were generated with course
+        statistics (IDF, quiz term index) that no longer hold. `statistics`
+        maps each lecture with a course to its (terms, term counts).
+
+        Files are surveyed on `workers` processes. One whose size and mtime
+        match the manifest is not read; any other is read once for both its
+        hash and its statistics. Files that were only touched have their
+        manifest entry refreshed (unless `dry_run`, which reads no statistics
+        and writes nothing).
+        """
+        plan = []
+        statistics = {}
+        recorded = {}
+
+        def tasks():
+            for lecture_id, path in lectures:
+                if not isinstance(path, os.PathLike):
+                    raise TypeError(f"Batch lectures are transcript paths, not {type(path).__name__} ({lecture_id})")
+                fingerprint = self.store.get_fingerprint(lecture_id) if lecture_id in self.store else None
+                recorded[lecture_id] = (path, fingerprint)
+                want = course_for(lecture_id) is not None and not dry_run
+                stored = self.store.get_statistics(lecture_id) if want and fingerprint is not None else None
+                known = fingerprint[1] if fingerprint is not None else None
+                if stored is not None and stored[0] == fingerprint[0]:
+                    statistics[lecture_id] = stored[1:]
+                elif want:
+                    # Without stored statistics the file must be read anyway
+                    known = None
+                yield lecture_id, path, known, want
+
+        chunks = iter(lambda it=tasks(): list(islice(it, chunksize)), [])
+        for results in _run_chunks(_survey_chunk, chunks, workers):
+            touched = []
+            found = []
+            for lecture_id, fingerprint, terms_and_counts in results:
+                path, previous = recorded.pop(lecture_id)
+                if fingerprint is None:
+                    plan.append((lecture_id, path, "unchanged", previous))
+                    continue
+                if terms_and_counts is not None:
+                    statistics[lecture_id] = terms_and_counts
+                    found.append((lecture_id, fingerprint[0], *terms_and_counts))
+                if previous is None:
+                    status = "new"
+                elif previous[0] != fingerprint[0]:
+                    status = "changed"
+                else:
+                    status = "unchanged"
+                    if previous != fingerprint:
+                        touched.append((lecture_id, *fingerprint))
+                plan.append((lecture_id, path, status, fingerprint))
+            if not dry_run:
+                self.store.set_statistics(found)
+                self.store.set_fingerprints(touched)
+
+        hashes = course_hashes((lecture_id, fingerprint) for lecture_id, _, _, fingerprint in plan)
+        stale = {course for course, digest in hashes.items() if self.store.get_course_hash(course) != digest}
+        plan = [
+            (lecture_id, path, "stale" if status == "unchanged" and course_for(lecture_id) in stale else status,
+             fingerprint)
+            for lecture_id, path, status, fingerprint in plan
+        ]
+        return plan, hashes, statistics
+
+    def plan_report(self, lectures, workers=None):
+        """Dry run: report which lectures would be recomputed without touching the store."""
+        report = {"new": [], "changed": [], "stale": [], "unchanged": 0}
+        plan, _, _ = self.plan_batch(lectures, workers or os.cpu_count() or 1, dry_run=True)
+        for lecture_id, _, status, _ in plan:
+            if status == "unchanged":
+                report["unchanged"] += 1
+            else:
+                report[status].append(lecture_id)
+        return report
 
-        # Generate quiz
-        quiz = generate_quiz(content)
-        self.quizzes[lecture_id] = quiz
+    def process_lectures(self, lectures, workers=None, chunksize=DEFAULT_CHUNKSIZE, progress=None,
+                         incremental=False):
+        """Process many lectures across a process pool.
+
+        `lectures` is an iterable of (lecture_id, path) pairs; workers read the
+        transcripts themselves, in chunks, so no transcript is ever held whole
+        and memory grows with the number of lectures only by their ids, paths,
+        fingerprints and term statistics. Work is sent out in chunks of
+        `chunksize`, with at most two chunks per worker in flight. Results are
+        stored in input order and `progress(done, lecture_id)` is called after
+        each lecture.
+
+        A first pass (plan_batch) hashes each file and builds each course's
+        statistics from all of its lectures, so results are the same for any
+        number of workers and any chunk size. Each file is read at most twice:
+        once in that pass (not at all if its size and mtime are unchanged and
+        its statistics are in the store) and once to summarize it.
+        With `incremental=True` only new, changed and stale lectures are
+        recomputed, so an incremental run stores the same results as a full
+        one. Either way every processed lecture's fingerprint is recorded with
+        its results, so the manifest always matches the store. Returns the
+        processed lecture ids in input order.
+        """
+        workers = workers or os.cpu_count() or 1
+        plan, hashes, found = self.plan_batch(lectures, workers, chunksize)
+        statistics = course_statistics((lecture_id, *found[lecture_id])
+                                       for lecture_id, _, _, _ in plan if lecture_id in found)
+        del found
+        # Fingerprints wait here until their lecture's results are stored
+        fingerprints = {}
+        lectures = []
+        for lecture_id, path, status, fingerprint in plan:
+            if status != "unchanged" or not incremental:
+                fingerprints[lecture_id] = fingerprint
+                lectures.append((lecture_id, path))
+        del plan
+
+        processed = []
+
+        def store(results):
+            # One write per chunk keeps disk-backed stores to a single transaction
+            with telemetry.span("lecture.store", lectures=len(results)):
+                self.store.put_many(results)
+            if self.index is not None:
+                with telemetry.span("lecture.index", lectures=len(results)):
+                    self.index.add_lectures(results)
+            self.store.set_fingerprints(
+                (lecture_id, *fingerprints.pop(lecture_id)) for lecture_id, _, _ in results if lecture_id in fingerprints
+            )
+            for lecture_id, _, _ in results:
+                processed.append(lecture_id)
+                if progress:
+                    progress(len(processed), lecture_id)
+
+        chunks = (lectures[i:i + chunksize] for i in range(0, len(lectures), chunksize))
+        for results in _run_chunks(_process_chunk, chunks, workers, _install_course_statistics, (statistics,)):
+            store(results)
+        # Only now does every lecture of each course match its course statistics
+        self.store.set_course_hashes(hashes.items())
+        return processed
 
     def get_notes(self, lecture_id):
         """Retrieve notes for a lecture."""
-        return self.notes.get(lecture_id, ["No notes available."])
+        notes = self.store.get_notes(lecture_id)
+        return ["No notes available."] if notes is None else notes
 
     def get_quiz(self, lecture_id):
         """Retrieve quiz for a lecture."""
-        return self.quizzes.get(lecture_id, ["No quiz available."])
+        quiz = self.store.get_quiz(lecture_id)
+        return ["No quiz available."] if quiz is None else quiz
 
 # HTML output for displaying results
-def format_output(lecture_id, notes, quiz):
-    """Format notes and quiz as HTML for display."""
-    html = f"<h2>Lecture {lecture_id} Summary</h2><ul>"
+def iter_output(lecture_id, notes, quiz):
+    """Yield the HTML for a lecture's notes and quiz chunk by chunk, escaping all text."""
+    lecture = html.escape(str(lecture_id))
+    yield f"<h2>Lecture {lecture} Summary</h2><ul>"
     for note in notes:
-        html += f"<li>{note}</li>"
-    html += "</ul><h2>Quiz</h2><ol>"
-    for q in quiz:
-        html += f"<li>{q['question']}<br>"
+        yield f"<li>{html.escape(note)}</li>"
+    yield "</ul><h2>Quiz</h2><ol>"
+    for number, q in enumerate(quiz, 1):
+        # One radio group per question, unique across lectures rendered on the same page
+        name = f"{lecture}-q{number}"
+        yield f"<li>{html.escape(q['question'])}<br>"
         for opt in q['options']:
-            html += f"<input type='radio' name='q{q['question'][:10]}' value='{opt}'> {opt}<br>"
-        html += f"<p>Correct Answer: {q['correct']}</p></li>"
-    html += "</ol>"
-    return html
+            option = html.escape(str(opt))
+            yield f"<input type='radio' name='{name}' value='{option}'> {option}<br>"
+        yield f"<p>Correct Answer: {html.escape(str(q['correct']))}</p></li>"
+    yield "</ol>"
+
+def write_output(lecture_id, notes, quiz, out):
+    """Stream the HTML for a lecture into a writable text stream (file, socket wrapper, StringIO)."""
+    for chunk in iter_output(lecture_id, notes, quiz):
+        out.write(chunk)
+
+def format_output(lecture_id, notes, quiz):
+    """Format notes and quiz as HTML for display."""
+    return "".join(iter_output(lecture_id, notes, quiz))
 
 # Example usage
 async def main():
@@ -89,9 +561,101 @@ async def main():
     output = format_output(lecture_id, notes, quiz)
     print(output)  # For Pyodide, this could be redirected to a DOM element
 
+def run_batch(args):
+    """Batch mode: process every lecture under a course folder tree."""
+    agent = StudyAgent(open_store(args.store), SearchIndex(args.index) if args.index else None)
+    if not args.batch:
+        # Report on an existing store without processing anything
+        print(json.dumps(store_report(agent.store)))
+        return
+    if args.dry_run:
+        plan = agent.plan_report(iter_lecture_files(args.batch), workers=args.workers)
+        for status in ("new", "changed", "stale"):
+            for lecture_id in plan[status]:
+                print(f"{status:8} {lecture_id}")
+        recompute = len(plan["new"]) + len(plan["changed"]) + len(plan["stale"])
+        print(f"Would recompute {recompute} lectures ({len(plan['new'])} new, {len(plan['changed'])} changed, "
+              f"{len(plan['stale'])} stale from a changed course); {plan['unchanged']} unchanged")
+        return
+
+    # One archive per course, each lecture added as soon as it is stored so no course is held in memory
+    bundles = CourseBundles(args.bundle, "." + args.bundle_format) if args.bundle else None
+
+    def bundle(lecture_id):
+        notes, quiz = agent.get_notes(lecture_id), agent.get_quiz(lecture_id)
+        bundles.add_text(course_for(lecture_id) or "lectures", f"{lecture_id}.html",
+                         lambda f: write_output(lecture_id, notes, quiz, f))
+
+    def report(done, lecture_id):
+        if bundles is not None:
+            bundle(lecture_id)
+        if done % args.chunksize == 0:
+            print(f"Processed {done} lectures (last: {lecture_id})", file=sys.stderr)
+
+    try:
+        lecture_ids = agent.process_lectures(
+            iter_lecture_files(args.batch), workers=args.workers, chunksize=args.chunksize, progress=report,
+            incremental=args.incremental
+        )
+        if bundles is not None and args.incremental:
+            # A rewritten (or missing) archive also needs the lectures this run skipped, from the store
+            processed = set(lecture_ids)
+            for lecture_id, _ in iter_lecture_files(args.batch):
+                course = course_for(lecture_id) or "lectures"
+                if lecture_id not in processed and lecture_id in agent.store and (
+                        course in bundles or not os.path.exists(bundles.path(course))):
+                    bundle(lecture_id)
+    except BaseException:
+        if bundles is not None:
+            bundles.abort()
+        raise
+    if bundles is not None:
+        for path in bundles.close():
+            print(f"Bundled {path}")
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        for lecture_id in lecture_ids:
+            notes, quiz = agent.get_notes(lecture_id), agent.get_quiz(lecture_id)
+            atomic_write(os.path.join(args.out, f"{lecture_id}.html"),
+                         lambda f: write_output(lecture_id, notes, quiz, f))
+    print(f"Processed {len(lecture_ids)} lectures from {args.batch}")
+    if args.report:
+        print(json.dumps(store_report(agent.store)))
+    agent.store.close()
+    if agent.index is not None:
+        agent.index.close()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate study notes and quizzes from lecture transcripts.")
+    parser.add_argument("--batch", metavar="ROOT",
+                        help="process every <Course>/Week_NN/Lessons/*.txt|*.md transcript under ROOT")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="lectures per worker task")
+    parser.add_argument("--out", metavar="DIR", help="write one HTML file per lecture into DIR")
+    parser.add_argument("--bundle", metavar="DIR",
+                        help="also write one archive per course into DIR, built as lectures finish")
+    parser.add_argument("--bundle-format", choices=("zip", "tar", "tar.gz"), default="zip",
+                        help="archive type for --bundle (default: zip)")
+    parser.add_argument("--store", default="memory", metavar="SPEC",
+                        help="where notes and quizzes are kept: 'memory' (default) or 'sqlite:PATH'")
+    parser.add_argument("--index", metavar="PATH",
+                        help="also add processed notes and quizzes to this search index (see search_index.py)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only recompute lectures that are new or changed since the last run, and the other "
+                             "lectures of their courses (use with a sqlite store)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="with --batch, list the lectures an incremental run would recompute and exit")
+    parser.add_argument("--report", action="store_true",
+                        help="print lookup latency and memory use of the store")
+    return parser.parse_args(argv)
+
 # Run the agent
 if platform.system() == "Emscripten":
     asyncio.ensure_future(main())
 else:
     if __name__ == "__main__":
-        asyncio.run(main())
\ No newline at end of file
+        args = parse_args()
+        if args.batch or args.report:
+            run_batch(args)
+        else:
+            asyncio.run(main())
\ No newline at end of file
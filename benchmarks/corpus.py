@@ -0,0 +1,32 @@
+"""Synthetic lecture transcripts for the benchmarks."""
+import random
+
+VOCABULARY = (
+    "algorithm array binary cloud compiler container data database encryption firewall "
+    "function hash heap interface kernel latency loop memory network packet pointer "
+    "protocol python queue recursion router server stack storage subnet thread variable"
+).split()
+
+SIZES = {
+    "1KB": 1024,
+    "100KB": 100 * 1024,
+    "1MB": 1024 * 1024,
+    "10MB": 10 * 1024 * 1024,
+    "50MB": 50 * 1024 * 1024,
+}
+
+# Larger lectures repeat a block of this size instead of generating every sentence
+BLOCK_BYTES = 1024 * 1024
+
+def make_lecture(size_bytes, seed=0):
+    """Return a deterministic lecture of exactly `size_bytes` characters."""
+    rng = random.Random(seed)
+    sentences = []
+    total = 0
+    while total < min(size_bytes, BLOCK_BYTES):
+        words = rng.choices(VOCABULARY, k=rng.randint(6, 18))
+        sentence = " ".join(words).capitalize() + rng.choice((". ", "! ", "? ", ". ", ". "))
+        sentences.append(sentence)
+        total += len(sentence)
+    block = "".join(sentences)
+    return (block * (size_bytes // len(block) + 1))[:size_bytes]
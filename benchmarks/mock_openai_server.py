@@ -0,0 +1,163 @@
+"""Local OpenAI-compatible chat completions server with configurable latency and failures.
+
+Run standalone:
+    python -m benchmarks.mock_openai_server --port 8765 --latency 0.8 --jitter 0.2
+    python -m benchmarks.mock_openai_server --rate-limit-rate 0.3 --retry-after 0.2
+
+then point the apps or benchmarks at it with OPENAI_BASE_URL=http://127.0.0.1:8765/v1.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+WORDS = ("Great work today. Variables store data and loops repeat tasks. "
+         "Take a short break, then try the next exercise. ").split()
+
+class MockConfig:
+    def __init__(self, latency=0.5, jitter=0.1, tokens_per_second=150.0, completion_tokens=300, seed=None,
+                 prefill_seconds_per_token=0.0, rate_limit_rate=0.0, server_error_rate=0.0, retry_after=None):
+        self.latency = latency
+        # Extra time to first token per prompt token, like a real model's prefill
+        self.prefill_seconds_per_token = prefill_seconds_per_token
+        self.jitter = jitter
+        self.tokens_per_second = tokens_per_second
+        self.completion_tokens = completion_tokens
+        # Share of requests answered with a 429 or a 500 instead of a completion
+        self.rate_limit_rate = rate_limit_rate
+        self.server_error_rate = server_error_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+        self.server_errors = 0
+        self.connections = set()
+
+    def first_token_delay(self, prompt_tokens=0):
+        with self.lock:
+            jittered = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+        return jittered + prompt_tokens * self.prefill_seconds_per_token
+
+    def injected_failure(self):
+        """Return 429, 500 or None for the next request, counting what was injected."""
+        with self.lock:
+            roll = self.random.random()
+            if roll < self.rate_limit_rate:
+                self.rate_limited += 1
+                return 429
+            if roll < self.rate_limit_rate + self.server_error_rate:
+                self.server_errors += 1
+                return 500
+            return None
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = None
+
+    def log_message(self, *args):
+        pass
+
+    def handle_one_request(self):
+        # Clients drop idle keep-alive connections whenever they like; that's not an error here
+        try:
+            super().handle_one_request()
+        except (ConnectionResetError, BrokenPipeError):
+            self.close_connection = True
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        with self.config.lock:
+            self.config.requests += 1
+            self.config.connections.add(self.client_address)
+        failure = self.config.injected_failure()
+        if failure == 429:
+            headers = [("Retry-After", str(self.config.retry_after))] if self.config.retry_after is not None else []
+            self._send_json(429, {"error": {"message": "Rate limit reached (mock)", "type": "requests",
+                                            "code": "rate_limit_exceeded"}}, headers)
+            return
+        if failure == 500:
+            self._send_json(500, {"error": {"message": "The server had an error (mock)", "type": "server_error"}})
+            return
+        n_tokens = min(body.get("max_tokens") or self.config.completion_tokens, self.config.completion_tokens)
+        tokens = [WORDS[i % len(WORDS)] + " " for i in range(n_tokens)]
+        prompt_tokens = sum(len(m.get("content", "")) for m in body.get("messages", [])) // 4
+        time.sleep(self.config.first_token_delay(prompt_tokens))
+        if body.get("stream"):
+            self._stream(body, tokens)
+        else:
+            time.sleep(len(tokens) / self.config.tokens_per_second)
+            self._send_json(200, {
+                "id": "chatcmpl-mock", "object": "chat.completion", "created": int(time.time()),
+                "model": body.get("model", "mock"),
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "".join(tokens)}}],
+                "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(tokens),
+                          "total_tokens": prompt_tokens + len(tokens)},
+            })
+
+    def _send_json(self, status, payload, headers=()):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, body, tokens):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        interval = 1.0 / self.config.tokens_per_second
+        for token in tokens:
+            self._write_event({
+                "id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": body.get("model", "mock"),
+                "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+            })
+            time.sleep(interval)
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+    def _write_event(self, payload):
+        self._write_chunk(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+def start_server(config=None, host="127.0.0.1", port=0):
+    """Start the mock server on a background thread; returns (server, base_url)."""
+    handler = type("BoundMockHandler", (MockHandler,), {"config": config or MockConfig()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/v1"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds before the first token")
+    parser.add_argument("--jitter", type=float, default=0.1, help="+/- seconds added to the latency")
+    parser.add_argument("--tokens-per-second", type=float, default=150.0)
+    parser.add_argument("--completion-tokens", type=int, default=300)
+    parser.add_argument("--prefill", type=float, default=0.0, help="extra seconds to first token per prompt token")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--server-error-rate", type=float, default=0.0, help="share of requests answered with 500")
+    parser.add_argument("--retry-after", type=float, default=None, help="Retry-After seconds sent with each 429")
+    args = parser.parse_args(argv)
+    config = MockConfig(args.latency, args.jitter, args.tokens_per_second, args.completion_tokens,
+                        prefill_seconds_per_token=args.prefill, rate_limit_rate=args.rate_limit_rate,
+                        server_error_rate=args.server_error_rate, retry_after=args.retry_after)
+    handler = type("BoundMockHandler", (MockHandler,), {"config": config})
+    print(f"Mock OpenAI server on http://{args.host}:{args.port}/v1")
+    ThreadingHTTPServer((args.host, args.port), handler).serve_forever()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,519 @@
+"""Benchmarks for the study pipeline and the four-agent faculty dispatch.
+
+Run from the repository root:
+    python -m benchmarks.run_benchmarks --out results.json
+    python -m benchmarks.run_benchmarks --quick --compare results.json
+
+Pipeline benchmarks time summarize_text (and the old lead_summary it
+replaced), generate_quiz, format_output and StudyAgent.process_lecture on
+synthetic lectures from 1 KB to 50 MB. Dispatch
+benchmarks run the four faculty requests against a local mock
+OpenAI-compatible server, both concurrently and one after another, and with
+--apps also click "Deploy" in the Streamlit apps end to end. A course-batch
+quiz benchmark reports questions per second. Search benchmarks index
+synthetic notes and time BM25 queries against search_index.SearchIndex.
+Prompt benchmarks compare the old per-agent prompts with the shared-prefix
+ones from faculty_prompts, with and without a token budget: input tokens,
+time to first token and deploy time against a mock with a prefill cost.
+Scheduler benchmarks send several students' identical deploys at once to a
+mock that answers some requests with 429, with and without request_scheduler.
+Telemetry benchmarks time spans, and process_lecture, with telemetry off and on.
+Export benchmarks bundle a course's rendered lectures into zip and tar.gz
+archives entry by entry, against building every page in memory first.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_study_agent import (DEFAULT_CHUNKSIZE, StudyAgent, format_output, generate_course_quizzes, generate_quiz,
+                            lead_summary, summarize_text, write_output)
+from benchmarks.corpus import SIZES, make_lecture
+from benchmarks.legacy_prompts import legacy_messages
+from benchmarks.mock_openai_server import MockConfig, start_server
+from document_export import Bundle
+from faculty_dispatch import DispatchDelta, dispatch_streaming
+from faculty_prompts import PREFILL_SECONDS_PER_TOKEN, assemble_prompts, count_tokens
+from openai_clients import get_openai_client, stream_chat_completion
+from request_scheduler import RequestScheduler
+from search_index import SearchIndex
+import telemetry
+
+QUICK_SIZES = ("1KB", "100KB", "1MB")
+SEARCH_QUERIES = ("python", "data", "variables loops", "recursion stack memory", "net*", "xyzzy")
+FACULTY = ("Professor", "Academic_Advisor", "Research_Librarian", "Teaching_Assistant")
+APPS = ("simple_teaching_agents.py", "teaching_agent_teams.py")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(p * len(sorted_values)))]
+
+def summarize(timings, work=None, unit=None, peak_bytes=None, extra=None):
+    """Turn raw timings (seconds) into the result record saved to JSON."""
+    timings = sorted(timings)
+    mean = statistics.fmean(timings)
+    result = {
+        "runs": len(timings),
+        "mean_ms": round(mean * 1000, 3),
+        "p50_ms": round(percentile(timings, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(timings, 0.99) * 1000, 3),
+    }
+    if work is not None:
+        result["throughput"] = round(work / mean, 3) if mean else None
+        result["throughput_unit"] = unit
+    if peak_bytes is not None:
+        result["peak_mem_bytes"] = peak_bytes
+    if extra:
+        result.update(extra)
+    return result
+
+def run_timed(fn, repeats, budget):
+    """Call `fn` up to `repeats` times (at least once) within `budget` seconds."""
+    timings = []
+    deadline = time.perf_counter() + budget
+    while len(timings) < repeats and (not timings or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def peak_memory(fn):
+    """Peak Python heap allocated while running `fn` once."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_pipeline(sizes, repeats, budget):
+    results = {}
+    for label in sizes:
+        text = make_lecture(SIZES[label])
+        notes = summarize_text(text)
+        quiz = generate_quiz(text)
+        megabytes = len(text) / (1024 * 1024)
+        cases = {
+            "summarize_text": lambda: summarize_text(text),
+            # The previous first-N-sentences summary, for comparison
+            "lead_summary": lambda: lead_summary(text),
+            "generate_quiz": lambda: generate_quiz(text),
+            "format_output": lambda: format_output("BENCH_Lecture", notes, quiz),
+            # A fresh agent each time so unchanged-content skipping doesn't kick in
+            "process_lecture": lambda: StudyAgent().process_lecture("BENCH_Lecture", text),
+        }
+        for name, fn in cases.items():
+            key = f"pipeline/{name}/{label}"
+            timings = run_timed(fn, repeats, budget)
+            results[key] = summarize(timings, megabytes, "MB/s", peak_memory(fn))
+            print(f"{key:45} p50 {results[key]['p50_ms']:>10.3f} ms", file=sys.stderr)
+    return results
+
+def bench_telemetry(repeats, spans=100000):
+    """Cost of telemetry spans while off and on, alone and around StudyAgent.process_lecture."""
+    results = {}
+    lectures = [(f"BENCH_Week_01_Lecture_{i}", make_lecture(SIZES["1KB"] * 10, seed=i)) for i in range(200)]
+    for label in ("off", "on"):
+        if label == "on":
+            telemetry.enable(path=None)
+        try:
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                for _ in range(spans):
+                    with telemetry.span("bench", n=1):
+                        pass
+                timings.append(time.perf_counter() - start)
+            key = f"telemetry/span/{label}"
+            results[key] = summarize(timings, spans, "spans/s", extra={
+                "ns_per_span": round(statistics.fmean(timings) / spans * 1e9, 1),
+            })
+            timings = []
+            for _ in range(repeats):
+                agent = StudyAgent()
+                start = time.perf_counter()
+                for lecture_id, content in lectures:
+                    agent.process_lecture(lecture_id, content)
+                timings.append(time.perf_counter() - start)
+            results[f"telemetry/process_lecture/{label}"] = summarize(timings, len(lectures), "lectures/s")
+        finally:
+            telemetry.disable()
+        for key in (f"telemetry/span/{label}", f"telemetry/process_lecture/{label}"):
+            print(f"{key:45} p50 {results[key]['p50_ms']:>10.3f} ms", file=sys.stderr)
+    return results
+
+def bench_export(n_lectures, repeats, budget):
+    """Bundle a course's lecture pages: streamed entry by entry vs rendered in memory and then zipped."""
+    agent = StudyAgent()
+    lecture_ids = [f"BENCH_Week_{i % 16 + 1:02d}_Lecture_{i}" for i in range(n_lectures)]
+    for i, lecture_id in enumerate(lecture_ids):
+        agent.process_lecture(lecture_id, make_lecture(SIZES["100KB"], seed=i))
+    pages = [(lecture_id, agent.get_notes(lecture_id), agent.get_quiz(lecture_id)) for lecture_id in lecture_ids]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        def streamed(suffix):
+            def run():
+                with Bundle(os.path.join(directory, "course" + suffix)) as bundle:
+                    for lecture_id, notes, quiz in pages:
+                        bundle.add_text(f"{lecture_id}.html",
+                                        lambda f, page=(lecture_id, notes, quiz): write_output(*page, f))
+            return run
+
+        def in_memory():
+            rendered = {f"{lecture_id}.html": format_output(lecture_id, notes, quiz) for lecture_id, notes, quiz in pages}
+            with zipfile.ZipFile(os.path.join(directory, "memory.zip"), "w", zipfile.ZIP_DEFLATED) as archive:
+                for arcname, text in rendered.items():
+                    archive.writestr(arcname, text)
+
+        for label, fn in (("zip", streamed(".zip")), ("tar.gz", streamed(".tar.gz")), ("in_memory_zip", in_memory)):
+            key = f"export/{label}/{n_lectures}"
+            results[key] = summarize(run_timed(fn, repeats, budget), n_lectures, "lectures/s",
+                                     peak_bytes=peak_memory(fn))
+            print(f"{key:45} p50 {results[key]['p50_ms']:>10.3f} ms  peak {results[key]['peak_mem_bytes']:>11} B",
+                  file=sys.stderr)
+    return results
+
+def bench_course_quizzes(n_lectures, repeats, budget):
+    """Quiz a whole synthetic course in one batch; reports questions per second."""
+    lectures = [(f"BENCH_Week_{i % 16 + 1:02d}_Lecture_{i}", make_lecture(SIZES["1KB"] * 10, seed=i))
+                for i in range(n_lectures)]
+    questions = sum(len(quiz) for quiz in generate_course_quizzes(lectures, 5).values())
+    key = f"quiz/course_batch/{n_lectures}"
+    timings = run_timed(lambda: generate_course_quizzes(lectures, 5), repeats, budget)
+    result = summarize(timings, questions, "questions/s")
+    print(f"{key:45} p50 {result['p50_ms']:>10.3f} ms", file=sys.stderr)
+    return {key: result}
+
+def bench_search(n_documents, repeats):
+    """Index `n_documents` synthetic notes documents, then time queries against the index."""
+    words = make_lecture(SIZES["1MB"]).split()
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        index = SearchIndex(os.path.join(workdir, "search.sqlite3"))
+        batch = []
+        start = time.perf_counter()
+        for i in range(n_documents):
+            offset = (i * 7919) % (len(words) - 300)
+            batch.append((f"notes:BENCH_{i}", "notes", f"Course_{i % 10}_Week_{i % 16:02d}_Lecture_{i}",
+                          " ".join(words[offset:offset + 50 + i % 250]), None))
+            if len(batch) == DEFAULT_CHUNKSIZE * 2:
+                index.add_many(batch)
+                batch = []
+        index.add_many(batch)
+        key = f"search/index/{n_documents}"
+        results[key] = summarize([time.perf_counter() - start], n_documents, "docs/s")
+        print(f"{key:45} p50 {results[key]['p50_ms']:>10.3f} ms", file=sys.stderr)
+        timings = []
+        for _ in range(repeats):
+            for query in SEARCH_QUERIES:
+                start = time.perf_counter()
+                index.search(query)
+                timings.append(time.perf_counter() - start)
+        key = f"search/query/{n_documents}"
+        results[key] = summarize(timings, 1, "queries/s")
+        print(f"{key:45} p50 {results[key]['p50_ms']:>10.3f} ms", file=sys.stderr)
+        index.close()
+    return results
+
+def faculty_jobs(base_url, messages=None, max_tokens=1500):
+    """Four streaming chat requests, shaped like the ones the apps send.
+
+    `messages` maps each agent to its chat messages; by default a one-line prompt.
+    """
+    def make_job(agent_name):
+        def stream():
+            client = get_openai_client("sk-bench", base_url)
+            response = stream_chat_completion(
+                client,
+                model="gpt-4o-mini",
+                messages=messages[agent_name] if messages else [
+                    {"role": "user", "content": f"{agent_name}: Python basics"}
+                ],
+                max_tokens=max_tokens,
+                temperature=0.7
+            )
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        return stream
+    return {agent_name: make_job(agent_name) for agent_name in FACULTY}
+
+def prompt_variants(topic, token_budget):
+    """(label, messages per agent, max_tokens) for the legacy prompts and the assembled ones."""
+    variants = [("legacy", {name: legacy_messages(name, topic) for name in FACULTY}, 1500)]
+    for label, budget in (("assembled", None), ("budget", token_budget)):
+        plan = assemble_prompts(topic, FACULTY, max_total_tokens=budget)
+        messages = {name: [{"role": "system", "content": plan.system}, {"role": "user", "content": prompt}]
+                    for name, prompt in plan.prompts.items()}
+        variants.append((label, messages, plan.max_tokens))
+    return variants
+
+def timed_deploy(jobs, concurrency):
+    """Run one deploy; returns (total seconds, seconds to the first streamed token)."""
+    start = time.perf_counter()
+    ttft = None
+    for event in dispatch_streaming(jobs, max_concurrency=concurrency):
+        if ttft is None and isinstance(event, DispatchDelta):
+            ttft = time.perf_counter() - start
+        if not isinstance(event, DispatchDelta) and event.error:
+            raise RuntimeError(f"{event.agent_name}: {event.error}")
+    return time.perf_counter() - start, ttft or 0.0
+
+def bench_prompts(config, repeats, token_budget):
+    """Legacy vs assembled vs budgeted faculty prompts: input tokens, time to first token and deploy time."""
+    server, base_url = start_server(config)
+    results = {}
+    try:
+        for label, messages, max_tokens in prompt_variants("Python basics", token_budget):
+            input_tokens = sum(count_tokens(m["content"]) for agent in messages.values() for m in agent)
+            timings = []
+            first_token = []
+            for _ in range(repeats):
+                elapsed, ttft = timed_deploy(faculty_jobs(base_url, messages, max_tokens), len(FACULTY))
+                timings.append(elapsed)
+                first_token.append(ttft)
+            first_token.sort()
+            key = f"prompts/{label}"
+            results[key] = summarize(timings, 1, "deploys/s", extra={
+                "input_tokens": input_tokens,
+                "max_tokens": max_tokens,
+                "ttft_p50_ms": round(percentile(first_token, 0.5) * 1000, 3),
+            })
+            print(f"{key:45} p50 {results[key]['p50_ms']:>10.3f} ms  {input_tokens} input tokens  "
+                  f"ttft {results[key]['ttft_p50_ms']:.1f} ms", file=sys.stderr)
+    finally:
+        server.shutdown()
+    return results
+
+def bench_dispatch(config, repeats):
+    server, base_url = start_server(config)
+    results = {}
+    try:
+        for label, concurrency in (("concurrent", len(FACULTY)), ("sequential", 1)):
+            timings = []
+            first_token = []
+            connections_before = len(config.connections)
+            for _ in range(repeats):
+                elapsed, ttft = timed_deploy(faculty_jobs(base_url), concurrency)
+                timings.append(elapsed)
+                first_token.append(ttft)
+            key = f"dispatch/{label}"
+            first_token.sort()
+            results[key] = summarize(timings, 1, "deploys/s", extra={
+                "ttft_p50_ms": round(percentile(first_token, 0.5) * 1000, 3),
+                "new_connections": len(config.connections) - connections_before,
+            })
+            print(f"{key:45} p50 {results[key]['p50_ms']:>10.3f} ms", file=sys.stderr)
+    finally:
+        server.shutdown()
+    return results
+
+def bench_scheduler(config, repeats, students):
+    """`students` deploy the same topic at once against a server that injects 429s.
+
+    "direct" sends every request once with no retries; "scheduled" goes through
+    a RequestScheduler, which retries the 429s and coalesces the identical requests.
+    """
+    server, base_url = start_server(config)
+    results = {}
+    try:
+        for label in ("direct", "scheduled"):
+            timings = []
+            failures = 0
+            requests_before = config.requests
+            for _ in range(repeats):
+                scheduler = RequestScheduler(base_delay=0.05, max_delay=1.0, seed=0)
+                jobs = faculty_jobs(base_url)
+                if label == "scheduled":
+                    jobs = {name: (lambda name=name, job=job: scheduler.stream(name, job, 100))
+                            for name, job in jobs.items()}
+                outcomes = []
+
+                def deploy():
+                    outcomes.extend(event.error for event in dispatch_streaming(jobs)
+                                    if not isinstance(event, DispatchDelta))
+
+                start = time.perf_counter()
+                threads = [threading.Thread(target=deploy) for _ in range(students)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                timings.append(time.perf_counter() - start)
+                failures += sum(error is not None for error in outcomes)
+            key = f"scheduler/{label}/{students}"
+            answers = repeats * students * len(FACULTY)
+            results[key] = summarize(timings, 1, "bursts/s", extra={
+                "failed_answers": failures,
+                "success_rate": round(1 - failures / answers, 3),
+                "upstream_requests": config.requests - requests_before,
+            })
+            print(f"{key:45} p50 {results[key]['p50_ms']:>10.3f} ms  {failures}/{answers} answers failed  "
+                  f"{results[key]['upstream_requests']} upstream requests", file=sys.stderr)
+    finally:
+        server.shutdown()
+    return results
+
+def bench_apps(config, repeats):
+    """Click "Deploy" in each Streamlit app (via AppTest) against the mock server."""
+    from streamlit.testing.v1 import AppTest
+
+    server, base_url = start_server(config)
+    previous = {name: os.environ.get(name) for name in ("OPENAI_BASE_URL", "OPENAI_API_KEY")}
+    os.environ["OPENAI_BASE_URL"] = base_url
+    results = {}
+    cwd = os.getcwd()
+    try:
+        for app in APPS:
+            key = f"app/{app[:-3]}"
+            # Fresh working directory: no cached answers and no stray report files
+            with tempfile.TemporaryDirectory() as workdir:
+                os.chdir(workdir)
+                try:
+                    at = AppTest.from_file(os.path.join(REPO_ROOT, app), default_timeout=120)
+                    at.run()
+                    if at.exception:
+                        raise RuntimeError(at.exception[0].message)
+                    at.sidebar.text_input[0].input("sk-bench").run()
+                    at.text_input[0].input("Python basics").run()
+                    for checkbox in at.sidebar.checkbox:
+                        if "Regenerate" in checkbox.label:
+                            checkbox.check().run()
+                    timings = []
+                    for _ in range(repeats):
+                        start = time.perf_counter()
+                        at.button[0].click().run()
+                        timings.append(time.perf_counter() - start)
+                        if at.exception:
+                            raise RuntimeError(at.exception[0].message)
+                    results[key] = summarize(timings, 1, "deploys/s")
+                    print(f"{key:45} p50 {results[key]['p50_ms']:>10.3f} ms", file=sys.stderr)
+                except Exception as e:
+                    results[key] = {"skipped": str(e)}
+                    print(f"{key:45} skipped: {e}", file=sys.stderr)
+                finally:
+                    os.chdir(cwd)
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        server.shutdown()
+    return results
+
+def compare(baseline_path, results, threshold):
+    """Print p50 and peak memory changes against a saved run; return True if anything regressed."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressed = False
+    for key, current in results.items():
+        before = baseline.get(key)
+        if not before or "p50_ms" not in before or "p50_ms" not in current:
+            continue
+        for metric in ("p50_ms", "p95_ms", "peak_mem_bytes"):
+            if metric not in before or not before[metric]:
+                continue
+            change = (current[metric] - before[metric]) / before[metric]
+            flag = "REGRESSION" if change > threshold else ""
+            regressed = regressed or bool(flag)
+            print(f"{key:45} {metric:15} {before[metric]:>14} -> {current[metric]:>14} ({change:+.1%}) {flag}")
+    return regressed
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the study pipeline and the faculty dispatch path.")
+    parser.add_argument("--quick", action="store_true", help="only 1KB-1MB lectures and fewer repeats")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), help="lecture sizes to benchmark")
+    parser.add_argument("--repeats", type=int, default=None, help="runs per case (default 20, quick 5)")
+    parser.add_argument("--budget", type=float, default=5.0, help="max seconds spent per pipeline case")
+    parser.add_argument("--skip-pipeline", action="store_true")
+    parser.add_argument("--skip-dispatch", action="store_true")
+    parser.add_argument("--skip-search", action="store_true")
+    parser.add_argument("--skip-prompts", action="store_true")
+    parser.add_argument("--skip-scheduler", action="store_true")
+    parser.add_argument("--skip-telemetry", action="store_true")
+    parser.add_argument("--skip-export", action="store_true")
+    parser.add_argument("--students", type=int, default=8, help="simultaneous deploys in the scheduler benchmark")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.3,
+                        help="share of requests the mock answers with 429 in the scheduler benchmark")
+    parser.add_argument("--prompt-budget", type=int, default=2000,
+                        help="max_total_tokens for the budgeted faculty prompts")
+    parser.add_argument("--search-documents", type=int, default=None,
+                        help="documents in the search benchmark index (default 20000, quick 2000)")
+    parser.add_argument("--apps", action="store_true", help="also deploy through the Streamlit apps via AppTest")
+    parser.add_argument("--latency", type=float, default=0.5, help="mock server time to first token (s)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="mock server latency jitter (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=400.0)
+    parser.add_argument("--completion-tokens", type=int, default=200)
+    parser.add_argument("--out", help="save results as JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against a saved JSON run")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown counted as a regression")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    repeats = args.repeats or (5 if args.quick else 20)
+    sizes = args.sizes or (QUICK_SIZES if args.quick else tuple(SIZES))
+
+    def mock_config():
+        return MockConfig(args.latency, args.jitter, args.tokens_per_second, args.completion_tokens, seed=0)
+
+    results = {}
+    if not args.skip_pipeline:
+        results.update(bench_pipeline(sizes, repeats, args.budget))
+        results.update(bench_course_quizzes(50 if args.quick else 200, repeats, args.budget))
+    if not args.skip_telemetry:
+        results.update(bench_telemetry(max(1, repeats // 4)))
+    if not args.skip_export:
+        results.update(bench_export(20 if args.quick else 100, max(1, repeats // 4), args.budget))
+    if not args.skip_search:
+        results.update(bench_search(args.search_documents or (2000 if args.quick else 20000), repeats))
+    if not args.skip_dispatch:
+        results.update(bench_dispatch(mock_config(), max(1, repeats // 4)))
+    if not args.skip_prompts:
+        # Long answers and a prefill cost, so both the input and output savings show up
+        config = MockConfig(args.latency, args.jitter, args.tokens_per_second, 3 * args.completion_tokens,
+                            seed=0, prefill_seconds_per_token=PREFILL_SECONDS_PER_TOKEN)
+        results.update(bench_prompts(config, max(1, repeats // 4), args.prompt_budget))
+    if not args.skip_scheduler:
+        config = MockConfig(args.latency, args.jitter, args.tokens_per_second, args.completion_tokens,
+                            seed=0, rate_limit_rate=args.rate_limit_rate, retry_after=0.1)
+        results.update(bench_scheduler(config, max(1, repeats // 4), args.students))
+    if args.apps:
+        results.update(bench_apps(mock_config(), max(1, repeats // 4)))
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "mock_server": {"latency": args.latency, "jitter": args.jitter,
+                            "tokens_per_second": args.tokens_per_second,
+                            "completion_tokens": args.completion_tokens},
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved {len(results)} results to {args.out}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare and compare(args.compare, results, args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Per-course statistics shared by the summarizer and the quiz generator.
+
+Both keep course-wide numbers (document frequencies, term counts) that are
+the sum of one part per lecture. LectureStatistics keys those parts by
+lecture, so reprocessing a lecture replaces its part instead of adding it
+again. Batch runs build every course's statistics up front (see
+StudyAgent.process_lectures), so results don't depend on the processing order
+or on the number of workers.
+
+A CourseRegistry is the per-process cache of one such object per course.
+"""
+import threading
+from collections import OrderedDict
+
+# Courses kept per registry, least recently used dropped first
+MAX_COURSES = 64
+
+class LectureStatistics:
+    """Course statistics made of one part per lecture; subclasses implement _apply(part, sign).
+
+    A pickled instance (as sent to batch workers) is a frozen snapshot: it
+    keeps the totals but not the per-lecture parts, and ignores set_lecture().
+    """
+
+    def __init__(self):
+        # lecture -> its part; None once frozen
+        self.lectures = {}
+        # Re-entrant, so subclasses can record a lecture while holding it
+        self.lock = threading.RLock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["lock"]
+        state["lectures"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+
+    def _apply(self, part, sign):
+        raise NotImplementedError
+
+    def set_lecture(self, lecture, part):
+        """Record `lecture`'s part, replacing whatever was recorded for it before."""
+        with self.lock:
+            if self.lectures is None:
+                return
+            previous = self.lectures.get(lecture)
+            if previous is not None:
+                self._apply(previous, -1)
+            self.lectures[lecture] = part
+            self._apply(part, 1)
+
+class CourseRegistry:
+    """One statistics object per course, created by `factory` on first use (thread-safe)."""
+
+    def __init__(self, factory, max_courses=MAX_COURSES):
+        self.factory = factory
+        self.max_courses = max_courses
+        self._courses = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _keep(self, course, value):
+        self._courses[course] = value
+        self._courses.move_to_end(course)
+        while len(self._courses) > self.max_courses:
+            self._courses.popitem(last=False)
+        return value
+
+    def get(self, course):
+        """Return the statistics for a course (created on first use)."""
+        with self._lock:
+            value = self._courses.get(course)
+            return self._keep(course, self.factory() if value is None else value)
+
+    def install(self, course, value):
+        """Replace the statistics for a course, e.g. with ones built from the whole course up front."""
+        with self._lock:
+            self._keep(course, value)
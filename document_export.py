@@ -0,0 +1,269 @@
+"""Background report writes and incrementally built zip/tar bundles.
+
+A DocumentWriter owns one background thread. Reports handed to it are
+written to a temporary file beside their destination and renamed into place
+(atomic_write), so a deploy never waits on the disk and nobody ever reads a
+half-written file. Jobs run in submission order, and the queue is bounded so
+a slow disk pushes back instead of piling up memory.
+
+A Bundle is a .zip, .tar, .tar.gz or .tgz archive built one entry at a time.
+Rendered entries are streamed into the archive; files are copied from disk.
+So an archive of a whole course never holds more than one entry in memory.
+CourseBundles keeps one bundle per course for batch runs.
+
+Names built from user input (topics, agent names) go through safe_name and
+export_path, so a topic like "TCP/IP" or "../x" can never write outside the
+export directory. prune() keeps that directory to a fixed number of files.
+"""
+import atexit
+import datetime
+import os
+import queue
+import re
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import Future
+
+DEFAULT_EXPORT_DIR = os.environ.get("MDSIT_EXPORT_DIR", os.path.join(".faculty_cache", "exports"))
+DEFAULT_MAX_PENDING = 64
+# Files kept in an export directory by prune(), oldest removed first
+DEFAULT_KEEP_EXPORTS = int(os.environ.get("MDSIT_KEEP_EXPORTS", 200))
+# Tar needs each entry's size up front: rendered entries stay in memory up to this size, then spill to disk
+SPOOL_BYTES = 1 << 20
+BUNDLE_MODES = ((".tar.gz", "w:gz"), (".tgz", "w:gz"), (".tar", "w"), (".zip", "zip"))
+FILE_MODE = 0o644
+
+def safe_name(text):
+    """`text` as one file name component: no path separators, no leading dots."""
+    return re.sub(r"(?:[^\w.-]|\.{2,})+", "_", text).strip("._") or "untitled"
+
+def report_filename(agent_name, topic, suffix=".md"):
+    """File name for an agent's report (or a bundle) on `topic`, saved now"""
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{safe_name(agent_name)}_{safe_name(topic)}_{timestamp}{suffix}"
+
+def export_path(directory, filename):
+    """`filename` inside `directory`; raises ValueError if it would resolve anywhere else."""
+    root = os.path.realpath(directory)
+    path = os.path.realpath(os.path.join(root, filename))
+    if path == root or os.path.commonpath([root, path]) != root:
+        raise ValueError(f"{filename!r} is outside {directory}")
+    return path
+
+def prune(directory, keep=DEFAULT_KEEP_EXPORTS):
+    """Delete all but the `keep` newest files in `directory`; returns the deleted paths."""
+    try:
+        entries = [entry for entry in os.scandir(directory) if entry.is_file() and not entry.name.endswith(".tmp")]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    removed = []
+    for entry in entries[keep:]:
+        try:
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            continue
+        removed.append(entry.path)
+    return removed
+
+def _temp_beside(path):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    return tempfile.mkstemp(dir=directory, prefix=os.path.basename(path), suffix=".tmp")
+
+def atomic_write(path, write):
+    """Call `write(f)` on a temporary text file beside `path`, then rename it into place; returns `path`."""
+    path = os.fspath(path)
+    fd, tmp = _temp_beside(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            write(f)
+        os.chmod(tmp, FILE_MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+class _Utf8Writer:
+    """Text-to-bytes adapter, so a text renderer can write straight into an archive entry."""
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def write(self, text):
+        return self.raw.write(text.encode("utf-8"))
+
+def bundle_mode(path):
+    for suffix, mode in BUNDLE_MODES:
+        if path.endswith(suffix):
+            return mode
+    raise ValueError(f"Unsupported bundle type: {path} (use .zip, .tar, .tar.gz or .tgz)")
+
+class Bundle:
+    """A zip or tar archive written entry by entry and renamed into place on close().
+
+    Used as a context manager, an exception discards the partial archive.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self.mode = bundle_mode(self.path)
+        fd, self._tmp = _temp_beside(self.path)
+        os.close(fd)
+        if self.mode == "zip":
+            self._archive = zipfile.ZipFile(self._tmp, "w", zipfile.ZIP_DEFLATED)
+        else:
+            self._archive = tarfile.open(self._tmp, self.mode)
+        self.entries = 0
+
+    def add_text(self, arcname, write):
+        """Add an entry rendered by `write(f)` into a text stream, without building it as one string."""
+        if self.mode == "zip":
+            with self._archive.open(arcname, "w", force_zip64=True) as raw:
+                write(_Utf8Writer(raw))
+        else:
+            with tempfile.SpooledTemporaryFile(SPOOL_BYTES) as spool:
+                write(_Utf8Writer(spool))
+                info = tarfile.TarInfo(arcname)
+                info.size = spool.tell()
+                info.mtime = time.time()
+                info.mode = FILE_MODE
+                spool.seek(0)
+                self._archive.addfile(info, spool)
+        self.entries += 1
+
+    def add_file(self, arcname, path):
+        """Copy a file from disk into the archive."""
+        if self.mode == "zip":
+            self._archive.write(path, arcname)
+        else:
+            self._archive.add(path, arcname)
+        self.entries += 1
+
+    def close(self):
+        self._archive.close()
+        os.chmod(self._tmp, FILE_MODE)
+        os.replace(self._tmp, self.path)
+        return self.path
+
+    def abort(self):
+        self._archive.close()
+        os.unlink(self._tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+def bundle_files(path, files):
+    """Archive `files` ((arcname, path) pairs) as `path`; files that don't exist are skipped."""
+    with Bundle(path) as bundle:
+        for arcname, source in files:
+            if os.path.exists(source):
+                bundle.add_file(arcname, source)
+    return path
+
+class CourseBundles:
+    """One archive per course in `directory`, opened when the course's first entry arrives."""
+
+    def __init__(self, directory, suffix=".zip"):
+        self.directory = directory
+        self.suffix = suffix
+        self.bundles = {}
+
+    def path(self, course):
+        return os.path.join(self.directory, course + self.suffix)
+
+    def __contains__(self, course):
+        return course in self.bundles
+
+    def add_text(self, course, arcname, write):
+        bundle = self.bundles.get(course)
+        if bundle is None:
+            bundle = self.bundles[course] = Bundle(self.path(course))
+        bundle.add_text(arcname, write)
+
+    def close(self):
+        """Finish every archive; returns their paths."""
+        return sorted(bundle.close() for bundle in self.bundles.values())
+
+    def abort(self):
+        for bundle in self.bundles.values():
+            bundle.abort()
+
+class DocumentWriter:
+    """Runs document writes on one background thread, in submission order.
+
+    Every submit returns a concurrent.futures.Future with the job's result
+    (usually the path written) or its exception.
+    """
+
+    def __init__(self, max_pending=DEFAULT_MAX_PENDING):
+        self._queue = queue.Queue(max_pending)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="DocumentWriter", daemon=True)
+                self._thread.start()
+                # Finish queued writes before the interpreter exits
+                atexit.register(self.close)
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                future, fn, args = job
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, fn, *args):
+        """Queue `fn(*args)`; blocks only while `max_pending` jobs are already waiting."""
+        self._start()
+        future = Future()
+        self._queue.put((future, fn, args))
+        return future
+
+    def write(self, path, write):
+        """Queue atomic_write(path, write)."""
+        return self.submit(atomic_write, path, write)
+
+    def write_text(self, path, text):
+        return self.write(path, lambda f: f.write(text))
+
+    def bundle(self, path, files):
+        """Queue an archive of `files` ((arcname, path) pairs); runs after everything submitted before it."""
+        return self.submit(bundle_files, path, list(files))
+
+    def pending(self):
+        return self._queue.unfinished_tasks
+
+    def flush(self):
+        """Wait until every job submitted so far has finished."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
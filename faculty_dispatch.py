@@ -0,0 +1,95 @@
+import queue
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Defaults shared by both Streamlit apps
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_AGENT_TIMEOUT = 90
+# How often a streaming tab is redrawn; Streamlit re-renders the whole markdown block
+DEFAULT_RENDER_INTERVAL = 0.05
+
+DispatchResult = namedtuple("DispatchResult", ["agent_name", "content", "error", "elapsed"])
+DispatchDelta = namedtuple("DispatchDelta", ["agent_name", "text"])
+
+def dispatch_streaming(jobs, max_concurrency=DEFAULT_MAX_CONCURRENCY, timeout=DEFAULT_AGENT_TIMEOUT,
+                       render_interval=DEFAULT_RENDER_INTERVAL):
+    """Run streaming faculty jobs in a bounded thread pool.
+
+    `jobs` maps an agent name to a zero-argument callable returning an iterable
+    of text chunks. Yields a DispatchDelta with the text received so far (at
+    most once per `render_interval` per agent) and, when an agent finishes, a
+    DispatchResult whose content is the full text assembled from the same
+    stream. Each agent gets `timeout` seconds measured from when it actually
+    starts, so agents queued behind the concurrency cap are not penalised.
+    Events are yielded in arrival order; callers render them on the main thread.
+    """
+    if not jobs:
+        return
+    events = queue.Queue()
+    started = {}
+    # Agents we stopped waiting for; their worker drops the stream at the next chunk
+    cancelled = set()
+
+    def consume(name, fn):
+        started[name] = time.monotonic()
+        try:
+            for chunk in fn():
+                if name in cancelled:
+                    break
+                if chunk:
+                    events.put(("delta", name, chunk))
+        except Exception as e:
+            events.put(("error", name, str(e)))
+        else:
+            events.put(("done", name, None))
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(jobs))))
+    for name, fn in jobs.items():
+        executor.submit(consume, name, fn)
+    chunks = {name: [] for name in jobs}
+    last_render = {name: 0.0 for name in jobs}
+    dirty = set()
+    pending = set(jobs)
+    try:
+        while pending:
+            now = time.monotonic()
+            deadlines = [started[name] + timeout for name in pending if name in started]
+            wait_for = min(deadlines) - now if deadlines else timeout
+            if dirty:
+                wait_for = min(wait_for, render_interval)
+            try:
+                kind, name, payload = events.get(timeout=max(0.0, wait_for))
+            except queue.Empty:
+                kind = None
+
+            now = time.monotonic()
+            if kind is not None and name in pending:
+                if kind == "delta":
+                    chunks[name].append(payload)
+                    dirty.add(name)
+                else:
+                    pending.discard(name)
+                    dirty.discard(name)
+                    elapsed = now - started.get(name, now)
+                    if kind == "done":
+                        yield DispatchResult(name, "".join(chunks[name]), None, elapsed)
+                    else:
+                        yield DispatchResult(name, None, payload, elapsed)
+
+            for name in list(dirty):
+                if now - last_render[name] >= render_interval:
+                    dirty.discard(name)
+                    last_render[name] = now
+                    yield DispatchDelta(name, "".join(chunks[name]))
+
+            for name in list(pending):
+                if name in started and now - started[name] >= timeout:
+                    pending.discard(name)
+                    dirty.discard(name)
+                    cancelled.add(name)
+                    yield DispatchResult(name, None, f"Timed out after {timeout}s", now - started[name])
+    finally:
+        # Don't block the UI on abandoned calls; they finish in the background
+        cancelled.update(pending)
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,225 @@
+"""Prompt assembly for the four faculty agents.
+
+Every request starts with the same system message; each agent's own brief,
+worded exactly as the apps always sent it, follows in the user message. So
+the prompts cost as many input tokens as before: the only text all four
+agents share is that one line, and it is far shorter than
+PROMPT_CACHE_MIN_TOKENS, so the provider won't serve it from its prompt cache
+either (the report only counts it as reusable once it is long enough).
+
+Prompts are measured locally before sending: with tiktoken installed, using
+the model's real encoding; otherwise using a close heuristic. A per-deploy
+token and/or latency budget caps each answer's max_tokens and, when that cap
+would fall below MIN_OUTPUT_TOKENS, trims the least important prompt sections
+until it fits.
+"""
+import re
+from collections import namedtuple
+
+MODEL = "gpt-4o-mini"
+MAX_TOKENS = 1500
+# A capped answer shorter than this isn't worth having; input is trimmed first
+MIN_OUTPUT_TOKENS = 300
+# Rough gpt-4o-mini figures used to turn a latency budget into an output cap
+BASE_TTFT_SECONDS = 0.5
+PREFILL_SECONDS_PER_TOKEN = 0.0002
+OUTPUT_TOKENS_PER_SECOND = 60.0
+# Role and framing tokens the API adds to every chat message
+MESSAGE_OVERHEAD_TOKENS = 4
+# OpenAI only caches prompt prefixes at least this long
+PROMPT_CACHE_MIN_TOKENS = 1024
+TOKEN_PIECE = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+
+# A section with priority None is always sent; otherwise the lowest priority goes first
+Section = namedtuple("Section", "name text priority")
+PromptPlan = namedtuple("PromptPlan", "system prompts max_tokens report")
+
+# The system message every faculty request starts with
+SYSTEM_PROMPT = (
+    Section("system/role", "You are a helpful AI teaching assistant specialized for ADHD learners.", None),
+)
+# Who the faculty are writing for, as both apps describe the student
+STUDENT_DESCRIPTION = ("a 30-year-old male IT student at Media Design School Auckland who has ADHD and has been away "
+                       "from computers for 12 years")
+
+# Per agent: the brief the simple app sends
+FACULTY = {
+    "Professor": {
+        "persona": f"You are Dr. Sarah Mitchell, creating a knowledge foundation for {STUDENT_DESCRIPTION}.",
+        "intro": "Create a comprehensive but ADHD-friendly knowledge base that includes:",
+        "items": [
+            "🎯 Why this matters for IT careers in Auckland (specific jobs and salaries)",
+            "⚡ Simple explanation with everyday analogies",
+            "📚 Core concepts in bite-sized chunks (2-3 sentences each)",
+            "💻 Real applications at Auckland tech companies",
+            "🔗 Connections to current semester subjects (Data Structures, Cloud Computing, Networking, "
+            "Cybersecurity)",
+            "🧠 Memory aids for ADHD learners",
+        ],
+        "closing": "Use lots of white space, clear headers, and confidence-building language.",
+    },
+    "Academic_Advisor": {
+        "persona": "You are James Chen, academic advisor for career changers with ADHD at Media Design School.",
+        "intro": "Create a realistic learning roadmap for a 30-year-old returning to tech:",
+        "items": [
+            "🎯 4-6 week timeline with ADHD accommodations",
+            "⏰ Daily 20-30 minute study sessions",
+            "⚡ Energy-based task scheduling",
+            "💰 Auckland job market connections",
+            "🏆 Milestone celebrations and progress tracking",
+            "💪 Confidence building for career changers",
+        ],
+        "closing": "Format as week-by-week plan with specific daily tasks.",
+    },
+    "Research_Librarian": {
+        "persona": "You are Maria Rodriguez, expert in ADHD-friendly learning resources.",
+        "intro": "Curate learning resources that are:",
+        "items": [
+            "🎥 ADHD-friendly (visual, short, engaging)",
+            "📖 Time-estimated for planning",
+            "⭐ Difficulty-rated clearly",
+            "🌏 Relevant to Auckland/NZ job market",
+            "🛠️ Connected to semester tools (AWS, Python, NETCAD, VS)",
+            "📱 Available in multiple formats",
+        ],
+        "closing": "Include free resources, time estimates, and why each is good for ADHD learners.",
+    },
+    "Teaching_Assistant": {
+        "persona": "You are Alex Kim, specializing in hands-on ADHD learning.",
+        "intro": "Create practice materials with:",
+        "items": [
+            '🏆 5-10 minute "quick wins" for immediate satisfaction',
+            "📈 Progressive difficulty building",
+            "📋 Step-by-step instructions with checkpoints",
+            "💼 Portfolio-building opportunities",
+            "🌏 Auckland business scenarios",
+            "🔧 Integration with semester tools",
+            "🎉 Achievement celebrations",
+        ],
+        "closing": "Focus on confidence building and hireable skills for Auckland IT market.",
+    },
+}
+# The first items of every brief are never trimmed
+MIN_ITEMS = 2
+
+_encoding = None
+
+def _tiktoken_encoding():
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.encoding_for_model(MODEL)
+        except Exception:
+            # Not installed, or its encoding files can't be downloaded here
+            _encoding = False
+    return _encoding
+
+def token_counter_name():
+    return "tiktoken" if _tiktoken_encoding() else "heuristic"
+
+def count_tokens(text):
+    """Tokens in `text` for MODEL; exact with tiktoken, otherwise within a few percent for English."""
+    encoding = _tiktoken_encoding()
+    if encoding:
+        return len(encoding.encode(text))
+    # BPE keeps common words whole and splits long ones; emoji and symbols cost more than one token
+    tokens = 0
+    for piece in TOKEN_PIECE.findall(text):
+        if piece.isascii():
+            tokens += 1 + (len(piece) - 1) // 8
+        else:
+            tokens += 2
+    return tokens
+
+def message_tokens(system, prompt):
+    return count_tokens(system) + count_tokens(prompt) + 2 * MESSAGE_OVERHEAD_TOKENS
+
+def agent_sections(agent_name):
+    """The trimmable sections of one agent's brief, in the order they are sent."""
+    brief = FACULTY[agent_name]
+    items = brief["items"]
+    sections = [Section(f"{agent_name}/persona", brief["persona"], None),
+                Section(f"{agent_name}/intro", brief["intro"], None)]
+    for number, item in enumerate(items, 1):
+        # Later items go first; the first MIN_ITEMS always stay
+        priority = None if number <= MIN_ITEMS else 2 + len(items) - number
+        sections.append(Section(f"{agent_name}/item{number}", f"{number}. {item}", priority))
+    if brief["closing"]:
+        sections.append(Section(f"{agent_name}/closing", brief["closing"], 4))
+    return sections
+
+def render_system(profile):
+    return "\n".join(section.text for section in profile)
+
+def render_prompt(sections, topic):
+    persona, intro, *rest = sections
+    items = [s.text for s in rest if not s.name.endswith("/closing")]
+    closing = [s.text for s in rest if s.name.endswith("/closing")]
+    return "\n\n".join([persona.text, f"TOPIC: {topic}", "\n".join([intro.text] + items)] + closing)
+
+def shared_prefix():
+    """The system message, identical for every agent and topic."""
+    return render_system(SYSTEM_PROMPT)
+
+def output_cap(input_tokens, n_requests, max_total_tokens=None, latency_budget=None):
+    """max_tokens per answer that keeps a deploy within its token and latency budgets."""
+    cap = MAX_TOKENS
+    if max_total_tokens:
+        cap = min(cap, (max_total_tokens - sum(input_tokens)) // n_requests)
+    if latency_budget:
+        ttft = BASE_TTFT_SECONDS + max(input_tokens) * PREFILL_SECONDS_PER_TOKEN
+        cap = min(cap, int((latency_budget - ttft) * OUTPUT_TOKENS_PER_SECOND))
+    return cap
+
+def assemble_prompts(topic, agent_names=tuple(FACULTY), max_total_tokens=None, latency_budget=None):
+    """Build the system prefix and per-agent prompts for one deploy within its budget.
+
+    `max_total_tokens` bounds input plus output tokens across all agents;
+    `latency_budget` bounds each answer's expected time to completion in
+    seconds. Returns a PromptPlan whose report says what was sent, trimmed
+    and saved.
+    """
+    profile = list(SYSTEM_PROMPT)
+    briefs = {name: agent_sections(name) for name in agent_names}
+    trimmed = []
+
+    def measure():
+        system = render_system(profile)
+        prompts = {name: render_prompt(sections, topic) for name, sections in briefs.items()}
+        inputs = [message_tokens(system, prompt) for prompt in prompts.values()]
+        return system, prompts, inputs
+
+    system, prompts, inputs = measure()
+    full_input = sum(inputs)
+    cap = output_cap(inputs, len(inputs), max_total_tokens, latency_budget)
+    while cap < MIN_OUTPUT_TOKENS:
+        candidates = [(s.priority, i, None, s) for i, s in enumerate(profile) if s.priority is not None]
+        for name, sections in briefs.items():
+            candidates += [(s.priority, i, name, s) for i, s in enumerate(sections) if s.priority is not None]
+        if not candidates:
+            break
+        _, position, name, section = min(candidates, key=lambda c: c[0])
+        del (profile if name is None else briefs[name])[position]
+        trimmed.append(section.name)
+        system, prompts, inputs = measure()
+        cap = output_cap(inputs, len(inputs), max_total_tokens, latency_budget)
+
+    over_budget = cap < MIN_OUTPUT_TOKENS
+    cap = max(cap, MIN_OUTPUT_TOKENS)
+    system_tokens = count_tokens(system)
+    report = {
+        "counter": token_counter_name(),
+        "input_tokens": sum(inputs),
+        "shared_prefix_tokens": system_tokens,
+        # Identical prefixes after the first request can come from the provider's prompt cache, if long enough
+        "prefix_reuse_tokens": system_tokens * (len(inputs) - 1) if system_tokens >= PROMPT_CACHE_MIN_TOKENS else 0,
+        "trimmed_sections": trimmed,
+        "trimmed_tokens": full_input - sum(inputs),
+        "max_tokens": cap,
+        "output_tokens_capped": (MAX_TOKENS - cap) * len(inputs),
+        "tokens_saved": full_input - sum(inputs) + (MAX_TOKENS - cap) * len(inputs),
+        "max_total_tokens": sum(inputs) + cap * len(inputs),
+        "over_budget": over_budget,
+    }
+    return PromptPlan(system, prompts, cap, report)
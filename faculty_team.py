@@ -0,0 +1,157 @@
+"""The teams app's four faculty agents and the prompt they answer.
+
+They live here rather than in teaching_agent_teams.py so `topic_packs.py
+generate --app teams` can build the same agents and pre-generate their
+answers. team_fingerprint() identifies everything besides the topic that
+shapes those answers, so the app only serves packs its current agents would
+have written.
+"""
+import hashlib
+import json
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.tools.serpapi import SerpApiTools
+
+from faculty_dispatch import DEFAULT_AGENT_TIMEOUT
+from faculty_prompts import STUDENT_DESCRIPTION
+from openai_clients import get_http_client
+
+MODEL = "gpt-4o-mini"
+# Tab names, in the order build_faculty_agents() returns the agents
+AGENT_NAMES = ("Professor", "Academic Advisor", "Research Librarian", "Teaching Assistant")
+TEAM_PROMPT = ("Topic: {topic}. Remember this is for a 30-year-old ADHD student at Media Design School Auckland "
+               "changing careers to IT.")
+
+def team_prompt(topic):
+    """The message every agent is asked about `topic`."""
+    return TEAM_PROMPT.format(topic=topic)
+
+def faculty_model(openai_api_key, max_tokens=None, base_url=None):
+    """The model every agent uses; the client doesn't retry (max_retries=0), the request scheduler does."""
+    return OpenAIChat(id=MODEL, api_key=openai_api_key, max_tokens=max_tokens, timeout=DEFAULT_AGENT_TIMEOUT,
+                      max_retries=0, http_client=get_http_client(), base_url=base_url)
+
+# Create agents with ADHD-friendly instructions for your profile
+def build_faculty_agents(openai_api_key, serpapi_api_key, max_tokens=None, base_url=None):
+    """Build the four faculty agents, in AGENT_NAMES order."""
+    professor_agent = Agent(
+        name="Professor_Dr_Sarah_Mitchell",
+        role="Knowledge Foundation Builder for ADHD Adult Learner", 
+        model=faculty_model(openai_api_key, max_tokens, base_url),
+        tools=[],
+        instructions=[
+            f"""You are Dr. Sarah Mitchell, creating a knowledge base for {STUDENT_DESCRIPTION}.
+
+            STUDENT PROFILE:
+            - Returning to tech after 12-year gap
+            - ADHD - needs structure, frequent breaks, bite-sized information
+            - Adult learner - values career relevance and practical applications
+            - Currently studying: Data Structures & Algorithms, Cloud Computing, Data & Networking, Cybersecurity
+
+            CREATE COMPREHENSIVE KNOWLEDGE BASE:
+            1. Start with "Why this matters for your IT career in Auckland"
+            2. Use simple, everyday language with analogies (cars, cooking, etc.)
+            3. Break complex topics into small chunks (2-3 sentences max)
+            4. Include frequent break suggestions
+            5. Connect to real Auckland job opportunities and salaries
+            6. Use ADHD-friendly formatting with lots of white space
+            7. Include confidence-building statements throughout
+            8. Relate to current semester subjects when possible
+
+            Format with clear headers, bullet points, and visual breaks."""
+        ],
+        show_tool_calls=True,
+        markdown=True,
+    )
+
+    academic_advisor_agent = Agent(
+        name="Academic_Advisor_James_Chen",
+        role="Learning Path Designer for Career Changer",
+        model=faculty_model(openai_api_key, max_tokens, base_url),
+        tools=[],
+        instructions=[
+            """You are James Chen, academic advisor specializing in career transitions for ADHD learners.
+
+            Create a learning roadmap that:
+            1. Acknowledges the student is 30 and changing careers
+            2. Provides realistic timelines with ADHD accommodations
+            3. Breaks learning into 15-30 minute daily sessions
+            4. Includes energy-based scheduling (high/medium/low energy tasks)
+            5. Connects to Auckland job market and salary expectations
+            6. Addresses age concerns positively
+            7. Integrates with current semester subjects
+            8. Includes milestone celebrations and progress tracking
+
+            Format as a week-by-week plan with specific daily tasks."""
+        ],
+        show_tool_calls=True,
+        markdown=True
+    )
+
+    # Only add SerpAPI if key is provided
+    research_tools = []
+    if serpapi_api_key:
+        research_tools.append(SerpApiTools(api_key=serpapi_api_key))
+
+    research_librarian_agent = Agent(
+        name="Research_Librarian_Maria_Rodriguez",
+        role="ADHD-Friendly Resource Curator",
+        model=faculty_model(openai_api_key, max_tokens, base_url),
+        tools=research_tools,
+        instructions=[
+            """You are Maria Rodriguez, expert librarian specializing in ADHD-friendly learning resources.
+
+            Curate resources that:
+            1. Are ADHD-friendly (short videos, interactive content, visual learning)
+            2. Include time estimates for each resource
+            3. Rate difficulty levels clearly
+            4. Focus on Auckland/NZ job market relevance
+            5. Provide multiple learning modalities (visual, hands-on, reading)
+            6. Include both free and premium options
+            7. Connect to current semester tools (AWS, Python, VS, NETCAD)
+            8. Suggest optimal times to use each resource type
+
+            If SerpAPI is available, search for current resources. Otherwise, recommend well-known platforms."""
+        ],
+        show_tool_calls=True,
+        markdown=True,
+    )
+
+    teaching_assistant_agent = Agent(
+        name="Teaching_Assistant_Alex_Kim",
+        role="Practice Coordinator for Adult ADHD Learner",
+        model=faculty_model(openai_api_key, max_tokens, base_url),
+        tools=research_tools,
+        instructions=[
+            """You are Alex Kim, teaching assistant specializing in hands-on learning for ADHD students.
+
+            Create practice materials that:
+            1. Start with 5-10 minute "quick wins" for immediate satisfaction
+            2. Build to longer projects gradually
+            3. Include step-by-step instructions with visual confirmations
+            4. Provide troubleshooting for common mistakes
+            5. Connect exercises to portfolio building
+            6. Include real-world Auckland business scenarios
+            7. Integrate with semester tools and subjects
+            8. Offer multiple difficulty levels for different energy states
+            9. Include achievement celebrations and progress tracking
+
+            Focus on building confidence while developing hireable skills."""
+        ],
+        show_tool_calls=True,
+        markdown=True,
+    )
+
+    return professor_agent, academic_advisor_agent, research_librarian_agent, teaching_assistant_agent
+
+def agent_cache_prompt(agent, message):
+    """Everything that shapes an agent's answer, used as the cache key prompt"""
+    tool_names = ",".join(type(tool).__name__ for tool in agent.tools or [])
+    return "\n".join(agent.instructions) + f"\n[tools: {tool_names}]\n" + message
+
+def team_fingerprint(agents):
+    """Hash of the agents' models, instructions and tools and of the prompt template."""
+    payload = json.dumps([[agent.name, agent.model.id, agent.model.temperature, agent.model.max_tokens,
+                           agent_cache_prompt(agent, TEAM_PROMPT)] for agent in agents])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,187 @@
+"""Watch the course/week Lessons folders and feed changed transcripts to StudyAgent.
+
+    python lecture_watcher.py ~/MDS --store sqlite:study.sqlite3 --scan
+
+Filesystem events come from the OS (inotify, FSEvents, ReadDirectoryChangesW
+via watchdog), so the tree is never polled. Bursts of events for the same file
+are debounced into one job, jobs wait in a bounded queue, and while the workers
+are busy new changes are coalesced per file instead of piling up. Each
+processed lecture gets its rendered notes and quiz written next to it as
+<name>.study.html.
+"""
+import argparse
+import asyncio
+import os
+from pathlib import Path
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from ai_study_agent import (StudyAgent, is_lecture_file, iter_lecture_files, lecture_id_for,
+                            write_output)
+from document_export import atomic_write
+from search_index import SearchIndex
+from study_store import open_store
+
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_WORKERS = 2
+OUTPUT_SUFFIX = ".study.html"
+
+class _EventBridge(FileSystemEventHandler):
+    """Hands watchdog's thread events to the asyncio loop."""
+
+    def __init__(self, loop, callback):
+        self.loop = loop
+        self.callback = callback
+
+    def on_created(self, event):
+        self._forward(event.src_path, event.is_directory)
+
+    def on_modified(self, event):
+        self._forward(event.src_path, event.is_directory)
+
+    def on_moved(self, event):
+        self._forward(event.dest_path, event.is_directory)
+
+    def _forward(self, path, is_directory):
+        if not is_directory and is_lecture_file(path):
+            self.loop.call_soon_threadsafe(self.callback, os.fspath(path))
+
+def output_path_for(path):
+    """Where the rendered notes and quiz for a transcript are written."""
+    path = Path(path)
+    return path.with_name(path.stem + OUTPUT_SUFFIX)
+
+class LectureWatcher:
+    def __init__(self, root, agent, debounce=DEFAULT_DEBOUNCE, queue_size=DEFAULT_QUEUE_SIZE,
+                 workers=DEFAULT_WORKERS):
+        self.root = os.fspath(root)
+        self.agent = agent
+        self.debounce = debounce
+        self.workers = workers
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self._timers = {}
+        # Settled changes waiting for queue space; a dict keeps arrival order and dedupes
+        self._pending = {}
+        self._pending_event = asyncio.Event()
+        self._queued = set()
+        # Paths a worker is processing, and those of them that changed again meanwhile
+        self._running = set()
+        self._rerun = set()
+        self.processed = 0
+
+    def _on_event(self, path):
+        # Restart the quiet period; only the last event of a burst schedules work
+        timer = self._timers.pop(path, None)
+        if timer is not None:
+            timer.cancel()
+        self._timers[path] = asyncio.get_running_loop().call_later(self.debounce, self._settled, path)
+
+    def _settled(self, path):
+        self._timers.pop(path, None)
+        self._pending[path] = None
+        self._pending_event.set()
+
+    async def _feed(self):
+        """Move settled paths into the bounded queue, waiting when the workers fall behind."""
+        while True:
+            await self._pending_event.wait()
+            self._pending_event.clear()
+            while self._pending:
+                path = next(iter(self._pending))
+                del self._pending[path]
+                if path in self._queued:
+                    continue
+                if path in self._running:
+                    # Never process one file on two workers; its worker queues it again when done
+                    self._rerun.add(path)
+                    continue
+                self._queued.add(path)
+                await self.queue.put(path)
+
+    async def _work(self):
+        while True:
+            path = await self.queue.get()
+            self._queued.discard(path)
+            self._running.add(path)
+            try:
+                changed = await asyncio.to_thread(self.process_file, path)
+                if changed:
+                    self.processed += 1
+                    print(f"Processed {lecture_id_for(path)} -> {output_path_for(path)}", flush=True)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Failed to process {path}: {e}", flush=True)
+            finally:
+                self._running.discard(path)
+                if path in self._rerun:
+                    self._rerun.discard(path)
+                    self._settled(path)
+                self.queue.task_done()
+
+    def process_file(self, path):
+        """Process one transcript and write its HTML next to it; False if the content was unchanged."""
+        lecture_id = lecture_id_for(path)
+        with open(path, encoding="utf-8", errors="replace") as f:
+            content = f.read()
+        output = output_path_for(path)
+        if not self.agent.process_lecture(lecture_id, content) and output.exists():
+            return False
+        # Written to a temp file and renamed, so readers never see a half-written page
+        notes, quiz = self.agent.get_notes(lecture_id), self.agent.get_quiz(lecture_id)
+        atomic_write(output, lambda f: write_output(lecture_id, notes, quiz, f))
+        return True
+
+    def scan(self):
+        """Queue every existing transcript (unchanged ones are skipped by the agent)."""
+        for _, path in iter_lecture_files(self.root):
+            self._settled(os.fspath(path))
+
+    async def run(self, scan=False):
+        loop = asyncio.get_running_loop()
+        observer = Observer()
+        observer.schedule(_EventBridge(loop, self._on_event), self.root, recursive=True)
+        observer.start()
+        tasks = [asyncio.create_task(self._feed())]
+        tasks += [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        if scan:
+            self.scan()
+        print(f"Watching {self.root} for lecture transcripts", flush=True)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            observer.stop()
+            await asyncio.to_thread(observer.join)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Process lecture transcripts as they are added or edited.")
+    parser.add_argument("root", help="course folder tree (see study_folders.py)")
+    parser.add_argument("--store", default="memory", metavar="SPEC",
+                        help="where notes and quizzes are kept: 'memory' (default) or 'sqlite:PATH'")
+    parser.add_argument("--index", metavar="PATH", help="also keep this search index up to date (see search_index.py)")
+    parser.add_argument("--scan", action="store_true", help="process existing transcripts on startup")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE,
+                        help="seconds a file must stay quiet before it is processed")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    agent = StudyAgent(open_store(args.store), SearchIndex(args.index) if args.index else None)
+    watcher = LectureWatcher(args.root, agent, args.debounce, args.queue_size, args.workers)
+    try:
+        asyncio.run(watcher.run(scan=args.scan))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        agent.store.close()
+        if agent.index is not None:
+            agent.index.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import atexit
+import hashlib
+import os
+import threading
+
+import json
+
+import httpx
+import openai
+from openai.types.chat import ChatCompletionChunk
+
+# Connection pool limits for the shared HTTP client (overridable from the environment)
+DEFAULT_MAX_CONNECTIONS = int(os.environ.get("MDSIT_MAX_CONNECTIONS", 20))
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("MDSIT_MAX_KEEPALIVE_CONNECTIONS", 10))
+DEFAULT_KEEPALIVE_EXPIRY = float(os.environ.get("MDSIT_KEEPALIVE_EXPIRY", 60.0))
+
+class ClientRegistry:
+    """Hands out OpenAI clients that share one keep-alive HTTP connection pool.
+
+    One `openai.OpenAI` wrapper is kept per API key (and base URL); all of them
+    reuse the same `httpx.Client`, so repeat calls skip the TCP and TLS
+    handshakes that a fresh client pays for.
+    """
+
+    def __init__(self, max_connections=DEFAULT_MAX_CONNECTIONS,
+                 max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                 keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self._http_client = None
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def http_client(self):
+        """Return the shared pooled HTTP client, creating it on first use."""
+        with self._lock:
+            if self._http_client is None or self._http_client.is_closed:
+                self._http_client = httpx.Client(limits=self.limits, timeout=None)
+                self._clients.clear()
+            return self._http_client
+
+    def get(self, api_key, base_url=None):
+        """Return the OpenAI client for `api_key`, reusing the pooled connections."""
+        http_client = self.http_client()
+        # Hash the key so the registry never holds it as a lookup value
+        key = (hashlib.sha256(api_key.encode("utf-8")).hexdigest(), base_url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                # Retries belong to request_scheduler, which backs off across every caller
+                client = openai.OpenAI(api_key=api_key, base_url=base_url, http_client=http_client, max_retries=0)
+                self._clients[key] = client
+            return client
+
+    def close(self):
+        """Close every pooled connection; later calls open a fresh pool."""
+        with self._lock:
+            self._clients.clear()
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+
+_registry = ClientRegistry()
+atexit.register(_registry.close)
+
+def get_openai_client(api_key, base_url=None):
+    """Return a pooled OpenAI client from the process-wide registry."""
+    return _registry.get(api_key, base_url)
+
+def stream_chat_completion(client, **params):
+    """Yield the ChatCompletionChunks of a streamed chat completion, reading the body to its end.
+
+    The SDK's own Stream stops at `data: [DONE]` and closes the response before
+    the final empty chunk of the body arrives, which makes httpx drop the
+    connection instead of returning it to the pool. Reading the raw body to
+    the end lets streamed calls reuse pooled connections like other calls do.
+    (agno's OpenAIChat streams through the SDK, so the teams app still opens a
+    new connection per streamed answer.)
+    """
+    with client.chat.completions.with_streaming_response.create(stream=True, **params) as response:
+        for line in response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                # Keep reading: the body isn't finished until the final chunk
+                continue
+            payload = json.loads(data)
+            if isinstance(payload, dict) and payload.get("error"):
+                error = payload["error"]
+                message = error.get("message") if isinstance(error, dict) else None
+                raise openai.APIError(message or "An error occurred during streaming", response.http_request,
+                                      body=error)
+            yield ChatCompletionChunk.model_validate(payload)
+
+def get_http_client():
+    """Return the process-wide pooled HTTP client (for agno's OpenAIChat)."""
+    return _registry.http_client()
+
+def close_clients():
+    """Shut down the process-wide connection pool."""
+    _registry.close()
@@ -0,0 +1,240 @@
+"""Cloze-style multiple-choice questions with distractors from a course term index.
+
+A question blanks out the most informative term of a sentence. The wrong
+options are terms of the same kind (names, acronyms, numbers, words with the
+same suffix class) that occur about as often in the course, so they are
+plausible rather than random. The term index is built from the course's
+sentences once and then answers every distractor lookup with a bisect (see
+course_registry.py for how course statistics are kept).
+"""
+import math
+import random
+import re
+import zlib
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import islice
+
+from course_registry import CourseRegistry, LectureStatistics
+from summarizer import STOPWORDS
+
+WORD = re.compile(r"[A-Za-z][A-Za-z0-9+#-]*[A-Za-z0-9+#]|\d+(?:\.\d+)?")
+BLANK = "_____"
+NUM_OPTIONS = 4
+MIN_WORD_LENGTH = 4
+# Once a kind has enough of them, only terms seen this often are used (typos and one-offs make poor options)
+MIN_TERM_COUNT = 2
+# Pools are re-sorted only after the index has grown by this factor; slightly stale frequencies are fine
+POOL_REBUILD_GROWTH = 1.25
+# Names, acronyms and numbers make better blanks than ordinary words
+KIND_BONUS = {"name": 1.0, "acronym": 1.0, "number": 0.5}
+# Suffix classes, so a noun is never offered as a distractor for an adverb
+SUFFIX_KINDS = (
+    ("tion", "noun"), ("sion", "noun"), ("ment", "noun"), ("ness", "noun"), ("ity", "noun"),
+    ("ing", "gerund"), ("ed", "past"), ("ly", "adverb"),
+    ("ous", "adjective"), ("ive", "adjective"), ("able", "adjective"), ("ible", "adjective"),
+    ("al", "adjective"), ("ic", "adjective"),
+    ("s", "plural"),
+)
+
+@lru_cache(maxsize=1 << 16)
+def term_kind(token, first):
+    """Return (term, kind) for a token, or None if it can't be a quiz answer.
+
+    `first` marks the first word of a sentence, whose capital letter says
+    nothing about whether it is a name.
+    """
+    if token[0].isdigit():
+        return token, "number"
+    if len(token) > 1 and token.isupper():
+        return token, "acronym"
+    lower = token.lower()
+    if len(token) < MIN_WORD_LENGTH or lower in STOPWORDS:
+        return None
+    if token[0].isupper() and not first:
+        return token, "name"
+    for suffix, kind in SUFFIX_KINDS:
+        if lower.endswith(suffix):
+            return lower, kind
+    return lower, "word"
+
+def sentence_terms(sentence):
+    """Yield (start, end, term, kind) for every candidate answer in a sentence."""
+    for number, match in enumerate(WORD.finditer(sentence)):
+        found = term_kind(match.group(), number == 0)
+        if found is not None:
+            yield match.start(), match.end(), found[0], found[1]
+
+def _stem(term):
+    return term.lower().rstrip("s")
+
+def term_counts(sentences):
+    """Counter of (term, kind) over `sentences`, as recorded in a CourseTermIndex."""
+    # Count raw tokens first and classify each distinct token once
+    openers = Counter()
+    others = Counter()
+    for sentence in sentences:
+        tokens = WORD.findall(sentence)
+        if tokens:
+            openers[tokens[0]] += 1
+            others.update(islice(tokens, 1, None))
+    counts = Counter()
+    for raw, first in ((openers, True), (others, False)):
+        for token, count in raw.items():
+            found = term_kind(token, first)
+            if found is not None:
+                counts[found] += count
+    return counts
+
+class CourseTermIndex(LectureStatistics):
+    """How often each (term, kind) occurs across a course, with per-kind frequency-sorted pools.
+
+    A lecture's part is its term_counts().
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.counts = defaultdict(int)
+        self.total = 0
+        self._pools = None
+        self._pools_total = 0
+
+    def _apply(self, counts, sign):
+        for found, count in counts.items():
+            self.counts[found] += sign * count
+            if not self.counts[found]:
+                del self.counts[found]
+        self.total += sign * sum(counts.values())
+        if sign < 0:
+            # Counts can shrink, so the pools are rebuilt rather than left to the growth rule
+            self._pools = None
+
+    def add_sentences(self, sentences):
+        """Count `sentences` into the index (for indexes that aren't kept per lecture)."""
+        counts = term_counts(sentences)
+        with self.lock:
+            self._apply(counts, 1)
+
+    def pools(self):
+        """kind -> (sorted frequencies, terms in the same order, offset of the first common term)."""
+        with self.lock:
+            if self._pools is None or self.total > self._pools_total * POOL_REBUILD_GROWTH:
+                by_kind = defaultdict(list)
+                for (term, kind), count in self.counts.items():
+                    by_kind[kind].append((count, term))
+                pools = {}
+                for kind, entries in by_kind.items():
+                    entries.sort()
+                    frequencies = [count for count, _ in entries]
+                    common = bisect_left(frequencies, MIN_TERM_COUNT)
+                    if len(entries) - common < NUM_OPTIONS:
+                        common = 0
+                    pools[kind] = (frequencies, [term for _, term in entries], common)
+                self._pools = pools
+                self._pools_total = self.total
+            return self._pools
+
+    def salience(self, term, kind):
+        """Rarer terms say more about a sentence; self-information plus a bonus for names and the like."""
+        return math.log((1.0 + self.total) / (1.0 + self.counts.get((term, kind), 0))) + KIND_BONUS.get(kind, 0.0)
+
+    def distractors(self, term, kind, k, rng, exclude=()):
+        """Up to `k` other terms of the same kind whose course frequency is closest to `term`'s.
+
+        Terms whose stem is in `exclude` (e.g. the words of the question) are never offered.
+        """
+        pool = self.pools().get(kind)
+        if pool is None:
+            return []
+        frequencies, terms, common = pool
+        count = max(self.counts.get((term, kind), 0), 1)
+        position = max(common, bisect_left(frequencies, count))
+        excluded = {_stem(term), *exclude}
+        window = range(max(common, position - 2 * k), min(len(terms), position + 2 * k + 1))
+        # Closest in frequency ratio, not rank: a frequent term's rank neighbours can be one-offs
+        nearest = sorted((i for i in window if _stem(terms[i]) not in excluded),
+                         key=lambda i: abs(math.log(frequencies[i] / count)))[:2 * k]
+        return [terms[i] for i in rng.sample(nearest, min(k, len(nearest)))]
+
+_indexes = CourseRegistry(CourseTermIndex)
+
+def course_term_index(course):
+    """Return the cached term index for a course (created on first use)."""
+    return _indexes.get(course)
+
+def install_term_index(course, index):
+    """Replace the cached term index for a course."""
+    _indexes.install(course, index)
+
+def build_term_index(lectures):
+    """A CourseTermIndex of (lecture, term counts) pairs."""
+    index = CourseTermIndex()
+    for lecture, counts in lectures:
+        index.set_lecture(lecture, counts)
+    return index
+
+def true_false_question(sentence):
+    """The old question format, for sentences without a usable blank."""
+    return {"question": f"Is this statement true? {sentence}", "options": ["True", "False"], "correct": "True"}
+
+def cloze_question(sentence, index):
+    """Return (salience, question) blanking the sentence's most informative term, or None."""
+    pools = index.pools()
+    found = list(sentence_terms(sentence))
+    seen = defaultdict(int)
+    for _, _, term, _ in found:
+        seen[term.lower()] += 1
+    best = None
+    for start, end, term, kind in found:
+        # A term repeated elsewhere in the sentence would give the answer away
+        if seen[term.lower()] > 1:
+            continue
+        pool = pools.get(kind)
+        # A blank needs at least one other term of its kind to choose from
+        if pool is None or len(pool[1]) < 2:
+            continue
+        if pool[2] and index.counts.get((term, kind), 0) < MIN_TERM_COUNT:
+            continue
+        score = index.salience(term, kind)
+        if best is None or score > best[0]:
+            best = (score, start, end, term, kind)
+    if best is None:
+        return None
+    score, start, end, term, kind = best
+    # Seeded by the sentence so the same lecture always gets the same quiz
+    rng = random.Random(zlib.crc32(sentence.encode("utf-8")))
+    # A word already in the sentence can't be the missing one, so it would be a giveaway option
+    options = index.distractors(term, kind, NUM_OPTIONS - 1, rng, {_stem(word) for word in WORD.findall(sentence)})
+    if not options:
+        return None
+    options.append(term)
+    rng.shuffle(options)
+    if not sentence[:start].strip() and kind not in KIND_BONUS:
+        # The blank starts the sentence; capitalise every option so case gives nothing away
+        options = [option[:1].upper() + option[1:] for option in options]
+        term = term[:1].upper() + term[1:]
+    question = f"Fill in the blank: {sentence[:start]}{BLANK}{sentence[end:]}"
+    return score, {"question": question, "options": options, "correct": term}
+
+def cloze_quiz(sentences, num_questions, index):
+    """Pick the `num_questions` best cloze questions from `sentences`, kept in lecture order.
+
+    Sentences that don't yield a cloze question are asked as True/False so the
+    quiz still has `num_questions` questions when the lecture is long enough.
+    """
+    if num_questions <= 0:
+        return []
+    scored = []
+    for position, sentence in enumerate(sentences):
+        found = cloze_question(sentence, index)
+        if found is not None:
+            scored.append((found[0], position, found[1]))
+    chosen = sorted(scored, key=lambda item: -item[0])[:num_questions]
+    used = {position for _, position, _ in chosen}
+    for position, sentence in enumerate(sentences):
+        if len(chosen) >= num_questions:
+            break
+        if position not in used:
+            chosen.append((0.0, position, true_false_question(sentence)))
+    return [question for _, _, question in sorted(chosen, key=lambda item: item[1])]
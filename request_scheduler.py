@@ -0,0 +1,374 @@
+"""Rate limiting, retries and request coalescing in front of the faculty model calls.
+
+Every OpenAI or agno call goes through one RequestScheduler per process:
+
+* two token buckets hold requests and tokens per minute under the account's
+  limits, so a burst of students queues briefly instead of drawing 429s;
+* 429s, 5xx responses, timeouts and dropped connections are retried with
+  full-jitter exponential backoff, honouring Retry-After when it is sent;
+* a circuit breaker fails fast after repeated server errors or timeouts, so
+  a provider outage costs one error per request rather than minutes of
+  retries (429s only slow everyone down; they never open it);
+* identical requests already in flight are coalesced: the first caller sends
+  the request and every other caller gets the same answer (or stream). Keys
+  include a hash of the API key (flight_key), so callers only ever share a
+  request sent with their own credentials.
+"""
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import namedtuple
+
+import telemetry
+
+# Default limits: gpt-4o-mini on a tier-1 account (overridable from the environment)
+DEFAULT_REQUESTS_PER_MINUTE = float(os.environ.get("MDSIT_REQUESTS_PER_MINUTE", 500))
+DEFAULT_TOKENS_PER_MINUTE = float(os.environ.get("MDSIT_TOKENS_PER_MINUTE", 200000))
+# A bucket holds this many seconds' worth of its rate, so short bursts go straight through
+DEFAULT_BURST_SECONDS = 10.0
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 20.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+SchedulerStats = namedtuple("SchedulerStats", "calls coalesced retries rate_limited rejected breaker")
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider that keeps failing."""
+
+class TokenBucket:
+    """Admits `rate` units per minute, up to `capacity` at once, in arrival order.
+
+    Callers reserve what they need immediately and then sleep off any deficit,
+    so a large request can't be starved by a stream of small ones.
+    """
+
+    def __init__(self, per_minute, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else self.rate * DEFAULT_BURST_SECONDS
+        self.available = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount):
+        """Take `amount` units and return the seconds to wait before using them."""
+        with self.lock:
+            self._refill(self.clock())
+            # A request bigger than the bucket waits for a full bucket rather than forever
+            self.available -= min(amount, self.capacity)
+            return max(0.0, -self.available / self.rate)
+
+    def acquire(self, amount=1):
+        wait = self.reserve(amount)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def drain(self):
+        """Empty the bucket, e.g. after the provider says we're over its limit anyway."""
+        with self.lock:
+            self._refill(self.clock())
+            self.available = min(self.available, 0.0)
+
+class CircuitBreaker:
+    """Closed until `failure_threshold` failures in a row, then open for `reset_timeout` seconds.
+
+    After the timeout one trial call is let through (half-open): success
+    closes the breaker, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT,
+                 clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self.lock:
+            if self.opened_at is None:
+                return "closed"
+            if self.clock() - self.opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self):
+        """Raise CircuitOpenError unless a call may go ahead now."""
+        with self.lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.reset_timeout - self.clock()
+            if remaining > 0 or self.trial_running:
+                raise CircuitOpenError(
+                    f"OpenAI keeps failing; paused new requests for {max(remaining, 1.0):.0f}s"
+                )
+            self.trial_running = True
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self.trial_running = False
+
+    def release_trial(self):
+        """A trial call ended without telling us anything about the provider."""
+        with self.lock:
+            self.trial_running = False
+
+def status_code_of(error):
+    """HTTP status of an OpenAI or agno error, or None (agno keeps the OpenAI error as __cause__)."""
+    for candidate in (error, error.__cause__):
+        status = getattr(candidate, "status_code", None)
+        if isinstance(status, int):
+            return status
+    return None
+
+def is_retryable(error):
+    """Rate limits, server errors, timeouts and dropped connections are worth another try."""
+    status = status_code_of(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    return isinstance(error, (TimeoutError, ConnectionError)) or type(error).__name__ in (
+        "APITimeoutError", "APIConnectionError", "TimeoutException", "ConnectError", "ReadTimeout",
+    )
+
+def retry_after_of(error):
+    """Seconds the provider asked us to wait, from Retry-After(-ms) headers, or None."""
+    for candidate in (error, error.__cause__):
+        headers = getattr(getattr(candidate, "response", None), "headers", None)
+        if not headers:
+            continue
+        try:
+            if headers.get("retry-after-ms"):
+                return float(headers["retry-after-ms"]) / 1000.0
+            if headers.get("retry-after"):
+                return float(headers["retry-after"])
+        except ValueError:
+            pass
+    return None
+
+def flight_key(key, api_key):
+    """Coalescing key for a request sent with `api_key`, so one student never gets another's call or error."""
+    if key is None:
+        return None
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16] + ":" + key
+
+class _Flight:
+    """One in-flight request and everything it has produced so far, shared by coalesced callers."""
+
+    def __init__(self, streaming):
+        self.streaming = streaming
+        self.chunks = []
+        self.done = False
+        self.error = None
+        self.condition = threading.Condition()
+
+    def publish(self, chunk):
+        with self.condition:
+            self.chunks.append(chunk)
+            self.condition.notify_all()
+
+    def finish(self, error=None):
+        with self.condition:
+            self.done = True
+            self.error = error
+            self.condition.notify_all()
+
+    def follow(self):
+        """Yield every chunk, from the first, as the leader receives it."""
+        position = 0
+        while True:
+            with self.condition:
+                while position == len(self.chunks) and not self.done:
+                    self.condition.wait()
+                chunks = self.chunks[position:]
+                done, error = self.done, self.error
+            position += len(chunks)
+            yield from chunks
+            if done and position == len(self.chunks):
+                if error is not None:
+                    raise error
+                return
+
+    def result(self):
+        """Wait for the leader and return its answer (the joined text if it was streamed)."""
+        chunks = list(self.follow())
+        return "".join(chunks) if self.streaming else chunks[0]
+
+class RequestScheduler:
+    """Rate-limited, retrying, coalescing front door for model calls (thread-safe)."""
+
+    def __init__(self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, tokens_per_minute=DEFAULT_TOKENS_PER_MINUTE,
+                 max_retries=DEFAULT_MAX_RETRIES, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT,
+                 clock=time.monotonic, sleep=time.sleep, seed=None):
+        self.requests = TokenBucket(requests_per_minute, clock=clock, sleep=sleep)
+        self.tokens = TokenBucket(tokens_per_minute, clock=clock, sleep=sleep)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout, clock=clock)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.random = random.Random(seed)
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.rejected = 0
+
+    def backoff(self, attempt, error):
+        """Full-jitter exponential delay before retry `attempt` (0-based), at least any Retry-After."""
+        with self._lock:
+            delay = self.random.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        retry_after = retry_after_of(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def _attempts(self, tokens):
+        """Yield once per attempt, after the breaker and both buckets have admitted it."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                with self._lock:
+                    self.rejected += 1
+                raise
+            waited = self.requests.acquire(1) + self.tokens.acquire(tokens)
+            if waited:
+                telemetry.current().add("rate_limit_wait_ms", round(waited * 1000, 3))
+            yield attempt
+
+    def _failed(self, attempt, error):
+        """Record a failed attempt; return True if it should be retried."""
+        if not is_retryable(error):
+            # Our own bad request says nothing about the provider's health
+            self.breaker.release_trial()
+            return False
+        if status_code_of(error) == 429:
+            # The provider is up, just busy: back everyone off instead of counting it as an outage
+            self.breaker.release_trial()
+            self.requests.drain()
+            self.tokens.drain()
+            with self._lock:
+                self.rate_limited += 1
+        else:
+            self.breaker.record_failure()
+        if attempt >= self.max_retries or self.breaker.state == "open":
+            return False
+        with self._lock:
+            self.retries += 1
+        telemetry.current().add("retries")
+        self.sleep(self.backoff(attempt, error))
+        return True
+
+    def _join(self, key, streaming):
+        """Return (flight, leader): the in-flight request for `key`, and whether we must send it."""
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key) if key is not None else None
+            if flight is not None:
+                self.coalesced += 1
+                telemetry.current().set(coalesced=True)
+                return flight, False
+            flight = _Flight(streaming)
+            if key is not None:
+                self._flights[key] = flight
+            return flight, True
+
+    def _land(self, key, flight, error=None):
+        with self._lock:
+            if key is not None and self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.finish(error)
+
+    def call(self, key, fn, tokens=1):
+        """Return `fn()` under the rate limits, retrying transient failures.
+
+        Concurrent calls with the same `key` (see flight_key) share one
+        `fn()` call; `key=None` never coalesces. `tokens` is the request's
+        prompt plus max_tokens, as the provider counts it against the limit.
+        """
+        flight, leader = self._join(key, streaming=False)
+        if not leader:
+            return flight.result()
+        try:
+            for attempt in self._attempts(tokens):
+                try:
+                    result = fn()
+                except Exception as e:
+                    if not self._failed(attempt, e):
+                        raise
+                else:
+                    self.breaker.record_success()
+                    flight.publish(result)
+                    self._land(key, flight)
+                    return result
+        except BaseException as e:
+            self._land(key, flight, e)
+            raise
+
+    def stream(self, key, fn, tokens=1):
+        """Yield the chunks of `fn()` under the rate limits, retrying until the first chunk arrives.
+
+        Once text has been shown a failure is raised rather than retried, so
+        nothing is repeated. Concurrent streams with the same `key` share one
+        upstream stream; followers get every chunk from the start.
+        """
+        flight, leader = self._join(key, streaming=True)
+        if not leader:
+            yield from flight.follow()
+            return
+        try:
+            for attempt in self._attempts(tokens):
+                started = False
+                try:
+                    for chunk in fn():
+                        if not started:
+                            started = True
+                            self.breaker.record_success()
+                        flight.publish(chunk)
+                        yield chunk
+                except Exception as e:
+                    if started or not self._failed(attempt, e):
+                        raise
+                else:
+                    if not started:
+                        self.breaker.record_success()
+                    self._land(key, flight)
+                    return
+        except GeneratorExit:
+            self.breaker.release_trial()
+            self._land(key, flight, RuntimeError("The shared request was abandoned"))
+            raise
+        except BaseException as e:
+            self._land(key, flight, e)
+            raise
+
+    def stats(self):
+        with self._lock:
+            return SchedulerStats(self.calls, self.coalesced, self.retries, self.rate_limited, self.rejected,
+                                  self.breaker.state)
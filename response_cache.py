@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Cache defaults (shared by both Streamlit apps)
+DEFAULT_CACHE_PATH = os.path.join(".faculty_cache", "responses.sqlite3")
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+def make_cache_key(agent_name, prompt, model, temperature, max_tokens):
+    """Content-address a faculty request by everything that shapes the answer."""
+    payload = json.dumps(
+        [agent_name, prompt, model, temperature, max_tokens],
+        ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL expiry and LRU, size-bounded eviction."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL_SECONDS,
+                 max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Shared across the dispatch threads; every access goes through the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                agent_name TEXT NOT NULL,
+                content TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        self._conn.commit()
+
+    def get(self, key):
+        """Return the cached content for `key`, or None on a miss or expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key, agent_name, content):
+        """Store `content` under `key` and evict least recently used entries over the bounds."""
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, agent_name, content, size, now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+        total_entries = 0
+        total_bytes = 0
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access DESC"):
+            total_entries += 1
+            total_bytes += size
+            if total_entries > self.max_entries or total_bytes > self.max_bytes:
+                stale.append((key,))
+        if stale:
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def get_or_compute(self, agent_name, prompt, model, temperature, max_tokens, compute, refresh=False):
+        """Return a cached response or call `compute()` and cache its result.
+
+        Exceptions from `compute` propagate and nothing is cached, so failed
+        calls are retried on the next request. `refresh=True` skips the lookup
+        and overwrites whatever was cached.
+        """
+        key = make_cache_key(agent_name, prompt, model, temperature, max_tokens)
+        content = None if refresh else self.get(key)
+        if content is None:
+            content = compute()
+            self.set(key, agent_name, content)
+        return content
+
+    def stream_or_compute(self, agent_name, prompt, model, temperature, max_tokens, stream, refresh=False):
+        """Yield a cached response as one chunk, or relay `stream()` and cache the assembled text.
+
+        Only a stream that runs to completion is cached; an interrupted or
+        failed stream leaves the cache untouched.
+        """
+        key = make_cache_key(agent_name, prompt, model, temperature, max_tokens)
+        content = None if refresh else self.get(key)
+        if content is not None:
+            yield content
+            return
+        chunks = []
+        for chunk in stream():
+            chunks.append(chunk)
+            yield chunk
+        self.set(key, agent_name, "".join(chunks))
+
+    def stats(self):
+        """Return hit/miss counters for this process and the current cache size."""
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": total_bytes,
+        }
+
+    def clear(self):
+        """Drop every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
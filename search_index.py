@@ -0,0 +1,392 @@
+"""Full-text search over lecture notes, quizzes and faculty reports.
+
+    python search_index.py "recursion base case"
+    python search_index.py "sql joins" --kind report --limit 5
+    python search_index.py --add-reports .          # index report files written earlier
+
+The index is an inverted index kept in SQLite: for every term, its postings
+(document ids and term frequencies) are stored as packed arrays in blocks of
+BLOCK_SIZE. A query reads only the blocks of its own terms and scores them
+with BM25 in NumPy, so even a term that occurs in every one of tens of
+thousands of documents is ranked in a few milliseconds. Documents are added
+one batch at a time by appending to the term blocks; a replaced document's old
+postings are masked out and dropped when the index is compacted.
+"""
+import argparse
+import glob
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import defaultdict, namedtuple
+
+import numpy as np
+
+from summarizer import STOPWORDS
+
+DEFAULT_INDEX_PATH = os.environ.get("MDSIT_SEARCH_INDEX", os.path.join(".faculty_cache", "search.sqlite3"))
+DEFAULT_LIMIT = 10
+KINDS = ("notes", "quiz", "report")
+BLOCK_SIZE = 1024
+# BM25 parameters; a title term counts TITLE_WEIGHT times
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 5
+# Prefix queries expand to at most this many terms
+MAX_PREFIX_TERMS = 64
+SNIPPET_WORDS = 12
+# Underscores split words, so "Web_Development_Week_03" is searchable by its parts
+TOKEN = re.compile(r"[^\W_]+")
+QUERY_TERM = re.compile(r"[^\W_]+\*?")
+REPORT_HEADER = re.compile(r"# (.+?) Report - (.+)")
+
+SearchHit = namedtuple("SearchHit", "doc_id kind title source score snippet")
+
+def normalize(token):
+    """Fold simple plurals so "loops" finds "loop" (and the other way round)."""
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+def tokenize(text):
+    return [normalize(t) for t in TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+def term_frequencies(title, body):
+    """Term -> frequency for a document, with title terms weighted; also returns the weighted length."""
+    counts = defaultdict(int)
+    title_tokens = tokenize(title)
+    body_tokens = tokenize(body)
+    for token in title_tokens:
+        counts[token] += TITLE_WEIGHT
+    for token in body_tokens:
+        counts[token] += 1
+    return counts, TITLE_WEIGHT * len(title_tokens) + len(body_tokens)
+
+def make_snippet(body, terms):
+    """A few words of `body` around the first query term, with matches in **bold**."""
+    words = body.split()
+    if not words:
+        return ""
+
+    def matches(word):
+        tokens = TOKEN.findall(word.lower())
+        return any(token.startswith(t) if prefix else normalize(token) == t
+                   for token in tokens for t, prefix in terms)
+
+    first = next((i for i, word in enumerate(words) if matches(word)), 0)
+    start = max(0, first - SNIPPET_WORDS // 3)
+    window = words[start:start + SNIPPET_WORDS]
+    text = " ".join(f"**{word}**" if matches(word) else word for word in window)
+    return ("… " if start else "") + text + (" …" if start + SNIPPET_WORDS < len(words) else "")
+
+class SearchIndex:
+    """BM25-ranked inverted index kept in one SQLite file; safe to share between threads.
+
+    Several processes may write to the same file (the batch CLI, the watcher,
+    the Streamlit app); each picks up the others' changes before searching.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                doc_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                title TEXT NOT NULL,
+                source TEXT,
+                body TEXT NOT NULL,
+                length INTEGER NOT NULL,
+                alive INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                updated REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS documents_live ON documents (doc_id) WHERE alive")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS documents_seq ON documents (seq)")
+        # Postings clustered by term: one range scan returns every block of a term
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                block INTEGER NOT NULL,
+                docs BLOB NOT NULL,
+                tfs BLOB NOT NULL,
+                PRIMARY KEY (term, block)
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+        # In-memory per-document columns, indexed by internal id, for scoring
+        self._lengths = np.zeros(0, dtype=np.float64)
+        self._alive = np.zeros(0, dtype=bool)
+        self._kinds = np.zeros(0, dtype=np.int16)
+        self._kind_codes = {}
+        self._seq = 0
+        self._data_version = None
+        self._live = 0
+        self._average_length = 0.0
+        self._refresh()
+
+    def _kind_code(self, kind):
+        return self._kind_codes.setdefault(kind, len(self._kind_codes))
+
+    def _refresh(self):
+        """Load document rows changed since the last refresh (by this or another process)."""
+        rows = self._conn.execute(
+            "SELECT id, kind, length, alive, seq FROM documents WHERE seq > ?", (self._seq,)
+        ).fetchall()
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if not rows:
+            return
+        size = max(row[0] for row in rows) + 1
+        if size > len(self._alive):
+            grow = max(size, 2 * len(self._alive))
+            self._lengths = np.concatenate([self._lengths, np.zeros(grow - len(self._lengths))])
+            self._alive = np.concatenate([self._alive, np.zeros(grow - len(self._alive), dtype=bool)])
+            self._kinds = np.concatenate([self._kinds, np.zeros(grow - len(self._kinds), dtype=np.int16)])
+        for doc, kind, length, alive, seq in rows:
+            self._lengths[doc] = length
+            self._alive[doc] = bool(alive)
+            self._kinds[doc] = self._kind_code(kind)
+            self._seq = max(self._seq, seq)
+        self._live = int(self._alive.sum())
+        self._average_length = float(self._lengths[self._alive].mean()) if self._live else 0.0
+
+    def _begin(self):
+        """Start a write transaction and return its change sequence number."""
+        # IMMEDIATE takes the write lock first, so two processes can't claim the same number
+        self._conn.execute("BEGIN IMMEDIATE")
+        row = self._conn.execute("SELECT MAX(seq) FROM documents").fetchone()
+        return (row[0] or 0) + 1
+
+    def _retire(self, doc_ids, seq):
+        """Mark the live versions of `doc_ids` dead; their postings are skipped until compaction."""
+        self._conn.executemany("UPDATE documents SET alive = 0, seq = ? WHERE doc_id = ? AND alive",
+                               ((seq, doc_id) for doc_id in doc_ids))
+
+    def add(self, doc_id, kind, title, body, source=None):
+        """Index one document, replacing any earlier version with the same doc_id."""
+        self.add_many([(doc_id, kind, title, body, source)])
+
+    def add_many(self, documents):
+        """Index (doc_id, kind, title, body, source) tuples in a single transaction."""
+        documents = list({doc[0]: doc for doc in documents}.values())
+        if not documents:
+            return
+        now = time.time()
+        postings = defaultdict(lambda: ([], []))
+        with self._lock:
+            with self._conn:
+                seq = self._begin()
+                self._retire([doc[0] for doc in documents], seq)
+                for doc_id, kind, title, body, source in documents:
+                    counts, length = term_frequencies(title, body)
+                    doc = self._conn.execute(
+                        "INSERT INTO documents (doc_id, kind, title, source, body, length, alive, seq, updated) "
+                        "VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)",
+                        (doc_id, kind, title, source, body, length, seq, now)
+                    ).lastrowid
+                    for term, tf in counts.items():
+                        postings[term][0].append(doc)
+                        postings[term][1].append(tf)
+                for term, (docs, tfs) in postings.items():
+                    self._append_postings(term, np.array(docs, dtype="<i4"),
+                                          np.minimum(tfs, 65535).astype("<u2"))
+            self._refresh()
+
+    def _append_postings(self, term, docs, tfs):
+        last = self._conn.execute(
+            "SELECT block, docs, tfs FROM postings WHERE term = ? ORDER BY block DESC LIMIT 1", (term,)
+        ).fetchone()
+        block = 0
+        if last is not None:
+            block = last[0]
+            tail_docs = np.frombuffer(last[1], dtype="<i4")
+            if len(tail_docs) < BLOCK_SIZE:
+                # Top up the last block before starting new ones
+                docs = np.concatenate([tail_docs, docs])
+                tfs = np.concatenate([np.frombuffer(last[2], dtype="<u2"), tfs])
+            else:
+                block += 1
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO postings VALUES (?, ?, ?, ?)",
+            ((term, block + i // BLOCK_SIZE, docs[i:i + BLOCK_SIZE].tobytes(), tfs[i:i + BLOCK_SIZE].tobytes())
+             for i in range(0, len(docs), BLOCK_SIZE))
+        )
+
+    def add_lectures(self, items):
+        """Index the notes and quiz of (lecture_id, notes, quiz) results as two documents each."""
+        documents = []
+        for lecture_id, notes, quiz in items:
+            documents.append((f"notes:{lecture_id}", "notes", lecture_id, "\n".join(notes), None))
+            questions = [q["question"] if isinstance(q, dict) else str(q) for q in quiz]
+            documents.append((f"quiz:{lecture_id}", "quiz", lecture_id, "\n".join(questions), None))
+        self.add_many(documents)
+
+    def add_report(self, filename, agent_name, topic, content):
+        """Index a faculty report saved as `filename`."""
+        title = f"{agent_name.replace('_', ' ')} Report - {topic}"
+        self.add(f"report:{os.path.abspath(filename)}", "report", title, content, filename)
+
+    def remove_report(self, filename):
+        """Drop the report saved as `filename`, e.g. after the file was deleted."""
+        self.remove(f"report:{os.path.abspath(filename)}")
+
+    def remove(self, doc_id):
+        with self._lock:
+            with self._conn:
+                self._retire([doc_id], self._begin())
+            self._refresh()
+
+    def compact(self):
+        """Rewrite the postings without retired documents and drop those documents."""
+        with self._lock:
+            with self._conn:
+                dead = {row[0] for row in self._conn.execute("SELECT id FROM documents WHERE NOT alive")}
+                if not dead:
+                    return 0
+                dead_ids = np.fromiter(dead, dtype=np.int64, count=len(dead))
+                blocks = defaultdict(list)
+                for term, _, docs, tfs in self._conn.execute("SELECT * FROM postings ORDER BY term, block"):
+                    blocks[term].append((np.frombuffer(docs, dtype="<i4"), np.frombuffer(tfs, dtype="<u2")))
+                self._conn.execute("DELETE FROM postings")
+                for term, parts in blocks.items():
+                    docs = np.concatenate([p[0] for p in parts])
+                    tfs = np.concatenate([p[1] for p in parts])
+                    keep = ~np.isin(docs, dead_ids)
+                    if keep.any():
+                        self._append_postings(term, docs[keep], tfs[keep])
+                self._conn.execute("DELETE FROM documents WHERE NOT alive")
+            self._conn.execute("VACUUM")
+            return len(dead)
+
+    def _term_postings(self, term, prefix):
+        if prefix:
+            # Every indexed term starting with `term`; U+FFFF sorts after any real term character
+            rows = self._conn.execute(
+                "SELECT term, docs, tfs FROM postings WHERE term >= ? AND term < ? ORDER BY term, block",
+                (term, term + "\uffff")
+            ).fetchall()
+            expanded = defaultdict(list)
+            for found, docs, tfs in rows:
+                if len(expanded) < MAX_PREFIX_TERMS or found in expanded:
+                    expanded[found].append((docs, tfs))
+            return list(expanded.values())
+        rows = self._conn.execute("SELECT docs, tfs FROM postings WHERE term = ? ORDER BY block", (term,)).fetchall()
+        return [rows] if rows else []
+
+    def search(self, query, limit=DEFAULT_LIMIT, kind=None):
+        """Return up to `limit` SearchHits for `query`, best (highest BM25 score) first.
+
+        Every query word contributes to the score; end a word with * to match
+        it as a prefix. `kind` restricts results to "notes", "quiz" or "report".
+        """
+        terms = []
+        for word in QUERY_TERM.findall(query.lower()):
+            prefix = word.endswith("*")
+            word = word.rstrip("*")
+            if prefix:
+                terms.append((word, True))
+            elif word not in STOPWORDS:
+                terms.append((normalize(word), False))
+        if not terms or limit <= 0:
+            return []
+        with self._lock:
+            if self._conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version:
+                self._refresh()
+            if not self._live:
+                return []
+            wanted = self._alive
+            if kind is not None:
+                if kind not in self._kind_codes:
+                    return []
+                wanted = wanted & (self._kinds == self._kind_codes[kind])
+            scores = np.zeros(len(self._alive))
+            for term, prefix in terms:
+                for blocks in self._term_postings(term, prefix):
+                    docs = np.concatenate([np.frombuffer(b[0], dtype="<i4") for b in blocks])
+                    tfs = np.concatenate([np.frombuffer(b[1], dtype="<u2") for b in blocks]).astype(np.float64)
+                    live = self._alive[docs]
+                    df = int(live.sum())
+                    if not df:
+                        continue
+                    idf = np.log(1.0 + (self._live - df + 0.5) / (df + 0.5))
+                    keep = wanted[docs]
+                    docs, tfs = docs[keep], tfs[keep]
+                    norm = K1 * (1.0 - B + B * self._lengths[docs] / self._average_length)
+                    scores[docs] += idf * tfs * (K1 + 1.0) / (tfs + norm)
+            matched = np.flatnonzero(scores)
+            if len(matched) > limit:
+                matched = matched[np.argpartition(-scores[matched], limit - 1)[:limit]]
+            matched = matched[np.argsort(-scores[matched], kind="stable")]
+            if not len(matched):
+                return []
+            ids = [int(doc) for doc in matched]
+            rows = self._conn.execute(
+                f"SELECT id, doc_id, kind, title, source, body FROM documents WHERE id IN ({','.join('?' * len(ids))})",
+                ids
+            ).fetchall()
+        by_id = {row[0]: row for row in rows}
+        return [SearchHit(by_id[doc][1], by_id[doc][2], by_id[doc][3], by_id[doc][4],
+                          round(float(scores[doc]), 4), make_snippet(by_id[doc][5], terms))
+                for doc in ids if doc in by_id]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents WHERE alive").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def index_report_files(index, root):
+    """Index report files written by create_local_document under `root`; returns how many were added."""
+    added = 0
+    for filename in glob.glob(os.path.join(root, "*.md")):
+        with open(filename, encoding="utf-8", errors="replace") as f:
+            header = REPORT_HEADER.match(f.readline().strip())
+            if header is None:
+                continue
+            index.add_report(filename, header.group(1), header.group(2), f.read())
+        added += 1
+    return added
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Search generated notes, quizzes and faculty reports.")
+    parser.add_argument("query", nargs="?", help="words to search for (end a word with * for a prefix)")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH, metavar="PATH", help="index file")
+    parser.add_argument("--kind", choices=KINDS, help="only return this kind of document")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    parser.add_argument("--add-reports", metavar="DIR", help="index the faculty report files in DIR first")
+    parser.add_argument("--compact", action="store_true", help="drop postings of replaced documents")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    index = SearchIndex(args.index)
+    try:
+        if args.add_reports:
+            print(f"Indexed {index_report_files(index, args.add_reports)} reports from {args.add_reports}",
+                  file=sys.stderr)
+        if args.compact:
+            print(f"Dropped {index.compact()} replaced documents", file=sys.stderr)
+        if not args.query:
+            return
+        start = time.perf_counter()
+        hits = index.search(args.query, args.limit, args.kind)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for hit in hits:
+            print(f"{hit.score:8.2f}  [{hit.kind}] {hit.title}" + (f"  ({hit.source})" if hit.source else ""))
+            print(f"          {hit.snippet}")
+        print(f"{len(hits)} results of {len(index)} documents in {elapsed_ms:.1f} ms", file=sys.stderr)
+    finally:
+        index.close()
+
+if __name__ == "__main__":
+    main()
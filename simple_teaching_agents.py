@@ -1,6 +1,17 @@
 import streamlit as st
-import openai
 import datetime
+import os
+from document_export import (DEFAULT_EXPORT_DIR, DEFAULT_KEEP_EXPORTS, DocumentWriter, atomic_write, export_path,
+                             prune, report_filename)
+from faculty_dispatch import DEFAULT_AGENT_TIMEOUT, DEFAULT_MAX_CONCURRENCY, DispatchDelta, dispatch_streaming
+from faculty_prompts import MAX_TOKENS, MODEL, assemble_prompts, message_tokens, shared_prefix
+from openai_clients import get_openai_client, stream_chat_completion
+from request_scheduler import RequestScheduler, flight_key
+from response_cache import ResponseCache, make_cache_key
+from search_index import SearchIndex
+from topic_packs import SIMPLE_APP, TopicPacks, prompts_fingerprint
+import telemetry
+from telemetry_panel import performance_panel, performance_toggle
 
 # Set page configuration
 st.set_page_config(page_title="👨‍🏫 AI Teaching Faculty Team", layout="centered")
@@ -11,82 +22,130 @@ if 'openai_api_key' not in st.session_state:
 if 'topic' not in st.session_state:
     st.session_state['topic'] = ''
 
-def call_openai_api(prompt, api_key):
-    """Call OpenAI API with error handling"""
-    try:
-        client = openai.OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a helpful AI teaching assistant specialized for ADHD learners."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=1500,
-            temperature=0.7
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        return f"Error: {str(e)}"
+TEMPERATURE = 0.7
+
+@st.cache_resource
+def get_response_cache():
+    """One on-disk response cache shared by every session of this app"""
+    return ResponseCache()
+
+@st.cache_resource
+def get_request_scheduler():
+    """One rate limiter, retry policy and circuit breaker for every session of this app"""
+    return RequestScheduler()
 
-# Agent prompts for ADHD learner at Media Design School
-AGENT_PROMPTS = {
-    "Professor": """You are Dr. Sarah Mitchell, creating a knowledge foundation for a 30-year-old male IT student at Media Design School Auckland who has ADHD and has been away from computers for 12 years.
+@st.cache_resource
+def get_document_writer():
+    """Background writer for report files and bundles, shared by every session"""
+    return DocumentWriter()
 
-TOPIC: {topic}
+@st.cache_resource
+def get_search_index():
+    """The BM25 index the teams app searches; saved reports are added to it too"""
+    return SearchIndex()
 
-Create a comprehensive but ADHD-friendly knowledge base that includes:
-1. 🎯 Why this matters for IT careers in Auckland (specific jobs and salaries)
-2. ⚡ Simple explanation with everyday analogies
-3. 📚 Core concepts in bite-sized chunks (2-3 sentences each)
-4. 💻 Real applications at Auckland tech companies
-5. 🔗 Connections to current semester subjects (Data Structures, Cloud Computing, Networking, Cybersecurity)
-6. 🧠 Memory aids for ADHD learners
+def save_report(path, agent_name, topic, content, index):
+    """Write a report file and index it (runs on the document writer's thread)"""
+    atomic_write(path, lambda f: f.write(content))
+    index.add_report(path, agent_name, topic, content)
+    return path
 
-Use lots of white space, clear headers, and confidence-building language.""",
+def prune_exports(index, keep=DEFAULT_KEEP_EXPORTS):
+    """Keep the export folder to its newest `keep` files, dropping deleted reports from the index"""
+    for path in prune(DEFAULT_EXPORT_DIR, keep):
+        if path.endswith(".md"):
+            index.remove_report(path)
 
-    "Academic_Advisor": """You are James Chen, academic advisor for career changers with ADHD at Media Design School.
+def read_export(future):
+    """Download data for a queued write: read from disk when the button is clicked, not kept in memory"""
+    with open(future.result(), 'rb') as f:
+        return f.read()
 
-TOPIC: {topic}
+@st.cache_resource
+def get_topic_packs():
+    """Pre-generated answers for popular topics (see topic_packs.py), served without calling OpenAI"""
+    return TopicPacks()
 
-Create a realistic learning roadmap for a 30-year-old returning to tech:
-1. 🎯 4-6 week timeline with ADHD accommodations
-2. ⏰ Daily 20-30 minute study sessions
-3. ⚡ Energy-based task scheduling
-4. 💰 Auckland job market connections
-5. 🏆 Milestone celebrations and progress tracking
-6. 💪 Confidence building for career changers
+def build_messages(prompt, system=None):
+    """Chat messages sent for every faculty prompt; the shared system prefix always comes first"""
+    return [
+        {"role": "system", "content": system if system is not None else shared_prefix()},
+        {"role": "user", "content": prompt}
+    ]
 
-Format as week-by-week plan with specific daily tasks.""",
+def request_key_and_tokens(agent_name, messages, max_tokens, api_key):
+    """Coalescing key and rate-limit token cost of one faculty request"""
+    cache_prompt = messages[0]["content"] + "\n\n" + messages[1]["content"]
+    key = flight_key(make_cache_key(agent_name, cache_prompt, MODEL, TEMPERATURE, max_tokens), api_key)
+    return cache_prompt, key, message_tokens(messages[0]["content"], messages[1]["content"]) + max_tokens
 
-    "Research_Librarian": """You are Maria Rodriguez, expert in ADHD-friendly learning resources.
+def call_openai_api(prompt, api_key, agent_name="", timeout=DEFAULT_AGENT_TIMEOUT, cache=None, refresh=False,
+                    system=None, max_tokens=MAX_TOKENS, scheduler=None):
+    """Call OpenAI API, serving repeated prompts from the cache; errors left after retries are raised"""
+    messages = build_messages(prompt, system)
+    cache_prompt, key, tokens = request_key_and_tokens(agent_name, messages, max_tokens, api_key)
+    span = telemetry.span("agent.call", agent=agent_name, streaming=False, cache="off" if cache is None else "hit",
+                          prompt_tokens=tokens - max_tokens, max_tokens=max_tokens)
 
-TOPIC: {topic}
+    def request():
+        client = get_openai_client(api_key)
+        response = client.chat.completions.create(
+            model=MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE,
+            timeout=timeout
+        )
+        if span and response.usage:
+            span.set(prompt_tokens=response.usage.prompt_tokens, completion_tokens=response.usage.completion_tokens)
+        return response.choices[0].message.content
 
-Curate learning resources that are:
-1. 🎥 ADHD-friendly (visual, short, engaging)
-2. 📖 Time-estimated for planning
-3. ⭐ Difficulty-rated clearly
-4. 🌏 Relevant to Auckland/NZ job market
-5. 🛠️ Connected to semester tools (AWS, Python, NETCAD, VS)
-6. 📱 Available in multiple formats
+    def compute():
+        if cache is not None:
+            span.set(cache="miss")
+        return request() if scheduler is None else scheduler.call(key, request, tokens)
 
-Include free resources, time estimates, and why each is good for ADHD learners.""",
+    with span:
+        if cache is None:
+            content = compute()
+        else:
+            content = cache.get_or_compute(agent_name, cache_prompt, MODEL, TEMPERATURE, max_tokens, compute,
+                                           refresh=refresh)
+        if span:
+            span.set(response_bytes=len(content.encode("utf-8")))
+        return content
 
-    "Teaching_Assistant": """You are Alex Kim, specializing in hands-on ADHD learning.
+def stream_openai_api(prompt, api_key, agent_name="", timeout=DEFAULT_AGENT_TIMEOUT, cache=None, refresh=False,
+                      system=None, max_tokens=MAX_TOKENS, scheduler=None):
+    """Yield response text deltas as OpenAI produces them; errors left after retries are raised"""
+    messages = build_messages(prompt, system)
+    cache_prompt, key, tokens = request_key_and_tokens(agent_name, messages, max_tokens, api_key)
+    span = telemetry.span("agent.call", agent=agent_name, streaming=True, cache="off" if cache is None else "hit",
+                          prompt_tokens=tokens - max_tokens, max_tokens=max_tokens)
 
-TOPIC: {topic}
+    def request():
+        client = get_openai_client(api_key)
+        response = stream_chat_completion(
+            client,
+            model=MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE,
+            timeout=timeout
+        )
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
-Create practice materials with:
-1. 🏆 5-10 minute "quick wins" for immediate satisfaction
-2. 📈 Progressive difficulty building
-3. 📋 Step-by-step instructions with checkpoints
-4. 💼 Portfolio-building opportunities
-5. 🌏 Auckland business scenarios
-6. 🔧 Integration with semester tools
-7. 🎉 Achievement celebrations
+    def stream():
+        if cache is not None:
+            span.set(cache="miss")
+        return request() if scheduler is None else scheduler.stream(key, request, tokens)
 
-Focus on confidence building and hireable skills for Auckland IT market."""
-}
+    if cache is None:
+        return telemetry.traced(span, stream())
+    return telemetry.traced(span, cache.stream_or_compute(agent_name, cache_prompt, MODEL, TEMPERATURE, max_tokens,
+                                                          stream, refresh=refresh))
 
 # Streamlit UI
 st.title("👨‍🏫 AI Teaching Faculty Team")
@@ -97,10 +156,35 @@ with st.sidebar:
     st.title("🔑 Setup")
     st.session_state['openai_api_key'] = st.text_input("OpenAI API Key", type="password")
     st.info("Get your key from: https://platform.openai.com/api-keys")
+    max_concurrency = st.slider(
+        "⚡ Agents running at once", 1, DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY,
+        help="Lower this if you hit OpenAI rate limits. 1 runs the faculty one after another."
+    )
+    stream_answers = st.checkbox("✨ Stream answers as they are written", value=True)
+    refresh_cache = st.checkbox("🔄 Regenerate (ignore cached answers)")
+    token_budget = st.number_input(
+        "🎯 Token budget per deploy (0 = no limit)", min_value=0, value=0, step=500,
+        help="Prompt plus answer tokens for all four agents. Answers are shortened and prompts trimmed to fit."
+    )
+    latency_budget = st.number_input(
+        "⏱️ Seconds per answer (0 = no limit)", min_value=0, value=0, step=5,
+        help="Caps answer length so each agent is expected to finish in this time."
+    )
+    cache_stats = get_response_cache().stats()
+    st.caption(
+        f"💾 Cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+        f"({cache_stats['hit_ratio']:.0%}) · {cache_stats['entries']} saved answers"
+    )
+    show_performance = performance_toggle()
+    scheduler_stats = get_request_scheduler().stats()
+    st.caption(
+        f"🚦 Requests: {scheduler_stats.calls - scheduler_stats.coalesced} sent, "
+        f"{scheduler_stats.coalesced} shared with identical ones · {scheduler_stats.retries} retried "
+        f"({scheduler_stats.rate_limited} rate-limited) · breaker {scheduler_stats.breaker}"
+    )
 
 if not st.session_state['openai_api_key']:
-    st.error("Please enter your OpenAI API key in the sidebar.")
-    st.stop()
+    st.warning("Enter your OpenAI API key in the sidebar to generate new topics. Pre-generated topics work without one.")
 
 # Student profile info
 st.info("""
@@ -120,6 +204,9 @@ st.session_state['topic'] = st.text_input(
 if st.button("🚀 Deploy Your Teaching Faculty", type="primary"):
     if not st.session_state['topic']:
         st.error("Please enter a topic to learn about.")
+    elif not st.session_state['openai_api_key'] and get_topic_packs().latest(st.session_state['topic'], SIMPLE_APP,
+                                                                            prompts_fingerprint()) is None:
+        st.error("This topic hasn't been pre-generated. Please enter your OpenAI API key in the sidebar.")
     else:
         st.success(f"Deploying AI Faculty for: **{st.session_state['topic']}**")
         
@@ -133,26 +220,96 @@ if st.button("🚀 Deploy Your Teaching Faculty", type="primary"):
             ("Teaching_Assistant", tab4, "✍️ Creating practice materials...")
         ]
         
+        # Show a loading message in every tab, then fill each one as its answer arrives
+        placeholders = {}
         for agent_name, tab, loading_text in agents:
-            with tab:
-                with st.spinner(loading_text):
-                    prompt = AGENT_PROMPTS[agent_name].format(topic=st.session_state['topic'])
-                    response = call_openai_api(prompt, st.session_state['openai_api_key'])
-                    
+            placeholders[agent_name] = tab.empty()
+            placeholders[agent_name].info(loading_text)
+
+        topic = st.session_state['topic']
+        api_key = st.session_state['openai_api_key']
+        cache = get_response_cache()
+        scheduler = get_request_scheduler()
+        plan = assemble_prompts(topic, [agent_name for agent_name, _, _ in agents],
+                                max_total_tokens=token_budget or None, latency_budget=latency_budget or None)
+
+        def make_job(agent_name):
+            prompt = plan.prompts[agent_name]
+            options = dict(cache=cache, refresh=refresh_cache, system=plan.system, max_tokens=plan.max_tokens,
+                           scheduler=scheduler)
+            if stream_answers:
+                return lambda: stream_openai_api(prompt, api_key, agent_name, **options)
+            return lambda: [call_openai_api(prompt, api_key, agent_name, **options)]
+
+        # Pre-generated topics are served from a pack of the current prompts; "Regenerate" asks the faculty again
+        pack = None if refresh_cache else get_topic_packs().latest(topic, SIMPLE_APP, prompts_fingerprint())
+        if pack is not None:
+            jobs = {agent_name: (lambda text=pack.answers[agent_name]: [text]) for agent_name, _, _ in agents}
+        else:
+            jobs = {agent_name: make_job(agent_name) for agent_name, _, _ in agents}
+
+        writer = get_document_writer()
+        index = get_search_index()
+        exports = []
+
+        # Per-agent spans come from call_openai_api / stream_openai_api; this one covers rendering too
+        with telemetry.span("deploy", app="simple", topic=topic, pack=pack is not None):
+            for result in dispatch_streaming(jobs, max_concurrency=max_concurrency):
+                agent_name = result.agent_name
+                if isinstance(result, DispatchDelta):
+                    placeholders[agent_name].markdown(result.text + " ▌")
+                    continue
+                # The download below uses the text assembled from the same stream
+                response = result.content if result.error is None else f"Error: {result.error}"
+
+                with placeholders[agent_name].container():
                     if not response.startswith("Error"):
                         st.markdown(response)
-                        
-                        # Download button for each response
-                        filename = f"{agent_name}_{st.session_state['topic'].replace(' ', '_')}_{datetime.datetime.now().strftime('%Y%m%d_%H%M')}.md"
+                    
+                        # Download button for each response, served from the file the writer saves
+                        filename = report_filename(agent_name, topic)
+                        path = export_path(DEFAULT_EXPORT_DIR, filename)
+                        saved = writer.submit(save_report, path, agent_name, topic, response, index)
+                        exports.append((filename, path))
                         st.download_button(
                             label=f"📥 Download {agent_name.replace('_', ' ')} Report",
-                            data=response,
+                            data=lambda saved=saved: read_export(saved),
                             file_name=filename,
                             mime="text/markdown"
                         )
                     else:
                         st.error(response)
 
+        if exports:
+            # Queued after the reports, so it zips them once they are on disk
+            bundle = export_path(DEFAULT_EXPORT_DIR, report_filename("Faculty", topic, ".zip"))
+            bundled = writer.bundle(bundle, exports)
+            writer.submit(prune_exports, index)
+            st.download_button(
+                label="📦 Download all reports (.zip)",
+                data=lambda bundled=bundled: read_export(bundled),
+                file_name=os.path.basename(bundle),
+                mime="application/zip"
+            )
+
+        report = plan.report
+        if pack is not None:
+            generated = datetime.datetime.fromtimestamp(pack.created).strftime('%Y-%m-%d')
+            st.caption(f"📦 Pre-generated topic pack v{pack.version} ({generated}) · no tokens used")
+        else:
+            st.caption(
+                f"🧮 {report['input_tokens']} prompt tokens ({report['shared_prefix_tokens']}-token shared system message"
+                + (f", {report['prefix_reuse_tokens']} reusable from the prompt cache" if report['prefix_reuse_tokens'] else "")
+                + f") · answers capped at {report['max_tokens']} tokens · {report['tokens_saved']} tokens saved by the budget"
+            )
+            if report['trimmed_sections']:
+                st.caption("✂️ Trimmed to fit: " + ", ".join(report['trimmed_sections']))
+            if report['over_budget']:
+                st.warning("The budget is too small for useful answers; sent the shortest prompts instead.")
+
+if show_performance:
+    performance_panel()
+
 # Footer
 st.markdown("---")
 st.markdown("### 👥 Your AI Teaching Faculty:")
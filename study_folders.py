@@ -0,0 +1,115 @@
+"""Create (or re-sync) the MDS study folder tree from a compact spec.
+
+    python study_folders.py --root ~/MDS --dry-run
+    python study_folders.py --root ~/MDS
+    python study_folders.py --root ~/MDS --spec my_courses.json
+
+The default spec reproduces the tree the old Create_MDS_Study_Folders.ps1
+script built: every course gets Week_01..Week_16, each with the same five
+subfolders, plus a few top-level folders.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+DEFAULT_ROOT = os.path.join(os.path.expanduser("~"), "MDS")
+
+DEFAULT_SPEC = {
+    "courses": [
+        "Programming_Fundamentals",
+        "Web_Development",
+        "Database_Design",
+        "UX_UI_Design",
+        "Project_Management",
+        "Networking_Security",
+        "Cybersecurity_Principles_CBS131_PC4774",
+        "Introduction_to_Cloud_Computing_CLD101_PCXXXX",
+        "Data_and_Networking_MIS102_PC4774",
+        "Algorithms_and_Data_Structures_ADS103_PC4133",
+    ],
+    "weeks": 16,
+    "week_folders": ["Lessons", "Assignments", "Code_Examples", "Resources", "Cheat_Sheets"],
+    "top_level_folders": ["Quick_Reference", "Assignments", "Portfolio_Projects"],
+}
+
+def load_spec(path=None):
+    """Load a JSON spec, filling anything it leaves out from DEFAULT_SPEC."""
+    spec = dict(DEFAULT_SPEC)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            spec.update(json.load(f))
+    return spec
+
+def plan_tree(spec):
+    """Return every directory in the spec as a relative path, parents before children."""
+    paths = []
+    for course in spec["courses"]:
+        paths.append(course)
+        for week in range(1, spec["weeks"] + 1):
+            week_dir = os.path.join(course, f"Week_{week:02d}")
+            paths.append(week_dir)
+            paths.extend(os.path.join(week_dir, sub) for sub in spec["week_folders"])
+    paths.extend(spec["top_level_folders"])
+    return paths
+
+def existing_dirs(root, max_depth):
+    """Relative paths of directories already under `root`, from one walk no deeper than the spec."""
+    found = set()
+    if not os.path.isdir(root):
+        return found
+    root_depth = root.rstrip(os.sep).count(os.sep)
+    for dirpath, dirnames, _ in os.walk(root):
+        depth = dirpath.rstrip(os.sep).count(os.sep) - root_depth
+        for name in dirnames:
+            found.add(os.path.relpath(os.path.join(dirpath, name), root))
+        if depth + 1 >= max_depth:
+            # Deeper levels can't contain anything the spec asks for
+            dirnames[:] = []
+    return found
+
+def diff_tree(root, spec):
+    """Return (missing, existing) relative paths for the spec under `root`."""
+    planned = plan_tree(spec)
+    max_depth = max(path.count(os.sep) for path in planned) + 1
+    present = existing_dirs(root, max_depth)
+    missing = [path for path in planned if path not in present]
+    existing = [path for path in planned if path in present]
+    return missing, existing
+
+def sync_tree(root, spec, dry_run=False):
+    """Create every missing directory of the spec under `root`; returns the relative paths created."""
+    missing, _ = diff_tree(root, spec)
+    if dry_run:
+        return missing
+    os.makedirs(root, exist_ok=True)
+    for path in missing:
+        # Parents are planned before children, so a plain mkdir is enough
+        os.mkdir(os.path.join(root, path))
+    return missing
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Create or re-sync the MDS study folder tree.")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help=f"where the tree lives (default: {DEFAULT_ROOT})")
+    parser.add_argument("--spec", help="JSON file with courses, weeks, week_folders and top_level_folders")
+    parser.add_argument("--dry-run", action="store_true", help="show which folders would be created and exit")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary line")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    spec = load_spec(args.spec)
+    start = time.perf_counter()
+    created = sync_tree(args.root, spec, dry_run=args.dry_run)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if not args.quiet:
+        for path in created:
+            print(f"+ {os.path.join(args.root, path)}")
+    total = len(plan_tree(spec))
+    verb = "Would create" if args.dry_run else "Created"
+    print(f"{verb} {len(created)} of {total} folders under {args.root} "
+          f"({total - len(created)} already exist) in {elapsed_ms:.1f} ms", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+
+class QuizRecord:
+    """One quiz question, stored without a per-question dict."""
+    __slots__ = ("question", "options", "correct")
+
+    def __init__(self, question, options, correct):
+        self.question = question
+        # Options and answers repeat across thousands of questions; share one copy
+        self.options = tuple(sys.intern(str(opt)) for opt in options)
+        self.correct = sys.intern(str(correct))
+
+    def as_dict(self):
+        return {"question": self.question, "options": list(self.options), "correct": self.correct}
+
+class LectureRecord:
+    """Notes and quiz for one lecture."""
+    __slots__ = ("notes", "quiz")
+
+    def __init__(self, notes, quiz):
+        self.notes = tuple(notes)
+        self.quiz = tuple(QuizRecord(q["question"], q["options"], q["correct"]) for q in quiz)
+
+class MemoryStore:
+    """In-process store of compact __slots__ records."""
+
+    backend = "memory"
+
+    def __init__(self):
+        self._records = {}
+        self._fingerprints = {}
+        self._statistics = {}
+        self._course_hashes = {}
+
+    def put(self, lecture_id, notes, quiz):
+        self._records[lecture_id] = LectureRecord(notes, quiz)
+
+    def put_many(self, items):
+        for lecture_id, notes, quiz in items:
+            self.put(lecture_id, notes, quiz)
+
+    def get_notes(self, lecture_id):
+        """Return the notes for a lecture, or None if it has not been processed."""
+        record = self._records.get(lecture_id)
+        return None if record is None else list(record.notes)
+
+    def get_quiz(self, lecture_id):
+        """Return the quiz for a lecture as a list of dicts, or None if it has not been processed."""
+        record = self._records.get(lecture_id)
+        return None if record is None else [q.as_dict() for q in record.quiz]
+
+    def get_fingerprint(self, lecture_id):
+        """Return the (content_hash, stat_signature) recorded for a lecture, or None."""
+        return self._fingerprints.get(lecture_id)
+
+    def set_fingerprints(self, items):
+        """Record (lecture_id, content_hash, stat_signature) for processed lectures."""
+        for lecture_id, content_hash, stat_signature in items:
+            self._fingerprints[lecture_id] = (content_hash, stat_signature)
+
+    def get_statistics(self, lecture_id):
+        """Return the (content_hash, terms, term counts) recorded for a lecture, or None."""
+        return self._statistics.get(lecture_id)
+
+    def set_statistics(self, items):
+        """Record (lecture_id, content_hash, terms, term counts) from the batch statistics pass."""
+        for lecture_id, content_hash, terms, counts in items:
+            self._statistics[lecture_id] = (content_hash, list(terms), Counter(counts))
+
+    def get_course_hash(self, course):
+        """Return the hash of the course statistics its stored lectures were generated with, or None."""
+        return self._course_hashes.get(course)
+
+    def set_course_hashes(self, items):
+        """Record (course, statistics_hash) once every lecture of the course is stored."""
+        self._course_hashes.update(items)
+
+    def lecture_ids(self):
+        return list(self._records)
+
+    def __contains__(self, lecture_id):
+        return lecture_id in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def memory_bytes(self):
+        """Approximate bytes held by the stored records (shared interned strings counted once)."""
+        seen = set()
+
+        def size(obj):
+            if id(obj) in seen:
+                return 0
+            seen.add(id(obj))
+            return sys.getsizeof(obj)
+
+        total = size(self._records)
+        for lecture_id, record in self._records.items():
+            total += size(lecture_id) + size(record) + size(record.notes) + size(record.quiz)
+            total += sum(size(note) for note in record.notes)
+            for q in record.quiz:
+                total += size(q) + size(q.question) + size(q.options) + size(q.correct)
+                total += sum(size(opt) for opt in q.options)
+        return total
+
+    def close(self):
+        pass
+
+class SQLiteStore:
+    """Disk-backed store; lectures survive restarts and are looked up by their primary-key index."""
+
+    backend = "sqlite"
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS lectures (
+                lecture_id TEXT PRIMARY KEY,
+                notes TEXT NOT NULL,
+                quiz TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        # Manifest of what each stored lecture was generated from
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS manifest (
+                lecture_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                stat_signature TEXT
+            ) WITHOUT ROWID
+        """)
+        # Per-lecture input to the course statistics, so unchanged lectures aren't re-read to rebuild them
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS statistics (
+                lecture_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                terms TEXT NOT NULL,
+                counts TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        # Course statistics each course's stored lectures were generated with
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS courses (
+                course TEXT PRIMARY KEY,
+                statistics_hash TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+
+    def put(self, lecture_id, notes, quiz):
+        self.put_many([(lecture_id, notes, quiz)])
+
+    def put_many(self, items):
+        """Store many lectures in a single transaction."""
+        rows = [(lecture_id, json.dumps(list(notes)), json.dumps(list(quiz))) for lecture_id, notes, quiz in items]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO lectures VALUES (?, ?, ?)", rows)
+            self._conn.commit()
+
+    def _get(self, column, lecture_id):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {column} FROM lectures WHERE lecture_id = ?", (lecture_id,)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def get_notes(self, lecture_id):
+        """Return the notes for a lecture, or None if it has not been processed."""
+        return self._get("notes", lecture_id)
+
+    def get_quiz(self, lecture_id):
+        """Return the quiz for a lecture as a list of dicts, or None if it has not been processed."""
+        return self._get("quiz", lecture_id)
+
+    def get_fingerprint(self, lecture_id):
+        """Return the (content_hash, stat_signature) recorded for a lecture, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, stat_signature FROM manifest WHERE lecture_id = ?", (lecture_id,)
+            ).fetchone()
+        return None if row is None else tuple(row)
+
+    def set_fingerprints(self, items):
+        """Record (lecture_id, content_hash, stat_signature) for processed lectures in one transaction."""
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO manifest VALUES (?, ?, ?)", list(items))
+            self._conn.commit()
+
+    def get_statistics(self, lecture_id):
+        """Return the (content_hash, terms, term counts) recorded for a lecture, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, terms, counts FROM statistics WHERE lecture_id = ?", (lecture_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        counts = Counter({(term, kind): count for term, kind, count in json.loads(row[2])})
+        return row[0], json.loads(row[1]), counts
+
+    def set_statistics(self, items):
+        """Record (lecture_id, content_hash, terms, term counts) from the batch statistics pass."""
+        rows = [
+            (lecture_id, content_hash, json.dumps(list(terms)),
+             json.dumps([[term, kind, count] for (term, kind), count in counts.items()]))
+            for lecture_id, content_hash, terms, counts in items
+        ]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO statistics VALUES (?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def get_course_hash(self, course):
+        """Return the hash of the course statistics its stored lectures were generated with, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT statistics_hash FROM courses WHERE course = ?", (course,)).fetchone()
+        return None if row is None else row[0]
+
+    def set_course_hashes(self, items):
+        """Record (course, statistics_hash) once every lecture of the course is stored."""
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO courses VALUES (?, ?)", list(items))
+            self._conn.commit()
+
+    def lecture_ids(self):
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT lecture_id FROM lectures ORDER BY lecture_id")]
+
+    def __contains__(self, lecture_id):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM lectures WHERE lecture_id = ?", (lecture_id,)
+            ).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM lectures").fetchone()[0]
+
+    def memory_bytes(self):
+        """Upper bound on the bytes SQLite keeps in its page cache for this connection."""
+        with self._lock:
+            page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+            cache_pages = self._conn.execute("PRAGMA cache_size").fetchone()[0]
+            page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        # Negative cache_size is a limit in KiB; the cache never exceeds the database itself
+        cache_bytes = -cache_pages * 1024 if cache_pages < 0 else cache_pages * page_size
+        return min(cache_bytes, page_count * page_size)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def open_store(spec):
+    """Open a store from a CLI spec: "memory" or "sqlite:PATH"."""
+    if spec in (None, "", "memory"):
+        return MemoryStore()
+    if spec.startswith("sqlite:"):
+        return SQLiteStore(spec[len("sqlite:"):])
+    raise ValueError(f"Unknown store {spec!r}; use 'memory' or 'sqlite:PATH'")
+
+def store_report(store, sample_size=1000):
+    """Measure lookup latency over up to `sample_size` stored lectures and report memory use."""
+    lecture_ids = store.lecture_ids()[:sample_size]
+    timings = []
+    for lecture_id in lecture_ids:
+        start = time.perf_counter()
+        store.get_notes(lecture_id)
+        store.get_quiz(lecture_id)
+        timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+
+    def percentile(p):
+        return timings[min(len(timings) - 1, int(p * len(timings)))] if timings else 0.0
+
+    return {
+        "backend": store.backend,
+        "lectures": len(store),
+        "lookup_us_p50": round(percentile(0.50), 1),
+        "lookup_us_p95": round(percentile(0.95), 1),
+        "memory_bytes": store.memory_bytes(),
+    }
@@ -0,0 +1,158 @@
+"""Extractive summarization: TF-IDF sentence vectors ranked with TextRank.
+
+Sentences are rows of a sparse TF-IDF matrix V, kept as COO arrays. TextRank
+runs on the cosine-similarity graph S = V V^T, but S is never built: each
+power-iteration step computes S x as V (V^T x) with two bincount scatter-adds.
+That is O(non-zeros) per step rather than O(sentences^2), so a 100k-sentence
+transcript ranks in about a second.
+
+IDF comes from the lecture's course once enough of its lectures are known
+(see course_registry.py for how course statistics are kept).
+"""
+import re
+
+import numpy as np
+
+from course_registry import CourseRegistry, LectureStatistics
+
+TOKEN = re.compile(r"[a-z0-9][a-z0-9'+#-]*")
+STOPWORDS = frozenset("""
+a an and are as at be but by can do does for from has have how i if in into is it its
+of on or so than that the their them then there these they this to was we were what when
+which while who will with you your our not no also just more most very can't it's
+""".split())
+
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+# Course-level IDF is used once this many lectures of the course have been seen
+MIN_COURSE_DOCUMENTS = 3
+
+def tokenize(sentence):
+    return [t for t in TOKEN.findall(sentence.lower()) if t not in STOPWORDS]
+
+def document_terms(sentences):
+    """Distinct terms of one lecture, as counted in its course's document frequencies."""
+    return sorted({t for sentence in sentences for t in tokenize(sentence)})
+
+class CourseVocabulary(LectureStatistics):
+    """Term ids and document frequencies shared by every lecture of one course.
+
+    Term ids are stable, so vectors built for one lecture stay comparable with
+    the next. A lecture's part is the array of its distinct term ids.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.index = {}
+        self.doc_freq = np.zeros(1024, dtype=np.int64)
+        self.documents = 0
+
+    def term_ids(self, tokens):
+        index = self.index
+        ids = np.fromiter((index.setdefault(t, len(index)) for t in tokens), dtype=np.int64, count=len(tokens))
+        if len(index) > len(self.doc_freq):
+            grown = np.zeros(max(len(index), 2 * len(self.doc_freq)), dtype=np.int64)
+            grown[:len(self.doc_freq)] = self.doc_freq
+            self.doc_freq = grown
+        return ids
+
+    def _apply(self, ids, sign):
+        self.doc_freq[ids] += sign
+        self.documents += sign
+
+    def idf(self, size):
+        return smooth_idf(self.documents, self.doc_freq[:size])
+
+def smooth_idf(documents, doc_freq):
+    return np.log((1.0 + documents) / (1.0 + doc_freq)) + 1.0
+
+_vocabularies = CourseRegistry(CourseVocabulary)
+
+def course_vocabulary(course):
+    """Return the cached vocabulary for a course (created on first use)."""
+    return _vocabularies.get(course)
+
+def install_vocabulary(course, vocabulary):
+    """Replace the cached vocabulary for a course."""
+    _vocabularies.install(course, vocabulary)
+
+def build_vocabulary(lectures):
+    """A CourseVocabulary of (lecture, terms) pairs, with term ids assigned in the order given."""
+    vocabulary = CourseVocabulary()
+    for lecture, terms in lectures:
+        vocabulary.set_lecture(lecture, np.unique(vocabulary.term_ids(terms)))
+    return vocabulary
+
+def sentence_matrix(sentences, vocabulary, lecture=None):
+    """Build the row-normalised TF-IDF matrix of `sentences` as COO arrays (rows, cols, data).
+
+    With a `lecture` key the sentences are recorded as that lecture of the
+    course before IDF is taken; without one the course statistics are only read.
+    """
+    tokenized = [tokenize(s) for s in sentences]
+    lengths = np.fromiter(map(len, tokenized), dtype=np.int64, count=len(tokenized))
+    flat = [t for tokens in tokenized for t in tokens]
+    rows = np.repeat(np.arange(len(sentences), dtype=np.int64), lengths)
+    with vocabulary.lock:
+        cols = vocabulary.term_ids(flat)
+        if lecture is not None:
+            vocabulary.set_lecture(lecture, np.unique(cols))
+        size = len(vocabulary.index)
+        course_idf = vocabulary.idf(size) if vocabulary.documents >= MIN_COURSE_DOCUMENTS else None
+
+    # Collapse repeated (sentence, term) pairs into term counts
+    keys, counts = np.unique(rows * size + cols, return_counts=True)
+    rows, cols = keys // size, keys % size
+    if course_idf is None:
+        # Too few lectures for course statistics: treat the lecture's sentences as the documents
+        idf = smooth_idf(len(sentences), np.bincount(cols, minlength=size))
+    else:
+        idf = course_idf
+    data = counts * idf[cols]
+
+    norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=len(sentences)))
+    data = data / norms[rows]
+    return rows, cols, data
+
+def textrank_scores(rows, cols, data, n_sentences):
+    """TextRank centrality over the implicit cosine-similarity graph V V^T (self-loops removed)."""
+    n_terms = int(cols.max()) + 1 if len(cols) else 0
+
+    def similarity_times(x):
+        # (V V^T - I) x, using only the sparse entries of V; empty rows have no self-loop to remove
+        term_totals = np.bincount(cols, weights=data * x[rows], minlength=n_terms)
+        product = np.bincount(rows, weights=data * term_totals[cols], minlength=n_sentences)
+        return product - x * has_terms
+
+    has_terms = np.bincount(rows, minlength=n_sentences) > 0
+    degree = similarity_times(np.ones(n_sentences))
+    inverse_degree = np.divide(1.0, degree, out=np.zeros(n_sentences), where=degree > 1e-12)
+
+    scores = np.full(n_sentences, 1.0 / n_sentences)
+    for _ in range(MAX_ITERATIONS):
+        updated = (1.0 - DAMPING) / n_sentences + DAMPING * similarity_times(scores * inverse_degree)
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            return updated
+        scores = updated
+    return scores
+
+def rank_sentences(sentences, max_sentences, course=None, lecture=None):
+    """Return the `max_sentences` most central sentences, in their original order.
+
+    `course` selects the course vocabulary for IDF; `lecture` (its lecture id)
+    records these sentences in it, replacing any earlier version of the lecture.
+    """
+    if max_sentences <= 0:
+        return []
+    if len(sentences) <= max_sentences:
+        return list(sentences)
+    # Lectures without a course get a throwaway vocabulary and per-lecture IDF
+    if course is None:
+        vocabulary, lecture = CourseVocabulary(), "lecture"
+    else:
+        vocabulary = course_vocabulary(course)
+    rows, cols, data = sentence_matrix(sentences, vocabulary, lecture)
+    scores = textrank_scores(rows, cols, data, len(sentences))
+    top = np.argpartition(-scores, max_sentences - 1)[:max_sentences]
+    return [sentences[i] for i in np.sort(top)]
@@ -1,9 +1,17 @@
 import streamlit as st
-from agno.agent import Agent, RunResponse
-from agno.models.openai import OpenAIChat
-from agno.tools.serpapi import SerpApiTools
+from agno.agent import RunResponse
 import os
 import datetime
+from document_export import DocumentWriter, atomic_write, report_filename
+from faculty_dispatch import DEFAULT_MAX_CONCURRENCY, DispatchDelta, dispatch_streaming
+from faculty_prompts import MAX_TOKENS, MIN_OUTPUT_TOKENS, count_tokens, output_cap
+from faculty_team import agent_cache_prompt, build_faculty_agents, team_fingerprint, team_prompt
+from request_scheduler import RequestScheduler, flight_key
+from response_cache import ResponseCache, make_cache_key
+from search_index import KINDS, SearchIndex
+from topic_packs import TEAMS_APP, TopicPacks
+import telemetry
+from telemetry_panel import performance_panel, performance_toggle
 
 # Set page configuration
 st.set_page_config(page_title="👨‍🏫 AI Teaching Agent Team", layout="centered")
@@ -17,22 +25,117 @@ if 'topic' not in st.session_state:
     st.session_state['topic'] = ''
 
 # Function to create local documents (temporary solution)
-def create_local_document(agent_name, topic, content):
-    """Create local markdown file with agent response"""
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_topic = topic.replace(' ', '_').replace('/', '_')
-    filename = f"{agent_name}_{safe_topic}_{timestamp}.md"
+def create_local_document(agent_name, topic, content, index=None, filename=None):
+    """Create local markdown file with agent response (and add it to the search index if given)
+
+    The file is written under a temporary name and renamed into place, so it is never seen half-written.
+    Deploys hand this to the background document writer rather than calling it directly.
+    """
+    filename = filename or report_filename(agent_name, topic)
+    
+    def write(f):
+        f.write(f"# {agent_name} Report - {topic}\n\n")
+        f.write(f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write("---\n\n")
+        f.write(content)
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"# {agent_name} Report - {topic}\n\n")
-            f.write(f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("---\n\n")
-            f.write(content)
+        with telemetry.span("document.write", agent=agent_name, indexed=index is not None) as span:
+            atomic_write(filename, write)
+            if span:
+                span.set(bytes=os.path.getsize(filename))
+            if index is not None:
+                index.add_report(filename, agent_name, topic, content)
         return filename
     except Exception as e:
         return f"Error creating file: {e}"
 
+@st.cache_resource
+def get_response_cache():
+    """One on-disk response cache shared by every session of this app"""
+    return ResponseCache()
+
+@st.cache_resource
+def get_search_index():
+    """Search index over saved reports and processed lectures, shared by every session"""
+    return SearchIndex()
+
+@st.cache_resource
+def get_request_scheduler():
+    """One rate limiter, retry policy and circuit breaker for every session of this app"""
+    return RequestScheduler()
+
+@st.cache_resource
+def get_document_writer():
+    """Background writer for saved reports and bundles, shared by every session"""
+    return DocumentWriter()
+
+@st.cache_resource
+def get_topic_packs():
+    """Pre-generated answers for popular topics (see topic_packs.py), served without calling OpenAI"""
+    return TopicPacks()
+
+def agent_request_key_and_tokens(agent, message):
+    """Coalescing key and rate-limit token cost of one agent run"""
+    cache_prompt = agent_cache_prompt(agent, message)
+    max_tokens = agent.model.max_tokens or MAX_TOKENS
+    key = flight_key(make_cache_key(agent.name, cache_prompt, agent.model.id, agent.model.temperature,
+                                    agent.model.max_tokens), agent.model.api_key)
+    return key, count_tokens(cache_prompt) + max_tokens
+
+def agent_span(agent, message, streaming):
+    """Telemetry span for one agent answer; token counts are only taken while recording"""
+    span = telemetry.span("agent.run", agent=agent.name, streaming=streaming, cache="hit")
+    if span:
+        span.set(prompt_tokens=count_tokens(agent_cache_prompt(agent, message)),
+                 max_tokens=agent.model.max_tokens or MAX_TOKENS)
+    return span
+
+def run_agent_cached(agent, message, cache, refresh=False, scheduler=None):
+    """Run an agent, serving repeated messages from the response cache"""
+    span = agent_span(agent, message, streaming=False)
+
+    def compute():
+        span.set(cache="miss")
+        if scheduler is None:
+            return agent.run(message, stream=False).content
+        key, tokens = agent_request_key_and_tokens(agent, message)
+        return scheduler.call(key, lambda: agent.run(message, stream=False).content, tokens)
+
+    with span:
+        content = cache.get_or_compute(
+            agent.name, agent_cache_prompt(agent, message), agent.model.id,
+            agent.model.temperature, agent.model.max_tokens,
+            compute,
+            refresh=refresh
+        )
+        if span:
+            span.set(response_bytes=len(content.encode("utf-8")), completion_tokens=count_tokens(content))
+    return RunResponse(content=content)
+
+def stream_agent_cached(agent, message, cache, refresh=False, scheduler=None):
+    """Yield an agent's answer as text deltas, serving repeated messages from the response cache"""
+    def run():
+        for chunk in agent.run(message, stream=True):
+            if chunk.content:
+                yield chunk.content
+
+    span = agent_span(agent, message, streaming=True)
+
+    def stream():
+        span.set(cache="miss")
+        if scheduler is None:
+            return run()
+        key, tokens = agent_request_key_and_tokens(agent, message)
+        return scheduler.stream(key, run, tokens)
+
+    return telemetry.traced(span, cache.stream_or_compute(
+        agent.name, agent_cache_prompt(agent, message), agent.model.id,
+        agent.model.temperature, agent.model.max_tokens,
+        stream,
+        refresh=refresh
+    ))
+
 # Streamlit sidebar for API keys
 with st.sidebar:
     st.title("API Keys Configuration")
@@ -40,123 +143,62 @@ with st.sidebar:
     st.session_state['serpapi_api_key'] = st.text_input("Enter your SerpAPI Key (optional)", type="password").strip()
     
     st.info("Note: Documents will be saved locally as markdown files until Google Docs integration is fixed.")
+    max_concurrency = st.slider(
+        "⚡ Agents running at once", 1, DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY,
+        help="Lower this if you hit OpenAI rate limits. 1 runs the faculty one after another."
+    )
+    stream_answers = st.checkbox("✨ Stream answers as they are written", value=True)
+    refresh_cache = st.checkbox("🔄 Regenerate (ignore cached answers)")
+    token_budget = st.number_input(
+        "🎯 Token budget per deploy (0 = no limit)", min_value=0, value=0, step=500,
+        help="Prompt plus answer tokens for all four agents. Answers are shortened to fit."
+    )
+    latency_budget = st.number_input(
+        "⏱️ Seconds per answer (0 = no limit)", min_value=0, value=0, step=5,
+        help="Caps answer length so each agent is expected to finish in this time."
+    )
+    cache_stats = get_response_cache().stats()
+    st.caption(
+        f"💾 Cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+        f"({cache_stats['hit_ratio']:.0%}) · {cache_stats['entries']} saved answers"
+    )
+    show_performance = performance_toggle()
+    scheduler_stats = get_request_scheduler().stats()
+    st.caption(
+        f"🚦 Requests: {scheduler_stats.calls - scheduler_stats.coalesced} sent, "
+        f"{scheduler_stats.coalesced} shared with identical ones · {scheduler_stats.retries} retried "
+        f"({scheduler_stats.rate_limited} rate-limited) · breaker {scheduler_stats.breaker}"
+    )
+
+    st.subheader("🔎 Search")
+    search_query = st.text_input("Search reports, notes and quizzes")
+    search_kind = st.selectbox("Only", ("everything",) + KINDS)
+    if search_query:
+        hits = get_search_index().search(search_query, kind=None if search_kind == "everything" else search_kind)
+        if not hits:
+            st.caption("No matches.")
+        for hit in hits:
+            st.markdown(f"**{hit.title}** · _{hit.kind}_" + (f"  \n`{hit.source}`" if hit.source else ""))
+            st.caption(hit.snippet)
 
 # Validate required API keys
 if not st.session_state['openai_api_key']:
-    st.error("Please enter your OpenAI API key in the sidebar.")
-    st.stop()
+    st.warning("Enter your OpenAI API key in the sidebar to generate new topics. Pre-generated topics work without one.")
 
 # Set the OpenAI API key from session state
 os.environ["OPENAI_API_KEY"] = st.session_state['openai_api_key']
 
-# Create agents with ADHD-friendly instructions for your profile
-professor_agent = Agent(
-    name="Professor_Dr_Sarah_Mitchell",
-    role="Knowledge Foundation Builder for ADHD Adult Learner", 
-    model=OpenAIChat(id="gpt-4o-mini", api_key=st.session_state['openai_api_key']),
-    tools=[],
-    instructions=[
-        """You are Dr. Sarah Mitchell, creating a knowledge base for a 30-year-old male IT student at Media Design School Auckland who has ADHD and has been away from computers for 12 years.
-
-        STUDENT PROFILE:
-        - Returning to tech after 12-year gap
-        - ADHD - needs structure, frequent breaks, bite-sized information
-        - Adult learner - values career relevance and practical applications
-        - Currently studying: Data Structures & Algorithms, Cloud Computing, Data & Networking, Cybersecurity
-
-        CREATE COMPREHENSIVE KNOWLEDGE BASE:
-        1. Start with "Why this matters for your IT career in Auckland"
-        2. Use simple, everyday language with analogies (cars, cooking, etc.)
-        3. Break complex topics into small chunks (2-3 sentences max)
-        4. Include frequent break suggestions
-        5. Connect to real Auckland job opportunities and salaries
-        6. Use ADHD-friendly formatting with lots of white space
-        7. Include confidence-building statements throughout
-        8. Relate to current semester subjects when possible
-
-        Format with clear headers, bullet points, and visual breaks."""
-    ],
-    show_tool_calls=True,
-    markdown=True,
-)
-
-academic_advisor_agent = Agent(
-    name="Academic_Advisor_James_Chen",
-    role="Learning Path Designer for Career Changer",
-    model=OpenAIChat(id="gpt-4o-mini", api_key=st.session_state['openai_api_key']),
-    tools=[],
-    instructions=[
-        """You are James Chen, academic advisor specializing in career transitions for ADHD learners.
-
-        Create a learning roadmap that:
-        1. Acknowledges the student is 30 and changing careers
-        2. Provides realistic timelines with ADHD accommodations
-        3. Breaks learning into 15-30 minute daily sessions
-        4. Includes energy-based scheduling (high/medium/low energy tasks)
-        5. Connects to Auckland job market and salary expectations
-        6. Addresses age concerns positively
-        7. Integrates with current semester subjects
-        8. Includes milestone celebrations and progress tracking
-
-        Format as a week-by-week plan with specific daily tasks."""
-    ],
-    show_tool_calls=True,
-    markdown=True
-)
-
-# Only add SerpAPI if key is provided
-research_tools = []
-if st.session_state['serpapi_api_key']:
-    research_tools.append(SerpApiTools(api_key=st.session_state['serpapi_api_key']))
-
-research_librarian_agent = Agent(
-    name="Research_Librarian_Maria_Rodriguez",
-    role="ADHD-Friendly Resource Curator",
-    model=OpenAIChat(id="gpt-4o-mini", api_key=st.session_state['openai_api_key']),
-    tools=research_tools,
-    instructions=[
-        """You are Maria Rodriguez, expert librarian specializing in ADHD-friendly learning resources.
-
-        Curate resources that:
-        1. Are ADHD-friendly (short videos, interactive content, visual learning)
-        2. Include time estimates for each resource
-        3. Rate difficulty levels clearly
-        4. Focus on Auckland/NZ job market relevance
-        5. Provide multiple learning modalities (visual, hands-on, reading)
-        6. Include both free and premium options
-        7. Connect to current semester tools (AWS, Python, VS, NETCAD)
-        8. Suggest optimal times to use each resource type
-
-        If SerpAPI is available, search for current resources. Otherwise, recommend well-known platforms."""
-    ],
-    show_tool_calls=True,
-    markdown=True,
-)
+@st.cache_resource
+def get_faculty_agents(openai_api_key, serpapi_api_key, max_tokens=None):
+    """Build the four faculty agents (faculty_team.py) once per API key pair and answer cap, reused across reruns"""
+    return build_faculty_agents(openai_api_key, serpapi_api_key, max_tokens)
 
-teaching_assistant_agent = Agent(
-    name="Teaching_Assistant_Alex_Kim",
-    role="Practice Coordinator for Adult ADHD Learner",
-    model=OpenAIChat(id="gpt-4o-mini", api_key=st.session_state['openai_api_key']),
-    tools=research_tools,
-    instructions=[
-        """You are Alex Kim, teaching assistant specializing in hands-on learning for ADHD students.
-
-        Create practice materials that:
-        1. Start with 5-10 minute "quick wins" for immediate satisfaction
-        2. Build to longer projects gradually
-        3. Include step-by-step instructions with visual confirmations
-        4. Provide troubleshooting for common mistakes
-        5. Connect exercises to portfolio building
-        6. Include real-world Auckland business scenarios
-        7. Integrate with semester tools and subjects
-        8. Offer multiple difficulty levels for different energy states
-        9. Include achievement celebrations and progress tracking
-
-        Focus on building confidence while developing hireable skills."""
-    ],
-    show_tool_calls=True,
-    markdown=True,
+professor_agent, academic_advisor_agent, research_librarian_agent, teaching_assistant_agent = get_faculty_agents(
+    st.session_state['openai_api_key'], st.session_state['serpapi_api_key']
 )
+# Packs are only served if these agents (with or without SerpAPI) would have written them
+fingerprint = team_fingerprint((professor_agent, academic_advisor_agent, research_librarian_agent,
+                                teaching_assistant_agent))
 
 # Streamlit main UI
 st.title("👨‍🏫 AI Teaching Faculty Team for ADHD Learners")
@@ -180,34 +222,87 @@ st.session_state['topic'] = st.text_input(
 if st.button("🚀 Deploy Teaching Faculty", type="primary"):
     if not st.session_state['topic']:
         st.error("Please enter a topic.")
+    elif not st.session_state['openai_api_key'] and get_topic_packs().latest(st.session_state['topic'], TEAMS_APP,
+                                                                            fingerprint) is None:
+        st.error("This topic hasn't been pre-generated. Please enter your OpenAI API key in the sidebar.")
     else:
         st.success(f"Deploying AI Teaching Faculty for: **{st.session_state['topic']}**")
         
         # Store responses and filenames
         responses = {}
         filenames = {}
+        saves = {}
+        
+        # Display responses in tabs for better organization
+        tab1, tab2, tab3, tab4 = st.tabs(["🧠 Professor", "🗺️ Academic Advisor", "📚 Research Librarian", "✍️ Teaching Assistant"])
         
-        # Generate responses with loading animations
         agents = [
-            ("Professor", professor_agent, "📚 Creating Knowledge Foundation..."),
-            ("Academic Advisor", academic_advisor_agent, "🗺️ Designing Learning Roadmap..."),
-            ("Research Librarian", research_librarian_agent, "📖 Curating Learning Resources..."),
-            ("Teaching Assistant", teaching_assistant_agent, "✍️ Creating Practice Materials...")
+            ("Professor", professor_agent, tab1, "### Dr. Sarah Mitchell - Knowledge Foundation", "📚 Creating Knowledge Foundation..."),
+            ("Academic Advisor", academic_advisor_agent, tab2, "### James Chen - Learning Roadmap", "🗺️ Designing Learning Roadmap..."),
+            ("Research Librarian", research_librarian_agent, tab3, "### Maria Rodriguez - Resource Library", "📖 Curating Learning Resources..."),
+            ("Teaching Assistant", teaching_assistant_agent, tab4, "### Alex Kim - Practice Materials", "✍️ Creating Practice Materials...")
         ]
         
-        for agent_name, agent, loading_text in agents:
-            with st.spinner(loading_text):
-                response: RunResponse = agent.run(
-                    f"Topic: {st.session_state['topic']}. Remember this is for a 30-year-old ADHD student at Media Design School Auckland changing careers to IT.",
-                    stream=False
-                )
+        # Show a loading message in every tab, then fill each one as its answer arrives
+        placeholders = {}
+        headers = {}
+        for agent_name, _, tab, header, loading_text in agents:
+            placeholders[agent_name] = tab.empty()
+            placeholders[agent_name].info(loading_text)
+            headers[agent_name] = header
+        
+        topic = st.session_state['topic']
+        prompt = team_prompt(topic)
+        cache = get_response_cache()
+        scheduler = get_request_scheduler()
+        input_tokens = [count_tokens("\n".join(agent.instructions) + prompt) for _, agent, _, _, _ in agents]
+        max_tokens = None
+        if token_budget or latency_budget:
+            max_tokens = max(MIN_OUTPUT_TOKENS, output_cap(input_tokens, len(agents), token_budget or None,
+                                                           latency_budget or None))
+            budget_agents = get_faculty_agents(
+                st.session_state['openai_api_key'], st.session_state['serpapi_api_key'], max_tokens
+            )
+            agents = [(name, budget_agent, *rest) for (name, _, *rest), budget_agent in zip(agents, budget_agents)]
+        
+        def make_job(agent):
+            if stream_answers:
+                return lambda: stream_agent_cached(agent, prompt, cache, refresh=refresh_cache, scheduler=scheduler)
+            return lambda: [run_agent_cached(agent, prompt, cache, refresh=refresh_cache, scheduler=scheduler).content]
+        
+        # Pre-generated topics are served from a pack of these agents; "Regenerate" asks the faculty again
+        pack = None if refresh_cache else get_topic_packs().latest(topic, TEAMS_APP, fingerprint)
+        if pack is not None:
+            jobs = {agent_name: (lambda text=pack.answers[agent_name]: [text])
+                    for agent_name, _, _, _, _ in agents}
+        else:
+            jobs = {agent_name: make_job(agent) for agent_name, agent, _, _, _ in agents}
+        
+        # Per-agent spans come from run_agent_cached / stream_agent_cached; this one covers the whole deploy
+        with telemetry.span("deploy", app="teams", topic=topic, pack=pack is not None):
+            for result in dispatch_streaming(jobs, max_concurrency=max_concurrency):
+                agent_name = result.agent_name
+                if isinstance(result, DispatchDelta):
+                    placeholders[agent_name].markdown(f"{headers[agent_name]}\n\n{result.text} ▌")
+                    continue
+                if result.error is not None:
+                    filenames[agent_name] = f"Error: {result.error}"
+                    placeholders[agent_name].error(f"{agent_name} failed: {result.error}")
+                    continue
+            
+                # The saved document uses the text assembled from the same stream
+                response = RunResponse(content=result.content)
                 responses[agent_name] = response
-                
-                # Create local document
-                filename = create_local_document(
-                    agent_name.replace(" ", "_"), 
-                    st.session_state['topic'], 
-                    response.content
+            
+                with placeholders[agent_name].container():
+                    st.markdown(headers[agent_name])
+                    st.markdown(response.content)
+            
+                # Save the document in the background; the name is known now, the write finishes later
+                filename = report_filename(agent_name.replace(" ", "_"), topic)
+                saves[agent_name] = get_document_writer().submit(
+                    create_local_document, agent_name.replace(" ", "_"), topic, response.content,
+                    get_search_index(), filename
                 )
                 filenames[agent_name] = filename
         
@@ -216,29 +311,30 @@ if st.button("🚀 Deploy Teaching Faculty", type="primary"):
         
         st.markdown("### 📄 Generated Documents:")
         for agent_name, filename in filenames.items():
+            save = saves.get(agent_name)
+            # Writes still in the queue are listed now; only ones that already failed are reported
+            if save is not None and save.done() and save.result().startswith("Error"):
+                filename = save.result()
             if not filename.startswith("Error"):
                 st.markdown(f"- **{agent_name}**: `{filename}` 📥")
             else:
                 st.error(f"- **{agent_name}**: {filename}")
-
-        # Display responses in tabs for better organization
-        tab1, tab2, tab3, tab4 = st.tabs(["🧠 Professor", "🗺️ Academic Advisor", "📚 Research Librarian", "✍️ Teaching Assistant"])
-        
-        with tab1:
-            st.markdown("### Dr. Sarah Mitchell - Knowledge Foundation")
-            st.markdown(responses["Professor"].content)
+        if saves:
+            # Queued after the reports, so it zips them once they are on disk
+            bundle = report_filename("Faculty", topic, ".zip")
+            get_document_writer().bundle(bundle, [(filenames[agent_name], filenames[agent_name]) for agent_name in saves])
+            st.markdown(f"- **📦 All reports**: `{bundle}`")
         
-        with tab2:
-            st.markdown("### James Chen - Learning Roadmap")
-            st.markdown(responses["Academic Advisor"].content)
-            
-        with tab3:
-            st.markdown("### Maria Rodriguez - Resource Library")
-            st.markdown(responses["Research Librarian"].content)
-            
-        with tab4:
-            st.markdown("### Alex Kim - Practice Materials")
-            st.markdown(responses["Teaching Assistant"].content)
+        if pack is not None:
+            generated = datetime.datetime.fromtimestamp(pack.created).strftime('%Y-%m-%d')
+            st.caption(f"📦 Pre-generated topic pack v{pack.version} ({generated}) · no tokens used")
+        else:
+            # These agents have no answer cap of their own, so there is no baseline to count savings against
+            budget_note = f" · answers capped at {max_tokens} tokens" if max_tokens else ""
+            st.caption(f"🧮 {sum(input_tokens)} instruction and prompt tokens{budget_note}")
+
+if show_performance:
+    performance_panel()
 
 # Information about the agents
 st.markdown("---")
@@ -254,7 +350,7 @@ st.markdown("""
 
 st.markdown("### 🔧 Troubleshooting:")
 st.markdown("""
-- Documents are currently saved as local markdown files
+- Documents are currently saved as local markdown files (written in the background, plus one zip per deploy)
 - To enable Google Docs: Set up Composio authentication properly
 - SerpAPI is optional - agents work without it
 - All responses are also displayed in the interface above
@@ -0,0 +1,242 @@
+"""Timed spans for agent calls, document writes and lecture processing.
+
+    with telemetry.span("lecture.quiz", lecture_id=lecture_id) as span:
+        quiz = generate_quiz(...)
+        span.set(questions=len(quiz))
+
+Telemetry is off unless MDSIT_TELEMETRY is set ("1" for the default file, or
+a path) or enable() is called. While it is off, span() returns a shared no-op
+span, so an instrumented block costs one global lookup and an empty
+with-statement. Spans are falsy when off: anything expensive to measure
+(token counts, sizes) should be guarded with `if span:`.
+
+While it is on, each finished span is kept in memory for the Streamlit
+Performance panel and appended as one JSON line to the telemetry file. The
+record holds the span name, start time, duration in ms, pid, thread and
+parent span id, plus the span's attributes.
+
+    python telemetry.py summary .faculty_cache/telemetry.jsonl
+"""
+import argparse
+import itertools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+DEFAULT_TELEMETRY_PATH = os.path.join(".faculty_cache", "telemetry.jsonl")
+# Finished spans kept in memory for the in-app panel
+DEFAULT_KEEP = 5000
+
+_sink = None
+_local = threading.local()
+_ids = itertools.count(1)
+
+class _NullSpan:
+    """What span() returns while telemetry is off: does nothing, is falsy."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __bool__(self):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+    def add(self, key, amount=1):
+        pass
+
+NULL_SPAN = _NullSpan()
+
+class Span:
+    def __init__(self, sink, name, attrs):
+        self.sink = sink
+        self.name = name
+        self.attrs = attrs
+        self.id = next(_ids)
+        self.parent = None
+        self.start = None
+        self._stack = None
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.parent = stack[-1].id if stack else None
+        stack.append(self)
+        # Kept so a generator span closed from another thread leaves the right stack
+        self._stack = stack
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        if self in self._stack:
+            self._stack.remove(self)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        record = {"span": self.name, "start": round(self.wall_start, 6), "ms": round(elapsed * 1000, 3),
+                  "id": self.id, "parent": self.parent, "pid": os.getpid(),
+                  "thread": threading.current_thread().name}
+        record.update(self.attrs)
+        self.sink.emit(record)
+        return False
+
+    def set(self, **attrs):
+        """Attach attributes (token counts, cache status, sizes...) to the span."""
+        self.attrs.update(attrs)
+
+    def add(self, key, amount=1):
+        self.attrs[key] = self.attrs.get(key, 0) + amount
+
+class Sink:
+    """Finished spans: a bounded in-memory list plus an optional JSONL file."""
+
+    def __init__(self, path=None, keep=DEFAULT_KEEP):
+        self.path = path
+        self.records = deque(maxlen=keep)
+        self.lock = threading.Lock()
+        self.file = None
+        if path:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Line-buffered appends, so batch worker processes can share the file
+            self.file = open(path, "a", encoding="utf-8", buffering=1)
+
+    def emit(self, record):
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n" if self.file else None
+        with self.lock:
+            self.records.append(record)
+            if self.file is not None:
+                self.file.write(line)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+def enable(path=DEFAULT_TELEMETRY_PATH, keep=DEFAULT_KEEP):
+    """Start recording spans (to `path` too, unless it is None); a no-op if already on."""
+    global _sink
+    if _sink is None:
+        _sink = Sink(path, keep)
+    return _sink
+
+def disable():
+    global _sink
+    sink, _sink = _sink, None
+    if sink is not None:
+        sink.close()
+
+def enabled():
+    return _sink is not None
+
+def span(name, **attrs):
+    """A timed span to use as a context manager; NULL_SPAN while telemetry is off."""
+    sink = _sink
+    if sink is None:
+        return NULL_SPAN
+    return Span(sink, name, attrs)
+
+def current():
+    """The innermost open span on this thread, or NULL_SPAN."""
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else NULL_SPAN
+
+def traced(span, chunks):
+    """Time a stream of text chunks as `span`: time to first chunk, chunk count and bytes."""
+    if not span:
+        return chunks
+    return _traced(span, chunks)
+
+def _traced(span, chunks):
+    with span:
+        count = 0
+        size = 0
+        for chunk in chunks:
+            if not count:
+                span.set(ttft_ms=round((time.perf_counter() - span.start) * 1000, 3))
+            count += 1
+            size += len(chunk.encode("utf-8"))
+            yield chunk
+        span.set(chunks=count, response_bytes=size)
+
+def records(prefix=None):
+    """Spans recorded in this process so far (oldest first), optionally only names starting with `prefix`."""
+    sink = _sink
+    if sink is None:
+        return []
+    with sink.lock:
+        found = list(sink.records)
+    return [r for r in found if prefix is None or r["span"].startswith(prefix)]
+
+def read_records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def _percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(p * len(sorted_values)))]
+
+def summarize(found, by=("span",)):
+    """Rows of count, total, p50, p95 and max ms per group of spans, slowest total first."""
+    groups = defaultdict(list)
+    for record in found:
+        groups[tuple(record.get(key) for key in by)].append(record["ms"])
+    rows = []
+    for group, timings in groups.items():
+        timings.sort()
+        row = dict(zip(by, group))
+        row.update(count=len(timings), total_ms=round(sum(timings), 3), p50_ms=_percentile(timings, 0.5),
+                   p95_ms=_percentile(timings, 0.95), max_ms=timings[-1])
+        rows.append(row)
+    rows.sort(key=lambda row: -row["total_ms"])
+    return rows
+
+def histograms(found, key="agent", bins=10):
+    """Shared bin edges (seconds) and per-`key` counts of span durations, for latency histograms."""
+    timings = defaultdict(list)
+    for record in found:
+        timings[record.get(key, "?")].append(record["ms"] / 1000.0)
+    if not timings:
+        return [], {}
+    low = min(min(values) for values in timings.values())
+    high = max(max(values) for values in timings.values())
+    width = (high - low) / bins or 1.0
+    edges = [low + i * width for i in range(bins + 1)]
+    counts = {}
+    for name, values in timings.items():
+        counts[name] = [0] * bins
+        for value in values:
+            counts[name][min(bins - 1, int((value - low) / width))] += 1
+    return edges, counts
+
+def _enable_from_environment():
+    setting = os.environ.get("MDSIT_TELEMETRY", "")
+    if setting and setting != "0":
+        enable(DEFAULT_TELEMETRY_PATH if setting == "1" else setting)
+
+_enable_from_environment()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise recorded telemetry spans.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    summary = commands.add_parser("summary", help="time per span name, slowest total first")
+    summary.add_argument("path", nargs="?", default=DEFAULT_TELEMETRY_PATH)
+    summary.add_argument("--by", nargs="+", default=["span"], help="attributes to group by (e.g. span agent)")
+    args = parser.parse_args(argv)
+    rows = summarize(read_records(args.path), tuple(args.by))
+    for row in rows:
+        group = " ".join(str(row[key]) for key in args.by)
+        print(f"{group:45} {row['count']:>6}  total {row['total_ms']:>11.1f} ms  p50 {row['p50_ms']:>9.1f}  "
+              f"p95 {row['p95_ms']:>9.1f}  max {row['max_ms']:>9.1f}")
+
+if __name__ == "__main__":
+    main()
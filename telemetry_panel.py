@@ -0,0 +1,45 @@
+"""The Streamlit "📈 Performance" panel shared by both apps."""
+import streamlit as st
+
+import telemetry
+
+# Spans that time one faculty answer, in either app
+AGENT_SPANS = ("agent.call", "agent.run")
+
+def _recording_changed():
+    if st.session_state["performance_panel"]:
+        telemetry.enable()
+    else:
+        telemetry.disable()
+
+def performance_toggle():
+    """Sidebar checkbox that turns recording on and off; returns whether to show the panel
+
+    Recording is process-wide, so only a change to the box turns it on or off:
+    a session that still has the box ticked doesn't restart it on every rerun.
+    """
+    show = st.checkbox(
+        "📈 Performance panel", value=telemetry.enabled(), key="performance_panel", on_change=_recording_changed,
+        help=f"Time every agent call and document write for all sessions, also saved to "
+             f"{telemetry.DEFAULT_TELEMETRY_PATH}. Untick to stop recording."
+    )
+    if show and not telemetry.enabled():
+        st.caption("Recording was stopped from another session; untick and tick to start it again.")
+    return show
+
+def performance_panel(bins=10):
+    """Per-agent latency histograms and a table of where the time went, from this process's spans"""
+    found = telemetry.records()
+    with st.expander("📈 Performance", expanded=True):
+        if not found:
+            st.caption("Nothing recorded yet. Deploy the faculty to see where the time goes.")
+            return
+        calls = [record for record in found if record["span"] in AGENT_SPANS]
+        edges, counts = telemetry.histograms(calls, key="agent", bins=bins)
+        if counts:
+            st.markdown("**Answer latency per agent**")
+            labels = [f"{edges[i]:.1f}-{edges[i + 1]:.1f}s" for i in range(len(edges) - 1)]
+            st.bar_chart({"latency": labels, **counts}, x="latency")
+            st.dataframe(telemetry.summarize(calls, by=("agent", "cache")), hide_index=True)
+        st.markdown("**Time per stage**")
+        st.dataframe(telemetry.summarize(found), hide_index=True)
@@ -0,0 +1,143 @@
+import random
+import sqlite3
+import zipfile
+
+import pytest
+
+from ai_study_agent import StudyAgent, course_for, iter_lecture_files, parse_args, run_batch
+from study_store import SQLiteStore
+
+WORDS = ("stack queue graph tree heap array pointer recursion algorithm sorting hashing complexity Dijkstra BFS "
+         "DFS node edge vertex binary search insertion merge quick bucket radix").split()
+
+def lecture_text(seed, sentences=40):
+    rng = random.Random(seed)
+    return " ".join(" ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 12))).capitalize() + "."
+                    for _ in range(sentences))
+
+@pytest.fixture
+def tree(tmp_path):
+    """Six DSA lectures and one Misc lecture in the <Course>/Week_NN/Lessons layout."""
+    root = tmp_path / "courses"
+    for week in range(1, 7):
+        lessons = root / "DSA" / f"Week_{week:02d}" / "Lessons"
+        lessons.mkdir(parents=True)
+        (lessons / "lecture.txt").write_text(lecture_text(week), encoding="utf-8")
+    lessons = root / "Misc" / "Week_01" / "Lessons"
+    lessons.mkdir(parents=True)
+    (lessons / "intro.md").write_text(lecture_text(99), encoding="utf-8")
+    return root
+
+DSA = [f"DSA_Week_{week:02d}_lecture" for week in range(1, 7)]
+EDITED = "DSA_Week_05_lecture"
+
+def edit_lecture(root):
+    with open(root / "DSA" / "Week_05" / "Lessons" / "lecture.txt", "a", encoding="utf-8") as f:
+        f.write(" " + lecture_text(55))
+
+def batch(root, store, *options):
+    run_batch(parse_args(["--batch", str(root), "--store", f"sqlite:{store}", "--workers", "1", *options]))
+
+def stored(path):
+    with sqlite3.connect(path) as conn:
+        return dict(conn.execute("SELECT lecture_id, notes || quiz FROM lectures"))
+
+def test_lecture_ids_and_courses(tree):
+    lectures = dict(iter_lecture_files(tree))
+    assert sorted(lectures) == DSA + ["Misc_Week_01_intro"]
+    assert course_for("DSA_Week_05_lecture") == "DSA"
+    assert course_for("IT101_Lecture1") is None
+
+def test_incremental_run_matches_full_run_after_editing_a_lecture(tree, tmp_path, capsys):
+    batch(tree, tmp_path / "incremental.db")
+    edit_lecture(tree)
+    batch(tree, tmp_path / "incremental.db", "--incremental", "--out", str(tmp_path / "incremental"))
+    assert "Processed 6 lectures" in capsys.readouterr().out
+    batch(tree, tmp_path / "full.db", "--out", str(tmp_path / "full"))
+
+    assert stored(tmp_path / "incremental.db") == stored(tmp_path / "full.db")
+    # Only the edited course was recomputed, and its pages match the full run's
+    written = sorted(path.name for path in (tmp_path / "incremental").iterdir())
+    assert written == [f"{lecture_id}.html" for lecture_id in DSA]
+    for name in written:
+        assert (tmp_path / "incremental" / name).read_text() == (tmp_path / "full" / name).read_text()
+
+def test_incremental_run_of_an_unchanged_tree_processes_nothing(tree, tmp_path, capsys):
+    batch(tree, tmp_path / "store.db")
+    before = stored(tmp_path / "store.db")
+    batch(tree, tmp_path / "store.db", "--incremental")
+    assert "Processed 0 lectures" in capsys.readouterr().out
+    assert stored(tmp_path / "store.db") == before
+
+def test_results_do_not_depend_on_the_number_of_workers(tree, tmp_path):
+    batch(tree, tmp_path / "one.db")
+    run_batch(parse_args(["--batch", str(tree), "--store", f"sqlite:{tmp_path / 'two.db'}", "--workers", "2",
+                          "--chunksize", "2"]))
+    assert stored(tmp_path / "one.db") == stored(tmp_path / "two.db")
+
+def bundled(path):
+    with zipfile.ZipFile(path) as archive:
+        return sorted(archive.namelist())
+
+def test_incremental_bundle_keeps_every_lecture(tree, tmp_path):
+    bundles = tmp_path / "bundles"
+    batch(tree, tmp_path / "store.db", "--bundle", str(bundles))
+    edit_lecture(tree)
+    (bundles / "Misc.zip").unlink()
+    batch(tree, tmp_path / "store.db", "--incremental", "--bundle", str(bundles))
+
+    assert bundled(bundles / "DSA.zip") == [f"{lecture_id}.html" for lecture_id in DSA]
+    # A course with nothing to recompute gets its missing archive back from the store
+    assert bundled(bundles / "Misc.zip") == ["Misc_Week_01_intro.html"]
+
+def dry_run(root, store, capsys):
+    capsys.readouterr()
+    batch(root, store, "--dry-run")
+    lines = capsys.readouterr().out.splitlines()
+    listed = {}
+    for line in lines[:-1]:
+        status, lecture_id = line.split()
+        listed.setdefault(status, []).append(lecture_id)
+    return listed, lines[-1]
+
+def test_dry_run_lists_exactly_the_changed_lectures(tree, tmp_path, capsys):
+    batch(tree, tmp_path / "store.db")
+    assert dry_run(tree, tmp_path / "store.db", capsys)[0] == {}
+
+    edit_lecture(tree)
+    before = stored(tmp_path / "store.db")
+    listed, summary = dry_run(tree, tmp_path / "store.db", capsys)
+    assert listed == {"changed": [EDITED], "stale": [lecture_id for lecture_id in DSA if lecture_id != EDITED]}
+    assert summary == "Would recompute 6 lectures (0 new, 1 changed, 5 stale from a changed course); 1 unchanged"
+    # A dry run reads the tree but leaves the store alone
+    assert stored(tmp_path / "store.db") == before
+    assert dry_run(tree, tmp_path / "store.db", capsys)[0]["changed"] == [EDITED]
+
+def test_dry_run_reports_new_lectures(tree, tmp_path, capsys):
+    batch(tree, tmp_path / "store.db")
+    lessons = tree / "Misc" / "Week_02" / "Lessons"
+    lessons.mkdir(parents=True)
+    (lessons / "extra.txt").write_text(lecture_text(7), encoding="utf-8")
+    listed, _ = dry_run(tree, tmp_path / "store.db", capsys)
+    assert listed == {"new": ["Misc_Week_02_extra"], "stale": ["Misc_Week_01_intro"]}
+
+def test_plan_report_on_an_empty_store_lists_every_lecture_as_new(tree, tmp_path):
+    agent = StudyAgent(SQLiteStore(str(tmp_path / "store.db")))
+    report = agent.plan_report(iter_lecture_files(tree), workers=1)
+    assert report == {"new": DSA + ["Misc_Week_01_intro"], "changed": [], "stale": [], "unchanged": 0}
+    assert len(agent.store) == 0
+    agent.store.close()
+
+def test_batch_input_must_be_paths():
+    agent = StudyAgent()
+    with pytest.raises(TypeError):
+        agent.process_lectures([("IT101_Week_01_intro", "not a path")], workers=1)
+
+def test_process_lecture_skips_unchanged_text():
+    agent = StudyAgent()
+    text = lecture_text(1)
+    assert agent.process_lecture("IT101_Lecture1", text)
+    assert not agent.process_lecture("IT101_Lecture1", text)
+    assert agent.get_notes("IT101_Lecture1")[0].startswith("- ")
+    assert len(agent.get_quiz("IT101_Lecture1")) == 3
+    assert agent.get_notes("missing") == ["No notes available."]
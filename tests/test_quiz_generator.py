@@ -0,0 +1,72 @@
+import random
+from collections import Counter
+
+from quiz_generator import (BLANK, NUM_OPTIONS, CourseTermIndex, build_term_index, cloze_question, cloze_quiz,
+                            term_counts, term_kind)
+
+COURSE = [
+    "Dijkstra found shortest paths with a priority queue.",
+    "Prim grows a spanning tree from one vertex.",
+    "Kruskal sorts every edge before joining trees.",
+    "Bellman handled negative weights on every edge.",
+    "Floyd compares every pair of vertices.",
+    "Tarjan finds strongly connected components.",
+    "Dijkstra, Prim, Kruskal, Bellman, Floyd and Tarjan all studied graphs.",
+]
+
+def course_index():
+    index = CourseTermIndex()
+    index.add_sentences(COURSE * 2)
+    return index
+
+def test_term_kinds():
+    assert term_kind("Dijkstra", False) == ("Dijkstra", "name")
+    assert term_kind("Dijkstra", True) == ("dijkstra", "word")
+    assert term_kind("BFS", False) == ("BFS", "acronym")
+    assert term_kind("42", False) == ("42", "number")
+    assert term_kind("sorting", False) == ("sorting", "gerund")
+    assert term_kind("with", False) is None
+
+def test_term_counts():
+    counts = term_counts(["Dijkstra met Prim.", "Prim met Dijkstra."])
+    assert counts[("Dijkstra", "name")] == 1 and counts[("dijkstra", "word")] == 1
+    assert counts[("Prim", "name")] == 1
+
+def test_cloze_question_blanks_one_term_and_offers_it():
+    _, question = cloze_question("Kruskal sorts every edge before joining trees, unlike Tarjan.", course_index())
+    assert BLANK in question["question"]
+    assert question["correct"] in question["options"]
+    assert len(question["options"]) == len(set(question["options"])) <= NUM_OPTIONS
+
+def test_distractors_never_appear_in_the_question():
+    index = course_index()
+    sentence = "Dijkstra and Prim both studied graphs, unlike Floyd."
+    for _ in range(3):
+        _, question = cloze_question(sentence, index)
+        wrong = [option for option in question["options"] if option != question["correct"]]
+        assert wrong
+        assert not {option.lower() for option in wrong} & {word.lower().strip(",.") for word in sentence.split()}
+
+def test_distractors_are_of_the_same_kind_and_exclude_stems():
+    index = course_index()
+    options = index.distractors("Dijkstra", "name", 3, random.Random(1), exclude={"prim"})
+    assert options and "Dijkstra" not in options and "Prim" not in options
+    assert all(option[0].isupper() for option in options)
+
+def test_same_sentence_gets_the_same_question():
+    index = course_index()
+    assert cloze_question(COURSE[0], index) == cloze_question(COURSE[0], index)
+
+def test_cloze_quiz_falls_back_to_true_false():
+    quiz = cloze_quiz(["It was fine.", "So it goes."], 2, CourseTermIndex())
+    assert [q["options"] for q in quiz] == [["True", "False"]] * 2
+    assert cloze_quiz(COURSE, 0, course_index()) == []
+
+def test_reprocessing_a_lecture_replaces_its_counts():
+    index = build_term_index([("week1", term_counts(COURSE)), ("week2", term_counts(COURSE[:1]))])
+    total = index.total
+    index.set_lecture("week2", term_counts(COURSE[:1]))
+    assert index.total == total
+    index.set_lecture("week2", Counter())
+    assert dict(index.counts) == term_counts(COURSE)
+    assert index.total == sum(term_counts(COURSE).values())
@@ -0,0 +1,317 @@
+import threading
+
+import pytest
+
+from request_scheduler import (CircuitBreaker, CircuitOpenError, RequestScheduler, TokenBucket, flight_key,
+                               is_retryable, retry_after_of)
+
+class FakeClock:
+    """A monotonic clock that only moves when something sleeps on it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = FakeResponse(headers or {})
+
+def make_scheduler(clock, **kwargs):
+    kwargs.setdefault("requests_per_minute", 6000)
+    kwargs.setdefault("tokens_per_minute", 600000)
+    return RequestScheduler(clock=clock, sleep=clock.sleep, seed=1, **kwargs)
+
+def failing_then(errors, result):
+    """A call that raises each of `errors` in turn and then returns `result`."""
+    errors = list(errors)
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return result
+    return fn, calls
+
+# Token bucket
+
+def test_bucket_admits_burst_then_waits_for_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(60, capacity=2, clock=clock, sleep=clock.sleep)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert clock.now == pytest.approx(1.0)
+
+def test_bucket_queues_callers_in_arrival_order():
+    clock = FakeClock()
+    bucket = TokenBucket(60, capacity=1, clock=clock, sleep=clock.sleep)
+    assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+    assert bucket.reserve(1) == pytest.approx(2.0)
+
+def test_bucket_caps_oversized_requests_at_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(60, capacity=5, clock=clock, sleep=clock.sleep)
+    assert bucket.reserve(5) == 0
+    assert bucket.reserve(50) == pytest.approx(5.0)
+
+def test_bucket_drain_empties_it():
+    clock = FakeClock()
+    bucket = TokenBucket(60, capacity=10, clock=clock, sleep=clock.sleep)
+    bucket.drain()
+    assert bucket.reserve(1) == pytest.approx(1.0)
+
+# Retry and backoff
+
+def test_retryable_errors():
+    assert is_retryable(FakeAPIError(429))
+    assert is_retryable(FakeAPIError(503))
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(FakeAPIError(401))
+    assert not is_retryable(ValueError())
+
+def test_retry_after_headers():
+    assert retry_after_of(FakeAPIError(429, {"retry-after": "3"})) == 3.0
+    assert retry_after_of(FakeAPIError(429, {"retry-after-ms": "250"})) == 0.25
+    assert retry_after_of(FakeAPIError(429)) is None
+
+def test_backoff_is_bounded_full_jitter():
+    scheduler = make_scheduler(FakeClock(), base_delay=1.0, max_delay=4.0)
+    for attempt in range(6):
+        delay = scheduler.backoff(attempt, FakeAPIError(500))
+        assert 0.0 <= delay <= min(4.0, 2 ** attempt)
+
+def test_backoff_honours_retry_after_up_to_max_delay():
+    scheduler = make_scheduler(FakeClock(), base_delay=0.01, max_delay=5.0)
+    assert scheduler.backoff(0, FakeAPIError(429, {"retry-after": "3"})) >= 3.0
+    assert scheduler.backoff(0, FakeAPIError(429, {"retry-after": "60"})) <= 5.0
+
+def test_backoff_is_reproducible_with_a_seed():
+    first = make_scheduler(FakeClock())
+    second = make_scheduler(FakeClock())
+    assert [first.backoff(n, FakeAPIError(500)) for n in range(4)] == \
+        [second.backoff(n, FakeAPIError(500)) for n in range(4)]
+
+def test_call_retries_transient_failures():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    fn, calls = failing_then([FakeAPIError(500), FakeAPIError(429)], "answer")
+    assert scheduler.call(None, fn) == "answer"
+    assert len(calls) == 3
+    stats = scheduler.stats()
+    assert (stats.retries, stats.rate_limited, stats.breaker) == (2, 1, "closed")
+
+def test_call_does_not_retry_client_errors():
+    scheduler = make_scheduler(FakeClock())
+    fn, calls = failing_then([FakeAPIError(401)], "answer")
+    with pytest.raises(FakeAPIError):
+        scheduler.call(None, fn)
+    assert len(calls) == 1
+    assert scheduler.stats().retries == 0
+
+def test_call_gives_up_after_max_retries():
+    scheduler = make_scheduler(FakeClock(), max_retries=2, failure_threshold=10)
+    fn, calls = failing_then([FakeAPIError(503)] * 5, "answer")
+    with pytest.raises(FakeAPIError):
+        scheduler.call(None, fn)
+    assert len(calls) == 3
+
+def test_stream_retries_only_before_the_first_chunk():
+    scheduler = make_scheduler(FakeClock())
+    attempts = []
+
+    def fn():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise FakeAPIError(502)
+        yield "a"
+        raise FakeAPIError(502)
+    chunks = []
+    with pytest.raises(FakeAPIError):
+        for chunk in scheduler.stream(None, fn):
+            chunks.append(chunk)
+    assert chunks == ["a"]
+    assert len(attempts) == 2
+
+# Circuit breaker
+
+def test_breaker_opens_fails_fast_and_half_opens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock.now += 30
+    assert breaker.state == "half-open"
+    breaker.before_call()
+    # Only one trial call at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+def test_failed_trial_reopens_the_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+def test_scheduler_rejects_calls_while_the_breaker_is_open():
+    scheduler = make_scheduler(FakeClock(), failure_threshold=2, max_retries=5)
+    fn, calls = failing_then([FakeAPIError(500)] * 10, "answer")
+    with pytest.raises(FakeAPIError):
+        scheduler.call(None, fn)
+    # The breaker opened after two failures, so the retries stopped there
+    assert len(calls) == 2
+    with pytest.raises(CircuitOpenError):
+        scheduler.call(None, fn)
+    assert len(calls) == 2
+    assert scheduler.stats().rejected == 1
+
+def test_rate_limits_never_open_the_breaker():
+    scheduler = make_scheduler(FakeClock(), failure_threshold=1, max_retries=3)
+    fn, calls = failing_then([FakeAPIError(429)] * 3, "answer")
+    assert scheduler.call(None, fn) == "answer"
+    assert scheduler.stats().breaker == "closed"
+
+def test_client_errors_never_open_the_breaker():
+    scheduler = make_scheduler(FakeClock(), failure_threshold=1)
+    fn, _ = failing_then([FakeAPIError(400)], "answer")
+    with pytest.raises(FakeAPIError):
+        scheduler.call(None, fn)
+    assert scheduler.stats().breaker == "closed"
+
+# Coalescing
+
+def test_flight_key_separates_api_keys():
+    assert flight_key(None, "sk-a") is None
+    assert flight_key("k", "sk-a") == flight_key("k", "sk-a")
+    assert flight_key("k", "sk-a") != flight_key("k", "sk-b")
+    assert "sk-a" not in flight_key("k", "sk-a")
+
+def run_concurrently(scheduler, keys, make_fn, streaming=False):
+    """Start one caller per key while the upstream call is held open; return results in order."""
+    release = threading.Event()
+    started = threading.Event()
+    results = [None] * len(keys)
+    errors = [None] * len(keys)
+
+    def worker(index, key):
+        fn = make_fn(key, release, started)
+        try:
+            if streaming:
+                results[index] = list(scheduler.stream(key, fn))
+            else:
+                results[index] = scheduler.call(key, fn)
+        except Exception as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=worker, args=(0, keys[0]))]
+    threads[0].start()
+    assert started.wait(5)
+    for index, key in enumerate(keys[1:], start=1):
+        threads.append(threading.Thread(target=worker, args=(index, key)))
+        threads[-1].start()
+    # Let every follower join the flight before the leader answers
+    while scheduler.stats().calls < len(keys):
+        release.wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+def test_call_coalesces_identical_requests():
+    scheduler = make_scheduler(FakeClock())
+    upstream = []
+
+    def make_fn(key, release, started):
+        def fn():
+            upstream.append(key)
+            started.set()
+            release.wait(5)
+            return "answer"
+        return fn
+    key = flight_key("topic", "sk-a")
+    results, errors = run_concurrently(scheduler, [key] * 3, make_fn)
+    assert results == ["answer"] * 3
+    assert errors == [None] * 3
+    assert len(upstream) == 1
+    assert scheduler.stats().coalesced == 2
+
+def test_stream_followers_get_every_chunk():
+    scheduler = make_scheduler(FakeClock())
+    upstream = []
+
+    def make_fn(key, release, started):
+        def fn():
+            upstream.append(key)
+            yield "Hello"
+            started.set()
+            release.wait(5)
+            yield " world"
+        return fn
+    key = flight_key("topic", "sk-a")
+    results, errors = run_concurrently(scheduler, [key] * 3, make_fn, streaming=True)
+    assert results == [["Hello", " world"]] * 3
+    assert len(upstream) == 1
+
+def test_followers_share_the_leaders_error():
+    scheduler = make_scheduler(FakeClock())
+
+    def make_fn(key, release, started):
+        def fn():
+            started.set()
+            release.wait(5)
+            raise FakeAPIError(401)
+        return fn
+    key = flight_key("topic", "sk-a")
+    results, errors = run_concurrently(scheduler, [key] * 2, make_fn)
+    assert all(isinstance(e, FakeAPIError) for e in errors)
+
+def test_different_api_keys_never_share_a_request():
+    scheduler = make_scheduler(FakeClock())
+    upstream = []
+
+    def make_fn(key, release, started):
+        def fn():
+            upstream.append(key)
+            started.set()
+            if key.startswith(flight_key("topic", "sk-bad")[:16]):
+                raise FakeAPIError(401)
+            release.wait(5)
+            return "answer"
+        return fn
+    good, bad = flight_key("topic", "sk-good"), flight_key("topic", "sk-bad")
+    results, errors = run_concurrently(scheduler, [good, bad], make_fn)
+    assert results[0] == "answer" and errors[0] is None
+    assert isinstance(errors[1], FakeAPIError)
+    assert len(upstream) == 2
+    assert scheduler.stats().coalesced == 0
+
+def test_finished_requests_are_not_reused():
+    scheduler = make_scheduler(FakeClock())
+    fn, calls = failing_then([], "answer")
+    key = flight_key("topic", "sk-a")
+    assert scheduler.call(key, fn) == "answer"
+    assert scheduler.call(key, fn) == "answer"
+    assert len(calls) == 2
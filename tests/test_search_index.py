@@ -0,0 +1,59 @@
+import pytest
+
+from search_index import SearchIndex, index_report_files, normalize, tokenize
+
+@pytest.fixture
+def index(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.db"))
+    yield index
+    index.close()
+
+LECTURES = [
+    ("DSA_Week_03_recursion", ["- Recursion needs a base case.", "- Each call works on a smaller input."],
+     [{"question": "Fill in the blank: Every _____ needs a base case.", "options": [], "correct": "recursion"}]),
+    ("Networking_Week_01_intro", ["- Routers forward packets between networks."],
+     [{"question": "Is this statement true? Switches learn MAC addresses.", "options": [], "correct": "True"}]),
+]
+
+def test_tokenize_folds_plurals():
+    assert normalize("loops") == "loop" and normalize("class") == "class"
+    assert tokenize("The Web_Development loops") == ["web", "development", "loop"]
+
+def test_search_ranks_matching_lectures(index):
+    index.add_lectures(LECTURES)
+    hits = index.search("base case")
+    assert {hit.doc_id for hit in hits} == {"notes:DSA_Week_03_recursion", "quiz:DSA_Week_03_recursion"}
+    assert all("**base**" in hit.snippet for hit in hits)
+    assert index.search("packet")[0].title == "Networking_Week_01_intro"
+    assert index.search("kubernetes") == []
+
+def test_search_by_kind_and_prefix(index):
+    index.add_lectures(LECTURES)
+    assert [hit.kind for hit in index.search("base", kind="quiz")] == ["quiz"]
+    assert index.search("rout*")[0].doc_id == "notes:Networking_Week_01_intro"
+    assert index.search("base", kind="report") == []
+
+def test_readding_a_document_replaces_it(index):
+    index.add_lectures(LECTURES)
+    index.add_lectures([("DSA_Week_03_recursion", ["- Trees have roots and leaves."], [])])
+    assert index.search("base case", kind="notes") == []
+    assert index.search("leaves")[0].doc_id == "notes:DSA_Week_03_recursion"
+    assert len(index) == 4
+    assert index.compact() == 2
+    assert index.search("leaves")[0].doc_id == "notes:DSA_Week_03_recursion"
+
+def test_reports(index, tmp_path):
+    report = tmp_path / "Professor_Recursion.md"
+    report.write_text("# Professor Report - Recursion\n\nA base case stops the recursion.\n", encoding="utf-8")
+    (tmp_path / "notes.md").write_text("No header here\n", encoding="utf-8")
+    assert index_report_files(index, str(tmp_path)) == 1
+    hit = index.search("base case", kind="report")[0]
+    assert hit.title == "Professor Report - Recursion" and hit.source == str(report)
+    index.remove_report(str(report))
+    assert index.search("base case", kind="report") == []
+
+def test_other_connections_see_new_documents(index):
+    other = SearchIndex(index.path)
+    other.add_lectures(LECTURES)
+    assert index.search("packets")[0].doc_id == "notes:Networking_Week_01_intro"
+    other.close()
@@ -0,0 +1,80 @@
+from collections import Counter
+
+import pytest
+
+from study_store import MemoryStore, SQLiteStore, open_store, store_report
+
+NOTES = ["- Stacks are last in, first out.", "- Queues are first in, first out."]
+QUIZ = [{"question": "Fill in the blank: A _____ is LIFO.", "options": ["stack", "queue", "heap", "tree"],
+         "correct": "stack"}]
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    store = MemoryStore() if request.param == "memory" else SQLiteStore(str(tmp_path / "store.db"))
+    yield store
+    store.close()
+
+def test_put_and_get(store):
+    store.put("DSA_Week_01_intro", NOTES, QUIZ)
+    assert store.get_notes("DSA_Week_01_intro") == NOTES
+    assert store.get_quiz("DSA_Week_01_intro") == QUIZ
+    assert "DSA_Week_01_intro" in store and len(store) == 1
+    assert store.get_notes("missing") is None and store.get_quiz("missing") is None
+    assert "missing" not in store
+
+def test_put_many_replaces_earlier_results(store):
+    store.put_many([("a", NOTES, QUIZ), ("b", NOTES[:1], [])])
+    store.put_many([("a", NOTES[1:], [])])
+    assert store.get_notes("a") == NOTES[1:]
+    assert store.get_quiz("a") == []
+    assert sorted(store.lecture_ids()) == ["a", "b"]
+
+def test_fingerprints(store):
+    assert store.get_fingerprint("a") is None
+    store.set_fingerprints([("a", "hash-1", "10:1"), ("b", "hash-2", None)])
+    store.set_fingerprints([("a", "hash-3", "12:2")])
+    assert store.get_fingerprint("a") == ("hash-3", "12:2")
+    assert store.get_fingerprint("b") == ("hash-2", None)
+
+def test_statistics_round_trip(store):
+    counts = Counter({("stack", "word"): 3, ("LIFO", "acronym"): 1, ("3.5", "number"): 2})
+    store.set_statistics([("a", "hash-1", ["lifo", "stack"], counts)])
+    content_hash, terms, found = store.get_statistics("a")
+    assert (content_hash, terms, found) == ("hash-1", ["lifo", "stack"], counts)
+    assert isinstance(found, Counter)
+    assert store.get_statistics("missing") is None
+
+def test_course_hashes(store):
+    assert store.get_course_hash("DSA") is None
+    store.set_course_hashes([("DSA", "one"), ("Misc", "two")])
+    store.set_course_hashes({"DSA": "three"}.items())
+    assert (store.get_course_hash("DSA"), store.get_course_hash("Misc")) == ("three", "two")
+
+def test_sqlite_store_survives_a_restart(tmp_path):
+    path = str(tmp_path / "store.db")
+    store = SQLiteStore(path)
+    store.put("a", NOTES, QUIZ)
+    store.set_fingerprints([("a", "hash-1", "10:1")])
+    store.set_course_hashes([("DSA", "one")])
+    store.close()
+    store = SQLiteStore(path)
+    assert store.get_quiz("a") == QUIZ
+    assert store.get_fingerprint("a") == ("hash-1", "10:1")
+    assert store.get_course_hash("DSA") == "one"
+    store.close()
+
+def test_open_store(tmp_path):
+    assert isinstance(open_store("memory"), MemoryStore)
+    store = open_store(f"sqlite:{tmp_path / 'store.db'}")
+    assert isinstance(store, SQLiteStore)
+    store.close()
+    with pytest.raises(ValueError):
+        open_store("redis://localhost")
+
+def test_store_report(store):
+    store.put_many((f"lecture_{n}", NOTES, QUIZ) for n in range(5))
+    report = store_report(store)
+    assert report["backend"] == store.backend
+    assert report["lectures"] == 5
+    assert report["memory_bytes"] > 0
+    assert report["lookup_us_p50"] <= report["lookup_us_p95"]
@@ -0,0 +1,65 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from summarizer import (DAMPING, CourseVocabulary, build_vocabulary, document_terms, rank_sentences, sentence_matrix,
+                        textrank_scores, tokenize)
+
+SENTENCES = [
+    "A stack stores items in last in, first out order.",
+    "Push adds an item to the top of the stack.",
+    "Pop removes the item at the top of the stack.",
+    "The weather in Auckland was sunny today.",
+    "A queue stores items in first in, first out order.",
+    "Stacks and queues are both linear data structures.",
+]
+
+def test_tokenize_drops_stopwords():
+    assert tokenize("The stack is a LIFO structure") == ["stack", "lifo", "structure"]
+    assert document_terms(["B tree", "a tree"]) == ["b", "tree"]
+
+def test_short_lectures_are_returned_whole():
+    assert rank_sentences(SENTENCES[:2], 5) == SENTENCES[:2]
+    assert rank_sentences(SENTENCES, 0) == []
+
+def test_rank_sentences_keeps_lecture_order_and_drops_the_outlier():
+    ranked = rank_sentences(SENTENCES, 3)
+    assert len(ranked) == 3
+    assert ranked == [s for s in SENTENCES if s in ranked]
+    assert "The weather in Auckland was sunny today." not in ranked
+
+def test_matrix_rows_are_unit_length():
+    rows, cols, data = sentence_matrix(SENTENCES, CourseVocabulary(), "lecture")
+    norms = np.bincount(rows, weights=data * data, minlength=len(SENTENCES))
+    assert np.allclose(norms, 1.0)
+
+def test_unconnected_sentences_get_only_the_teleport_score():
+    rows, cols, data = sentence_matrix(SENTENCES, CourseVocabulary(), "lecture")
+    scores = textrank_scores(rows, cols, data, len(SENTENCES))
+    outlier = SENTENCES.index("The weather in Auckland was sunny today.")
+    assert scores[outlier] == pytest.approx((1 - DAMPING) / len(SENTENCES))
+    assert scores.argmin() == outlier
+
+def test_reprocessing_a_lecture_replaces_its_document_frequencies():
+    vocabulary = CourseVocabulary()
+    sentence_matrix(SENTENCES, vocabulary, "week1")
+    once = vocabulary.doc_freq.copy(), vocabulary.documents
+    sentence_matrix(SENTENCES, vocabulary, "week1")
+    assert vocabulary.documents == once[1] == 1
+    assert np.array_equal(vocabulary.doc_freq, once[0])
+    sentence_matrix(SENTENCES[:2], vocabulary, "week1")
+    assert vocabulary.doc_freq[vocabulary.index["queue"]] == 0
+
+def test_build_vocabulary_counts_each_lecture_once():
+    vocabulary = build_vocabulary([("a", ["stack", "queue"]), ("b", ["stack"]), ("a", ["stack"])])
+    assert vocabulary.documents == 2
+    assert vocabulary.doc_freq[vocabulary.index["stack"]] == 2
+    assert vocabulary.doc_freq[vocabulary.index["queue"]] == 0
+
+def test_pickled_vocabulary_is_a_frozen_snapshot():
+    vocabulary = build_vocabulary([("a", ["stack"]), ("b", ["stack", "queue"])])
+    copy = pickle.loads(pickle.dumps(vocabulary))
+    assert copy.documents == 2 and copy.lectures is None
+    copy.set_lecture("c", np.array([0]))
+    assert copy.documents == 2
@@ -0,0 +1,292 @@
+"""Pre-generated "topic packs": all four faculty answers for popular topics.
+
+    OPENAI_API_KEY=sk-... python topic_packs.py generate --file topics.txt
+    python topic_packs.py generate "Binary search trees" "AWS IAM basics"
+    OPENAI_API_KEY=sk-... python topic_packs.py generate --app teams
+    python topic_packs.py list
+
+`generate` queues one job per (topic, agent) and runs them on a pool of
+workers through the request scheduler. Each topic whose four answers all
+arrive is stored as a new pack version. The Streamlit apps look packs up by
+normalised topic and serve them straight from the local SQLite file, without
+an API key or network access. Topics that have no pack are generated live.
+
+Each app has its own packs: simple-app packs come from the faculty briefs in
+faculty_prompts.py, teams-app packs from the agents in faculty_team.py (which
+needs agno; set SERPAPI_API_KEY to give the agents their search tool). Packs
+record a fingerprint of the prompts and model that produced them, and an app
+treats a pack whose fingerprint differs from its current one as missing. By
+default `generate` skips topics whose latest pack matches the current
+prompts, so re-running it after a prompt change regenerates only the stale
+packs.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+
+from faculty_prompts import MAX_TOKENS, MODEL, assemble_prompts, count_tokens, message_tokens
+from openai_clients import get_openai_client
+from request_scheduler import RequestScheduler
+
+DEFAULT_PACKS_PATH = os.environ.get("MDSIT_TOPIC_PACKS", os.path.join(".faculty_cache", "topic_packs.sqlite3"))
+DEFAULT_WORKERS = 4
+SIMPLE_APP = "simple"
+TEAMS_APP = "teams"
+APPS = (SIMPLE_APP, TEAMS_APP)
+# Older versions of a topic kept when a new one is stored
+DEFAULT_KEEP_VERSIONS = 3
+TEMPERATURE = 0.7
+# The semester subjects shown in both apps, used when no topics are given
+DEFAULT_TOPICS = (
+    "Data Structures & Algorithms",
+    "Cloud Computing",
+    "Data & Networking",
+    "Cybersecurity",
+    "Python fundamentals",
+    "AWS basics",
+    "Network security",
+)
+
+TopicPack = namedtuple("TopicPack", "app topic version fingerprint model created answers")
+
+def topic_key(topic):
+    """Normalise a topic so "AWS  basics" and "aws basics?" find the same pack."""
+    return " ".join(re.findall(r"[^\W_]+|[+#&]", topic.casefold()))
+
+def prompts_fingerprint():
+    """Hash of everything besides the topic that shapes a simple-app pack's answers."""
+    plan = assemble_prompts("{topic}")
+    payload = json.dumps([MODEL, TEMPERATURE, plan.max_tokens, plan.system, plan.prompts], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+def teams_agents(api_key="", base_url=None):
+    """The teams app's agents as `generate --app teams` runs them (imports agno)."""
+    from faculty_team import build_faculty_agents
+    return build_faculty_agents(api_key, os.environ.get("SERPAPI_API_KEY", ""), base_url=base_url)
+
+def app_fingerprint(app):
+    """The fingerprint `app`'s packs must have to be served."""
+    if app == TEAMS_APP:
+        from faculty_team import team_fingerprint
+        return team_fingerprint(teams_agents())
+    return prompts_fingerprint()
+
+class TopicPacks:
+    """Versioned topic packs in SQLite; safe to share across threads."""
+
+    def __init__(self, path=DEFAULT_PACKS_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS topic_packs (
+                    app TEXT NOT NULL,
+                    topic_key TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    topic TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    answers TEXT NOT NULL,
+                    PRIMARY KEY (app, topic_key, version)
+                )
+            """)
+            # Packs stored before packs were kept per app were all generated from the simple app's prompts
+            if self._conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'packs'").fetchone():
+                self._conn.execute("INSERT OR IGNORE INTO topic_packs SELECT ?, * FROM packs", (SIMPLE_APP,))
+                self._conn.execute("DROP TABLE packs")
+
+    def latest(self, topic, app=SIMPLE_APP, fingerprint=None):
+        """Return the newest TopicPack of `app` for `topic`, or None.
+
+        With a `fingerprint`, only packs generated from those prompts count.
+        """
+        query = ("SELECT app, topic, version, fingerprint, model, created, answers FROM topic_packs "
+                 "WHERE app = ? AND topic_key = ?")
+        params = [app, topic_key(topic)]
+        if fingerprint is not None:
+            query += " AND fingerprint = ?"
+            params.append(fingerprint)
+        with self._lock:
+            row = self._conn.execute(query + " ORDER BY version DESC LIMIT 1", params).fetchone()
+        if row is None:
+            return None
+        return TopicPack(*row[:6], json.loads(row[6]))
+
+    def save(self, topic, answers, fingerprint, app=SIMPLE_APP, model=MODEL, keep=DEFAULT_KEEP_VERSIONS):
+        """Store `answers` (agent name -> text) as the next version of `topic`; returns the version."""
+        key = topic_key(topic)
+        with self._lock, self._conn:
+            version = self._conn.execute(
+                "SELECT COALESCE(MAX(version), 0) + 1 FROM topic_packs WHERE app = ? AND topic_key = ?", (app, key)
+            ).fetchone()[0]
+            self._conn.execute(
+                "INSERT INTO topic_packs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (app, key, version, topic, fingerprint, model, time.time(), json.dumps(answers, ensure_ascii=False))
+            )
+            self._conn.execute("DELETE FROM topic_packs WHERE app = ? AND topic_key = ? AND version <= ?",
+                               (app, key, version - 1 - keep))
+        return version
+
+    def packs(self):
+        """Latest (app, topic, version, fingerprint, created) of every app's topics, alphabetically."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT app, topic, MAX(version), fingerprint, created FROM topic_packs "
+                "GROUP BY app, topic_key ORDER BY app, topic_key"
+            ).fetchall()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM (SELECT DISTINCT app, topic_key FROM topic_packs)"
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def generate_answer(api_key, system, prompt, max_tokens, scheduler, base_url=None):
+    """One faculty answer, sent through the scheduler like the apps' live requests."""
+    messages = [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+
+    def request():
+        response = get_openai_client(api_key, base_url).chat.completions.create(
+            model=MODEL, messages=messages, max_tokens=max_tokens, temperature=TEMPERATURE
+        )
+        return response.choices[0].message.content
+
+    return scheduler.call(None, request, message_tokens(system, prompt) + max_tokens)
+
+def run_team_agent(agent, prompt, scheduler):
+    """One teams-app answer, sent through the scheduler like the app's live requests."""
+    from faculty_team import agent_cache_prompt
+    tokens = count_tokens(agent_cache_prompt(agent, prompt)) + (agent.model.max_tokens or MAX_TOKENS)
+    return scheduler.call(None, lambda: agent.run(prompt, stream=False).content, tokens)
+
+def pack_jobs(app, topic, api_key, scheduler, base_url=None):
+    """{agent name: call returning its answer} for one topic, keyed as `app` looks answers up."""
+    if app == TEAMS_APP:
+        from faculty_team import AGENT_NAMES, team_prompt
+        # Fresh agents per topic, so no agent runs two topics at once
+        agents = teams_agents(api_key, base_url)
+        return {agent_name: partial(run_team_agent, agent, team_prompt(topic), scheduler)
+                for agent_name, agent in zip(AGENT_NAMES, agents)}
+    plan = assemble_prompts(topic)
+    return {agent_name: partial(generate_answer, api_key, plan.system, prompt, plan.max_tokens, scheduler, base_url)
+            for agent_name, prompt in plan.prompts.items()}
+
+def generate_packs(topics, packs, api_key, workers=DEFAULT_WORKERS, force=False, scheduler=None, base_url=None,
+                   keep=DEFAULT_KEEP_VERSIONS, app=SIMPLE_APP):
+    """Generate an `app` pack for every topic that lacks an up-to-date one; returns {topic: version or error}.
+
+    Every (topic, agent) answer is one job on a shared pool of `workers`, so
+    a slow agent holds up only its own topic. A topic is stored only once all
+    four of its answers have arrived.
+    """
+    scheduler = scheduler or RequestScheduler()
+    fingerprint = app_fingerprint(app)
+    outcomes = {}
+    todo = []
+    unique = {}
+    for topic in topics:
+        unique.setdefault(topic_key(topic), topic)
+    for topic in unique.values():
+        current = packs.latest(topic, app)
+        if current is not None and current.fingerprint == fingerprint and not force:
+            outcomes[topic] = f"up to date (v{current.version})"
+        else:
+            todo.append(topic)
+
+    answers = {topic: {} for topic in todo}
+    expected = {}
+    failed = set()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {}
+        for topic in todo:
+            jobs = pack_jobs(app, topic, api_key, scheduler, base_url)
+            expected[topic] = len(jobs)
+            for agent_name, job in jobs.items():
+                futures[executor.submit(job)] = (topic, agent_name)
+        for future in as_completed(futures):
+            topic, agent_name = futures[future]
+            if topic in failed:
+                continue
+            try:
+                answers[topic][agent_name] = future.result()
+            except Exception as e:
+                failed.add(topic)
+                outcomes[topic] = f"failed: {agent_name}: {e}"
+                print(f"{topic}: {agent_name} failed: {e}", file=sys.stderr, flush=True)
+                continue
+            if len(answers[topic]) == expected[topic]:
+                version = packs.save(topic, answers.pop(topic), fingerprint, app, keep=keep)
+                outcomes[topic] = version
+                print(f"{topic}: stored v{version}", file=sys.stderr, flush=True)
+    return outcomes
+
+def read_topics(args):
+    topics = list(args.topics)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            topics += [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+    return topics or list(DEFAULT_TOPICS)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate faculty answers for popular topics.")
+    parser.add_argument("--packs", default=DEFAULT_PACKS_PATH, metavar="PATH", help="topic pack database")
+    commands = parser.add_subparsers(dest="command", required=True)
+    generate = commands.add_parser("generate", help="generate packs for new or stale topics")
+    generate.add_argument("topics", nargs="*", help="topics to generate (default: the semester subjects)")
+    generate.add_argument("--app", choices=APPS, default=SIMPLE_APP,
+                          help="app whose faculty answer (teams needs agno; SERPAPI_API_KEY adds search)")
+    generate.add_argument("--file", help="text file with one topic per line (# starts a comment)")
+    generate.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="requests in flight at once")
+    generate.add_argument("--force", action="store_true", help="regenerate topics that are already up to date")
+    generate.add_argument("--keep", type=int, default=DEFAULT_KEEP_VERSIONS, help="older versions kept per topic")
+    commands.add_parser("list", help="list the stored packs")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    packs = TopicPacks(args.packs)
+    try:
+        if args.command == "list":
+            fingerprints = {}
+            for app, topic, version, pack_fingerprint, created in packs.packs():
+                if app not in fingerprints:
+                    try:
+                        fingerprints[app] = app_fingerprint(app)
+                    except ImportError:
+                        # Without agno the teams app's prompts can't be checked
+                        fingerprints[app] = None
+                stale = "" if fingerprints[app] in (None, pack_fingerprint) else "  (stale prompts)"
+                print(f"{app}  {topic}  v{version}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(created))}{stale}")
+            return
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            sys.exit("Set OPENAI_API_KEY to generate topic packs.")
+        outcomes = generate_packs(read_topics(args), packs, api_key, args.workers, args.force, keep=args.keep,
+                                  app=args.app)
+        for topic, outcome in outcomes.items():
+            print(f"{topic}: " + (f"v{outcome}" if isinstance(outcome, int) else outcome))
+        if any(isinstance(outcome, str) and outcome.startswith("failed") for outcome in outcomes.values()):
+            sys.exit(1)
+    finally:
+        packs.close()
+
+if __name__ == "__main__":
+    main()